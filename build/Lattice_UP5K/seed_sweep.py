@@ -0,0 +1,242 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : seed_sweep.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 19:41:20
+# Last modified : 2026/10/18 19:41:20
+# Project Name  : IIR Filter
+# Module Name   : seed_sweep
+# Description   : Parallel nextpnr seed sweep keeping the best fmax.
+#
+# Additional Comments:
+#   Runs syn_ice40.ys once, then nextpnr-ice40 and icetime for every seed in
+#   a process pool, each seed in its own directory under .seeds. The fmax of
+#   a seed is the one icetime reports for its bitstream. The bitstream and
+#   report of the best seed are kept as IIR_Filter_<seed>.asc and
+#   Timming_Report_<seed>.rpt, the names the Makefile uses, and the others
+#   are deleted. Every seed's result is written to seed_sweep.json.
+#
+#     python seed_sweep.py --seeds 10 107 207 --jobs 8   (make sweep)
+#     python seed_sweep.py --count 64 --no-synth
+#################################################################################
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+SEEDS_DIR = os.path.join(BUILD_DIR, ".seeds")
+PROJ      = "IIR_Filter"
+DEVICE    = "up5k"
+PACKAGE   = "sg48"
+PIN_DEF   = os.path.join(BUILD_DIR, "up5k.pcf")
+SYN_JSON  = os.path.join(BUILD_DIR, PROJ + "_syn.json")
+SUMMARY   = os.path.join(BUILD_DIR, "seed_sweep.json")
+SEEDS     = [10, 107, 207, 307, 407, 507, 607, 707, 807, 907, 1007, 1107]  # the Makefile's
+CLOCK_MHZ = 12  # icetime -c, the target of pre_pack.py
+
+# icetime: "Total path delay: 25.34 ns (39.46 MHz)"
+ICETIME_DELAY = re.compile(r"Total path delay:\s*([0-9.]+)\s*ns\s*\(\s*([0-9.]+)\s*MHz\s*\)")
+
+
+def synthesize():
+    """
+       Function: synthesize
+
+       Definition: Runs syn_ice40.ys, writes IIR_Filter_syn.json.
+    """
+    subprocess.run(["yosys", "-ql", PROJ + "_" + DEVICE + "_syn.log", "syn_ice40.ys"],
+                   cwd=BUILD_DIR, check=True)
+
+
+def parse_icetime(text):
+    """
+       Function: parse_icetime
+
+       Definition: (path delay in ns, fmax in MHz) of an icetime report, None
+         when the report has no timing estimate.
+
+       Args:
+         text: Report or icetime output.
+    """
+    matches = ICETIME_DELAY.findall(text)
+    if (not matches):
+        return None
+    delay, fmax = matches[-1]
+    return float(delay), float(fmax)
+
+
+def run_seed(seed):
+    """
+       Function: run_seed
+
+       Definition: Places and routes IIR_Filter_syn.json with one seed and
+         times the bitstream. Runs in a worker process.
+
+       Args:
+         seed: nextpnr --seed
+    """
+    work_dir = os.path.join(SEEDS_DIR, str(seed))
+    os.makedirs(work_dir, exist_ok=True)
+    asc = os.path.join(work_dir, "%s_%d.asc" % (PROJ, seed))
+    rpt = os.path.join(work_dir, "Timming_Report_%d.rpt" % seed)
+    log = os.path.join(work_dir, "nextpnr.log")
+    result = {"seed": seed, "fmax": None, "delay": None, "asc": asc, "rpt": rpt, "log": log, "error": None}
+
+    pnr = ["nextpnr-ice40", "--" + DEVICE, "--package", PACKAGE, "--json", SYN_JSON,
+           "--pcf", PIN_DEF, "--pcf-allow-unconstrained", "--timing-allow-fail", "--ignore-loops",
+           "--pre-pack", os.path.join(BUILD_DIR, "pre_pack.py"), "--opt-timing",
+           "--seed", str(seed), "--asc", asc]
+    try:
+        with open(log, "w") as f:
+            placed = subprocess.run(pnr, cwd=work_dir, stdout=f, stderr=subprocess.STDOUT)
+        if (placed.returncode != 0 or not os.path.exists(asc)):
+            result["error"] = "nextpnr-ice40 exited with %d" % placed.returncode
+            return result
+        timed = subprocess.run(["icetime", "-d", DEVICE, "-p", PIN_DEF, "-P", PACKAGE, "-c", str(CLOCK_MHZ),
+                                "-mtr", rpt, asc], cwd=work_dir, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, universal_newlines=True)
+    except OSError as e:
+        result["error"] = str(e)
+        return result
+    timing = None
+    if (os.path.exists(rpt)):
+        with open(rpt, "r") as f:
+            timing = parse_icetime(f.read())
+    if (timing is None):
+        timing = parse_icetime(timed.stdout)
+    if (timing is None):
+        result["error"] = "no timing estimate from icetime (exit %d)" % timed.returncode
+        return result
+    result["delay"], result["fmax"] = timing
+    return result
+
+
+def sweep(seeds, jobs=None, progress=None):
+    """
+       Function: sweep
+
+       Definition: Runs every seed across a pool of jobs processes and
+         returns the results, best fmax first, failed seeds last.
+
+       Args:
+         seeds: nextpnr seeds.
+         jobs: Worker processes, None is one per core.
+         progress: Called with each result as it finishes.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_seed, seed) for seed in seeds]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if (progress is not None):
+                progress(result)
+    results.sort(key=lambda r: (r["fmax"] is None, -(r["fmax"] or 0.0), r["seed"]))
+    return results
+
+
+def keep_best(results):
+    """
+       Function: keep_best
+
+       Definition: Moves the best seed's bitstream and report next to the
+         Makefile and deletes the seed directories. Returns the best result,
+         None when no seed was timed.
+
+       Args:
+         results: sweep() results, best first.
+    """
+    best = results[0] if (results and results[0]["fmax"] is not None) else None
+    if (best is not None):
+        for key in ("asc", "rpt"):
+            kept = os.path.join(BUILD_DIR, os.path.basename(best[key]))
+            shutil.move(best[key], kept)
+            best[key] = kept
+    for result in results:
+        if (result is not best):
+            result["asc"] = result["rpt"] = None
+        shutil.rmtree(os.path.dirname(result["log"]), ignore_errors=True)
+        result["log"] = None
+    if (os.path.isdir(SEEDS_DIR) and not os.listdir(SEEDS_DIR)):
+        os.rmdir(SEEDS_DIR)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel nextpnr seed sweep, keeps the best fmax bitstream.")
+    parser.add_argument("--seeds", type=int, nargs="+", default=None, help="seeds (default the Makefile's)")
+    parser.add_argument("--count", type=int, default=None, help="seeds 1 to COUNT instead of --seeds")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default one per core)")
+    parser.add_argument("--no-synth", action="store_true", help="reuse IIR_Filter_syn.json")
+    parser.add_argument("--keep-failed", action="store_true", help="keep the logs of seeds that failed")
+    args = parser.parse_args(argv)
+
+    seeds = list(range(1, args.count + 1)) if (args.count is not None) else (args.seeds or SEEDS)
+    if (not args.no_synth or not os.path.exists(SYN_JSON)):
+        synthesize()
+
+    def progress(result):
+        if (result["fmax"] is not None):
+            print("seed %6d: %7.2f MHz" % (result["seed"], result["fmax"]), flush=True)
+        else:
+            print("seed %6d: failed, %s" % (result["seed"], result["error"]), flush=True)
+
+    results = sweep(seeds, args.jobs, progress)
+    failed_logs = {}
+    if (args.keep_failed):
+        for result in results:
+            if (result["error"] is not None and os.path.exists(result["log"])):
+                kept = os.path.join(BUILD_DIR, "nextpnr_%d.log" % result["seed"])
+                shutil.copy(result["log"], kept)
+                failed_logs[result["seed"]] = kept
+    best = keep_best(results)
+    for result in results:
+        result["log"] = failed_logs.get(result["seed"])
+    with open(SUMMARY, "w") as f:
+        json.dump(results, f, indent=1)
+
+    if (best is None):
+        print("seed_sweep: no seed produced a timed bitstream")
+        return 1
+    print("seed_sweep: best seed %d, %.2f MHz (%.2f ns), %s" % (best["seed"], best["fmax"], best["delay"],
+                                                                os.path.basename(best["asc"])))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
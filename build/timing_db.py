@@ -0,0 +1,586 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : timing_db.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 19:58:36
+# Last modified : 2026/10/18 19:58:36
+# Project Name  : IIR Filter
+# Module Name   : timing_db
+# Description   : SQLite store of timing reports, worst paths and build diffs.
+#
+# Additional Comments:
+#   Anlogic TD .timing reports (IIR_FILTER/IIR_FILTER_phy.timing) and icetime
+#   -mtr reports (Lattice_UP5K/Timming_Report_<seed>.rpt) are parsed a line
+#   at a time, each path is written as soon as its slack line is read. A
+#   build is one report: its summary, its paths (check, endpoint, slack,
+#   arrival, levels) and the points of each path. Cell and net names are
+#   stored once in the names table; a point refers to them by id, and the
+#   index on it lets a pattern query start from the matching names.
+#
+#   icetime only reports the critical path, its endpoint is the last cell
+#   and its slack is the one against --period, when given.
+#
+#     python timing_db.py load timing.db IIR_FILTER/IIR_FILTER_phy.timing --build td_4618
+#     python timing_db.py worst timing.db --through biquad/multiplier_d -n 20
+#     python timing_db.py diff timing.db td_4618 td_4619 --by cell
+#################################################################################
+import os
+import re
+import sys
+import sqlite3
+import argparse
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id            INTEGER PRIMARY KEY,
+    name          TEXT UNIQUE NOT NULL,
+    report        TEXT,
+    tool          TEXT,
+    top           TEXT,
+    device        TEXT,
+    period_ns     REAL,
+    min_period_ns REAL,
+    fmax_mhz      REAL,
+    endpoints     INTEGER,
+    paths         INTEGER,
+    setup_slack   REAL,
+    hold_slack    REAL
+);
+CREATE TABLE IF NOT EXISTS names (
+    id   INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS paths (
+    id         INTEGER PRIMARY KEY,
+    build      INTEGER NOT NULL,
+    clock      TEXT,
+    check_type TEXT NOT NULL,
+    endpoint   INTEGER NOT NULL,
+    startpoint INTEGER,
+    slack      REAL,
+    arrival    REAL,
+    required   REAL,
+    levels     INTEGER
+);
+CREATE TABLE IF NOT EXISTS points (
+    path  INTEGER NOT NULL,
+    seq   INTEGER NOT NULL,
+    cell  INTEGER NOT NULL,
+    pin   TEXT,
+    net   INTEGER,
+    type  TEXT,
+    incr  REAL,
+    PRIMARY KEY (path, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS paths_slack    ON paths (build, check_type, slack);
+CREATE INDEX IF NOT EXISTS paths_endpoint ON paths (build, endpoint);
+CREATE INDEX IF NOT EXISTS points_cell    ON points (cell, path);
+CREATE INDEX IF NOT EXISTS points_net     ON points (net, path);
+"""
+
+BUILD_FIELDS = ("report", "tool", "top", "device", "period_ns", "min_period_ns", "fmax_mhz",
+                "endpoints", "paths", "setup_slack", "hold_slack")
+BATCH = 1000  # paths per executemany
+
+# Anlogic TD
+TD_TOP       = re.compile(r"^Top Model:\s+(\S+)")
+TD_DEVICE    = re.compile(r"^Device:\s+(\S+)")
+TD_CLOCK     = re.compile(r"^Clock = (\S+), period ([0-9.]+)ns")
+TD_COUNTS    = re.compile(r"^(\d+) endpoints analyzed totally, and (\d+) paths analyzed")
+TD_MIN       = re.compile(r"^Minimum period is ([0-9.]+)ns")
+TD_ENDPOINT  = re.compile(r"^Paths for end point (.+) \(\d+ paths\)")
+TD_SLACK     = re.compile(r"^ Slack \((setup|hold) check\)\s+(-?[0-9.]+) ns")
+TD_START     = re.compile(r"^ StartPoint:\s+(\S+)")
+TD_END       = re.compile(r"^ EndPoint:\s+(\S+)")
+TD_NET       = re.compile(r"^ (\S+) \((\S+)\) net \(fanout = \d+\)\s+(-?[0-9.]+)")
+TD_ARRIVAL   = re.compile(r"^ Arrival time\s+(-?[0-9.]+)(?: \((\d+) lvl\))?")
+TD_REQUIRED  = re.compile(r"^ Required time\s+(-?[0-9.]+)")
+TD_PATH_END  = re.compile(r"^ Slack\s+(-?[0-9.]+) ns")
+TD_SUMMARY   = re.compile(r"^Minimal setup slack: (-?[0-9.]+), minimal hold slack: (-?[0-9.]+)")
+TD_FREQUENCY = re.compile(r"^\s+(\S+) \([0-9.]+MHz\)\s+([0-9.]+)ns\s+([0-9.]+)MHz")
+PIN          = re.compile(r"^(.+)\.(\w+(?:\[\d+\])?)$")
+
+# icetime -mtr
+ICE_CELL  = re.compile(r"^\s+(\S+) \((\w+)\) (.+?): ([0-9.]+) ns$")
+ICE_NET   = re.compile(r"^\s+([0-9.]+) ns (\S+)(?: \((.+)\))?$")
+ICE_LVL   = re.compile(r"^Total number of logic levels: (\d+)")
+ICE_DELAY = re.compile(r"Total path delay:\s*([0-9.]+)\s*ns\s*\(\s*([0-9.]+)\s*MHz\s*\)")
+
+
+def split_pin(point):
+    """
+       Function: split_pin
+
+       Definition: (cell, pin) of a TD point name, "inst.b[5]" is
+         ("inst", "b[5]"). Points without a pin are returned whole.
+    """
+    match = PIN.match(point)
+    if (match is None):
+        return point, None
+    return match.group(1), match.group(2)
+
+
+def parse_anlogic(lines, build):
+    """
+       Function: parse_anlogic
+
+       Definition: Yields the paths of an Anlogic TD .timing report, a dict
+         per path with its points. The report summary is written to build.
+
+       Args:
+         lines: Lines of the report, a file works.
+         build: dict receiving the summary fields.
+    """
+    build["tool"] = "anlogic"
+    clock    = None
+    endpoint = None
+    path     = None
+    for line in lines:
+        if (path is not None):
+            match = TD_NET.match(line)
+            if (match is not None):
+                cell, pin = split_pin(match.group(1))
+                path["points"].append((cell, pin, match.group(2), "net", float(match.group(3))))
+                continue
+            match = TD_ARRIVAL.match(line)
+            if (match is not None):
+                path["arrival"] = float(match.group(1))
+                path["levels"]  = int(match.group(2)) if (match.group(2) is not None) else None
+                path["in_table"] = False
+                continue
+            match = TD_REQUIRED.match(line)
+            if (match is not None):
+                path["required"] = float(match.group(1))
+                continue
+            match = TD_PATH_END.match(line)
+            if (match is not None):
+                del path["in_table"]
+                yield path
+                path = None
+                continue
+            match = TD_START.match(line)
+            if (match is not None):
+                path["startpoint"] = split_pin(match.group(1))[0]
+                continue
+            match = TD_END.match(line)
+            if (match is not None):
+                path["endpoint_pin"] = split_pin(match.group(1))[1]
+                continue
+            if (line.startswith(" Point ")):
+                path["in_table"] = True
+                continue
+            if (path["in_table"] and not line.startswith("---")):
+                fields = re.split(r"\s{2,}", line.strip())
+                if (len(fields) >= 3 and fields[0] != "launch clock edge"):
+                    cell, pin = split_pin(fields[0])
+                    try:
+                        path["points"].append((cell, pin, None, fields[1], float(fields[2])))
+                    except ValueError:
+                        pass
+            continue
+
+        match = TD_SLACK.match(line)
+        if (match is not None):
+            path = {"clock": clock, "check": match.group(1), "endpoint": endpoint, "startpoint": None,
+                    "slack": float(match.group(2)), "arrival": None, "required": None, "levels": None,
+                    "points": [], "in_table": False}
+            continue
+        match = TD_ENDPOINT.match(line)
+        if (match is not None):
+            endpoint = match.group(1)
+            continue
+        match = TD_CLOCK.match(line)
+        if (match is not None):
+            clock = match.group(1)
+            build.setdefault("period_ns", float(match.group(2)))
+            continue
+        for regex, fields in ((TD_TOP, ("top",)), (TD_DEVICE, ("device",)),
+                              (TD_COUNTS, ("endpoints", "paths")), (TD_MIN, ("min_period_ns",)),
+                              (TD_SUMMARY, ("setup_slack", "hold_slack"))):
+            match = regex.match(line)
+            if (match is not None):
+                for field, value in zip(fields, match.groups()):
+                    build.setdefault(field, value if (field in ("top", "device")) else float(value))
+                break
+        else:
+            match = TD_FREQUENCY.match(line)
+            if (match is not None):
+                build.setdefault("fmax_mhz", float(match.group(3)))
+
+
+def parse_icetime(lines, build, period_ns=None):
+    """
+       Function: parse_icetime
+
+       Definition: Yields the critical path of an icetime -mtr report. The
+         points are the cells and nets in the order icetime lists them.
+
+       Args:
+         lines: Lines of the report, a file works.
+         build: dict receiving the summary fields.
+         period_ns: Clock period the slack is computed against.
+    """
+    build["tool"] = "icetime"
+    if (period_ns is not None):
+        build["period_ns"] = period_ns
+    points = []
+    levels = None
+    for line in lines:
+        line = line.rstrip("\n")
+        if (line.startswith("Resolvable net names")):
+            # The nets were already seen along the path
+            continue
+        match = ICE_CELL.match(line)
+        if (match is not None):
+            points.append((match.group(1), match.group(3), None, match.group(2), float(match.group(4))))
+            continue
+        match = ICE_NET.match(line)
+        if (match is not None and points and points[-1][2] is None):
+            cell, pin, _, kind, incr = points[-1]
+            points[-1] = (cell, pin, match.group(3) or match.group(2), kind, incr)
+            continue
+        match = ICE_LVL.match(line)
+        if (match is not None):
+            levels = int(match.group(1))
+            continue
+        match = ICE_DELAY.search(line)
+        if (match is not None):
+            delay = float(match.group(1))
+            build["min_period_ns"] = delay
+            build["fmax_mhz"]      = float(match.group(2))
+            build["endpoints"] = build["paths"] = 1
+            slack = None if (period_ns is None) else period_ns - delay
+            build["setup_slack"] = slack
+            if (points):
+                yield {"clock": None, "check": "setup", "endpoint": points[-1][0],
+                       "startpoint": points[0][0], "slack": slack, "arrival": delay,
+                       "required": period_ns, "levels": levels, "points": points}
+            points = []
+
+
+def detect_tool(path):
+    """
+       Function: detect_tool
+
+       Definition: "anlogic" or "icetime" from the first lines of a report.
+    """
+    with open(path, "r") as f:
+        head = "".join(f.readline() for _ in range(8))
+    return "anlogic" if ("Anlogic" in head or "Auto created by the td" in head) else "icetime"
+
+
+class timing_db(object):
+    """
+       Class: Timing Database
+
+       Definition: SQLite file of parsed timing reports, one build per report.
+    """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.name_ids = {}  # name -> names.id cache of the current load
+
+
+    def close(self):
+        self.conn.close()
+
+
+    def name_id(self, name):
+        """
+           Function: name_id
+
+           Definition: Id of a cell or net name, added when new.
+        """
+        if (name is None):
+            return None
+        if (name not in self.name_ids):
+            self.conn.execute("INSERT OR IGNORE INTO names (name) VALUES (?)", (name,))
+            self.name_ids[name] = self.conn.execute("SELECT id FROM names WHERE name = ?", (name,)).fetchone()[0]
+        return self.name_ids[name]
+
+
+    def load(self, report, name=None, tool=None, period_ns=None):
+        """
+           Function: load
+
+           Definition: Parses a report into the build called name, replacing
+             a build of the same name. Returns the number of paths stored.
+
+           Args:
+             report: Path of the .timing or icetime report.
+             name: Build name, the report's file name by default.
+             tool: "anlogic" or "icetime", detected when None.
+             period_ns: icetime target period for the slack.
+        """
+        name = name or os.path.basename(report)
+        tool = tool or detect_tool(report)
+        build = {"report": os.path.abspath(report)}
+        with self.conn:
+            self.delete(name)
+            build_id = self.conn.execute("INSERT INTO builds (name) VALUES (?)", (name,)).lastrowid
+            with open(report, "r") as f:
+                if (tool == "anlogic"):
+                    paths = parse_anlogic(f, build)
+                else:
+                    paths = parse_icetime(f, build, period_ns)
+                count = 0
+                batch = []
+                for path in paths:
+                    batch.append(path)
+                    if (len(batch) >= BATCH):
+                        count += self.insert_paths(build_id, batch)
+                        batch = []
+                count += self.insert_paths(build_id, batch)
+            self.conn.execute("UPDATE builds SET %s WHERE id = ?" % ", ".join(f + " = ?" for f in BUILD_FIELDS),
+                              [build.get(f) for f in BUILD_FIELDS] + [build_id])
+        return count
+
+
+    def insert_paths(self, build_id, paths):
+        points = []
+        for path in paths:
+            path_id = self.conn.execute(
+                "INSERT INTO paths (build, clock, check_type, endpoint, startpoint, slack, arrival, required, levels) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (build_id, path["clock"], path["check"], self.name_id(path["endpoint"]),
+                 self.name_id(path["startpoint"]), path["slack"], path["arrival"], path["required"],
+                 path["levels"])).lastrowid
+            for seq, (cell, pin, net, kind, incr) in enumerate(path["points"]):
+                points.append((path_id, seq, self.name_id(cell), pin, self.name_id(net), kind, incr))
+        self.conn.executemany("INSERT INTO points (path, seq, cell, pin, net, type, incr) "
+                              "VALUES (?, ?, ?, ?, ?, ?, ?)", points)
+        return len(paths)
+
+
+    def delete(self, name):
+        """
+           Function: delete
+
+           Definition: Removes a build and its paths.
+        """
+        row = self.conn.execute("SELECT id FROM builds WHERE name = ?", (name,)).fetchone()
+        if (row is None):
+            return
+        self.conn.execute("DELETE FROM points WHERE path IN (SELECT id FROM paths WHERE build = ?)", row)
+        self.conn.execute("DELETE FROM paths WHERE build = ?", row)
+        self.conn.execute("DELETE FROM builds WHERE id = ?", row)
+
+
+    def builds(self):
+        """
+           Function: builds
+
+           Definition: Summary rows of every build, oldest first.
+        """
+        cursor = self.conn.execute("SELECT name, %s FROM builds ORDER BY id" % ", ".join(BUILD_FIELDS))
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+
+    def build_id(self, name=None):
+        """
+           Function: build_id
+
+           Definition: Id of the named build, the last one loaded when None.
+        """
+        if (name is None):
+            row = self.conn.execute("SELECT id FROM builds ORDER BY id DESC LIMIT 1").fetchone()
+        else:
+            row = self.conn.execute("SELECT id FROM builds WHERE name = ?", (name,)).fetchone()
+        if (row is None):
+            raise KeyError("no build %s in the database" % (name or ""))
+        return row[0]
+
+
+    def worst(self, build=None, through=None, count=20, check="setup"):
+        """
+           Function: worst
+
+           Definition: The count paths of least slack, only those with a cell
+             or net matching through when given.
+
+           Args:
+             build: Build name, the last one loaded when None.
+             through: Name pattern, a substring or a GLOB with * and ?.
+             count: Paths returned.
+             check: "setup" or "hold".
+        """
+        query = ("SELECT p.id, p.slack, p.arrival, p.levels, p.clock, s.name, e.name FROM paths p "
+                 "JOIN names e ON e.id = p.endpoint LEFT JOIN names s ON s.id = p.startpoint "
+                 "WHERE p.build = ? AND p.check_type = ?")
+        args = [self.build_id(build), check]
+        if (through is not None):
+            query += (" AND p.id IN (SELECT t.path FROM points t WHERE t.cell IN (SELECT id FROM names WHERE name GLOB ?)"
+                      " UNION SELECT t.path FROM points t WHERE t.net IN (SELECT id FROM names WHERE name GLOB ?))")
+            args += [glob_pattern(through)] * 2
+        query += " ORDER BY p.slack IS NULL, p.slack, p.arrival DESC LIMIT ?"
+        args.append(count)
+        return [{"path": row[0], "slack": row[1], "arrival": row[2], "levels": row[3], "clock": row[4],
+                 "startpoint": row[5], "endpoint": row[6]} for row in self.conn.execute(query, args)]
+
+
+    def points(self, path_id):
+        """
+           Function: points
+
+           Definition: (cell, pin, net, type, incr) of every point of a path.
+        """
+        return self.conn.execute(
+            "SELECT c.name, t.pin, n.name, t.type, t.incr FROM points t JOIN names c ON c.id = t.cell "
+            "LEFT JOIN names n ON n.id = t.net WHERE t.path = ? ORDER BY t.seq", (path_id,)).fetchall()
+
+
+    def worst_slacks(self, build, by="endpoint", check="setup"):
+        """
+           Function: worst_slacks
+
+           Definition: {name: least slack} of a build per endpoint, or per
+             cell for by="cell".
+        """
+        if (by == "endpoint"):
+            query = ("SELECT n.name, MIN(p.slack) FROM paths p JOIN names n ON n.id = p.endpoint "
+                     "WHERE p.build = ? AND p.check_type = ? GROUP BY p.endpoint")
+        else:
+            query = ("SELECT n.name, MIN(p.slack) FROM paths p JOIN points t ON t.path = p.id "
+                     "JOIN names n ON n.id = t.cell WHERE p.build = ? AND p.check_type = ? GROUP BY t.cell")
+        return dict(self.conn.execute(query, (self.build_id(build), check)))
+
+
+    def diff(self, before, after, by="endpoint", check="setup"):
+        """
+           Function: diff
+
+           Definition: Slack change of every endpoint (or cell) between two
+             builds, the largest losses first. Names found in one build only
+             have None on the other side.
+
+           Args:
+             before: Build name of the reference.
+             after: Build name compared to it.
+             by: "endpoint" or "cell".
+             check: "setup" or "hold".
+        """
+        old = self.worst_slacks(before, by, check)
+        new = self.worst_slacks(after, by, check)
+        rows = []
+        for name in set(old) | set(new):
+            a, b = old.get(name), new.get(name)
+            delta = None if (a is None or b is None) else b - a
+            rows.append({"name": name, "before": a, "after": b, "delta": delta})
+        rows.sort(key=lambda r: (r["delta"] is None, r["delta"] if (r["delta"] is not None) else 0.0, r["name"]))
+        return rows
+
+
+def glob_pattern(pattern):
+    """
+       Function: glob_pattern
+
+       Definition: A substring becomes *substring*, GLOB patterns are kept.
+    """
+    if (any(c in pattern for c in "*?[")):
+        return pattern
+    return "*" + pattern + "*"
+
+
+def format_slack(value):
+    return "%9s" % ("-" if (value is None) else "%.3f" % value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Timing report database.")
+    sub = parser.add_subparsers(dest="command")
+    sub.required = True
+    load = sub.add_parser("load", help="parse a report into a build")
+    load.add_argument("db")
+    load.add_argument("report")
+    load.add_argument("--build", default=None, help="build name (default the report file name)")
+    load.add_argument("--tool", choices=("anlogic", "icetime"), default=None)
+    load.add_argument("--period", type=float, default=None, help="icetime target period in ns")
+    builds = sub.add_parser("builds", help="list the builds")
+    builds.add_argument("db")
+    worst = sub.add_parser("worst", help="paths of least slack")
+    worst.add_argument("db")
+    worst.add_argument("--build", default=None, help="build name (default the last loaded)")
+    worst.add_argument("--through", default=None, help="cell or net name, substring or GLOB")
+    worst.add_argument("-n", type=int, default=20)
+    worst.add_argument("--check", choices=("setup", "hold"), default="setup")
+    worst.add_argument("--points", action="store_true", help="print the points of each path")
+    diff = sub.add_parser("diff", help="slack change between two builds")
+    diff.add_argument("db")
+    diff.add_argument("before")
+    diff.add_argument("after")
+    diff.add_argument("--by", choices=("endpoint", "cell"), default="endpoint")
+    diff.add_argument("-n", type=int, default=20)
+    diff.add_argument("--check", choices=("setup", "hold"), default="setup")
+    args = parser.parse_args(argv)
+
+    db = timing_db(args.db)
+    try:
+        if (args.command == "load"):
+            count = db.load(args.report, args.build, args.tool, args.period)
+            print("timing_db: %d paths from %s" % (count, args.report))
+        elif (args.command == "builds"):
+            for b in db.builds():
+                print("%-24s %-8s fmax %8s MHz  setup slack %s  hold slack %s  %s endpoints %s paths" % (
+                    b["name"], b["tool"], "-" if (b["fmax_mhz"] is None) else "%.3f" % b["fmax_mhz"],
+                    format_slack(b["setup_slack"]), format_slack(b["hold_slack"]), b["endpoints"], b["paths"]))
+        elif (args.command == "worst"):
+            for p in db.worst(args.build, args.through, args.n, args.check):
+                print("%s  %s -> %s  (%s lvl)" % (format_slack(p["slack"]), p["startpoint"], p["endpoint"],
+                                                 "-" if (p["levels"] is None) else p["levels"]))
+                if (args.points):
+                    for cell, pin, net, kind, incr in db.points(p["path"]):
+                        print("      %8.3f  %-8s %s%s%s" % (incr, kind, cell, "" if (pin is None) else "." + pin,
+                                                          "" if (net is None) else " (" + net + ")"))
+        else:
+            summaries = {b["name"]: b for b in db.builds()}
+            for name in (args.before, args.after):
+                if (name not in summaries):
+                    raise KeyError("no build %s in the database" % name)
+            for b in (summaries[args.before], summaries[args.after]):
+                print("%-24s fmax %s MHz  setup slack %s" % (b["name"], "-" if (b["fmax_mhz"] is None) else
+                                                             "%.3f" % b["fmax_mhz"], format_slack(b["setup_slack"])))
+            for r in db.diff(args.before, args.after, args.by, args.check)[:args.n]:
+                print("%s %s %s  %s" % (format_slack(r["before"]), format_slack(r["after"]),
+                                        format_slack(r["delta"]), r["name"]))
+    except KeyError as e:
+        print("timing_db: %s" % e.args[0])
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,14 +33,15 @@
 // File name     : IIR_Filter_TOP.v
 // Author        : Jose R Garcia
 // Created       : 2020/11/04 23:20:43
-// Last modified : 2021/02/14 16:45:06
+// Last modified : 2026/10/18 16:31:19
 // Project Name  : IIR Filter
 // Module Name   : IIR_Filter_TOP
 // Description   : The IIR_Filter_TOP is a wrapper to include the missing signals
 //                 required by the verification agents.
 //
 // Additional Comments:
-//   
+//   With IIR_TRACE_WINDOW defined (make TRACE=window) the waveform dump is
+//   off unless r_trace_on is set, the test bench deposits it for each window.
 /////////////////////////////////////////////////////////////////////////////////
 module IIR_Filter_TOP #(
   // Compile time configurable generic parameters
@@ -122,4 +123,25 @@ assign tga_o = 0;
 assign tgd_o = 0;
 assign tgc_o = 0;   
 
+`ifdef IIR_TRACE_WINDOW
+  ///////////////////////////////////////////////////////////////////////////////
+  // Windowed waveform dump
+  ///////////////////////////////////////////////////////////////////////////////
+  reg               r_trace_on = 1'b0; // Dump enable, driven by trace_window.py
+  reg [8*256-1:0]   r_trace_file;      // +TRACE_VCD=<file>, default window.vcd
+
+  initial begin
+    if (!$value$plusargs("TRACE_VCD=%s", r_trace_file))
+      r_trace_file = "window.vcd";
+    $dumpfile(r_trace_file);
+    $dumpvars(0, IIR_Filter_TOP);
+    $dumpoff;
+  end
+
+  always @(r_trace_on) begin
+    if (r_trace_on) $dumpon;
+    else            $dumpoff;
+  end
+`endif
+
 endmodule
@@ -0,0 +1,172 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : bank_top.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 19:12:33
+# Last modified : 2026/10/18 19:12:33
+# Project Name  : IIR Filter
+# Module Name   : bank_top
+# Description   : Generates IIR_Filter_BANK, N IIR_Filter_TOP on one clock.
+#
+# Additional Comments:
+#   Every port of IIR_Filter_TOP but i_clk and i_reset_sync is repeated per
+#   channel with a ch<k>_ prefix, so each channel gets the agents of a single
+#   filter through channel_bus_map. The port list is read from
+#   IIR_Filter_TOP.v. The file is only rewritten when it changes, make does
+#   not rebuild the model for nothing.
+#
+#     python bank_top.py --channels 8    (make CHANNELS=8 runs this)
+#################################################################################
+import os
+import re
+import sys
+import argparse
+
+SIM_DIR   = os.path.dirname(os.path.abspath(__file__))
+TOP_FILE  = os.path.join(SIM_DIR, "IIR_Filter_TOP.v")
+BANK_FILE = os.path.join(SIM_DIR, "IIR_Filter_BANK.v")
+SHARED    = ("i_clk", "i_reset_sync")
+
+
+def top_ports(path=TOP_FILE):
+    """
+       Function: top_ports
+
+       Definition: (direction, range, name) of each IIR_Filter_TOP port.
+    """
+    with open(path, "r") as f:
+        text = f.read()
+    header = text[text.index("module IIR_Filter_TOP"):text.index(");")]
+    header = header[header.index(")(") + 2:]
+    ports = []
+    for line in header.splitlines():
+        match = re.match(r"^\s*(input|output)\s*(\[[^\]]+\])?\s*(\w+)", line)
+        if (match is not None):
+            ports.append((match.group(1), match.group(2) or "", match.group(3)))
+    return ports
+
+
+def channel_port(name, channel):
+    return name if (name in SHARED) else "ch%d_%s" % (channel, name)
+
+
+def channel_bus_map(bus_map, channel):
+    """
+       Function: channel_bus_map
+
+       Definition: A bus map of iir_filter_top_model (BUS_MAP_INST, ...)
+         moved to one channel of IIR_Filter_BANK.
+    """
+    return {signal: channel_port(port, channel) for signal, port in bus_map.items()}
+
+
+def bank_verilog(channels):
+    """
+       Function: bank_verilog
+
+       Definition: Source of IIR_Filter_BANK with this many channels.
+    """
+    with open(TOP_FILE, "r") as f:
+        license_header = "".join(f.readlines()[:32])
+    ports = top_ports()
+    lines = [license_header.rstrip("\n"),
+             "// File name     : IIR_Filter_BANK.v",
+             "// Author        : Jose R Garcia",
+             "// Project Name  : IIR Filter",
+             "// Module Name   : IIR_Filter_BANK",
+             "// Description   : %d IIR_Filter_TOP channels on one clock." % channels,
+             "//",
+             "// Additional Comments:",
+             "//   Generated by sim/bank_top.py, do not edit.",
+             "/" * 81,
+             "module IIR_Filter_BANK #(",
+             "  parameter integer P_NUM_COEFFICIENTS = 13, // Number of filter coefficient",
+             "  parameter integer P_ADDR_MSB         = 3,  //",
+             "  parameter integer P_DATA_MSB         = 15, //",
+             "  parameter integer P_IS_ANLOGIC       = 0   //",
+             ")("]
+    declarations = ["  input i_clk,        // Main Clock",
+                    "  input i_reset_sync, // Synchronous Reset"]
+    for k in range(channels):
+        declarations.append("  // Channel %d" % k)
+        for direction, bits, name in ports:
+            if (name not in SHARED):
+                declarations.append("  %-6s %-16s %s," % (direction, bits, channel_port(name, k)))
+    declarations[-1] = declarations[-1].rstrip(",")
+    lines.extend(declarations)
+    lines.append(");")
+    for k in range(channels):
+        lines.append("")
+        lines.append("  IIR_Filter_TOP #(")
+        lines.append("    P_NUM_COEFFICIENTS,")
+        lines.append("    P_ADDR_MSB,")
+        lines.append("    P_DATA_MSB,")
+        lines.append("    P_IS_ANLOGIC")
+        lines.append("  ) channel%d (" % k)
+        connections = ["    .%s(%s)" % (name, channel_port(name, k)) for _, _, name in ports]
+        lines.append(",\n".join(connections))
+        lines.append("  );")
+    lines.append("")
+    lines.append("endmodule")
+    return "\n".join(lines) + "\n"
+
+
+def write_bank(channels, path=BANK_FILE):
+    """
+       Function: write_bank
+
+       Definition: Writes IIR_Filter_BANK.v when its contents change and
+         returns its path.
+    """
+    text = bank_verilog(channels)
+    if (os.path.exists(path)):
+        with open(path, "r") as f:
+            if (f.read() == text):
+                return path
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generates IIR_Filter_BANK.v")
+    parser.add_argument("--channels", type=int, required=True)
+    args = parser.parse_args(argv)
+    if (args.channels < 1):
+        parser.error("--channels must be at least 1")
+    print(write_bank(args.channels))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
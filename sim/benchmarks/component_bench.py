@@ -0,0 +1,292 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : component_bench.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 16:51:09
+# Last modified : 2026/10/18 20:14:05
+# Project Name  : IIR Filter
+# Module Name   : component_bench
+# Description   : Throughput of each test bench component in isolation.
+#
+# Additional Comments:
+#   Runs against bench_top.v, a stand-in with the UUT's ports and handshakes
+#   and no filter. The driver and the monitors are measured in simulated
+#   clocks and transactions per wall clock second, the predictor and the
+#   scoreboard, which do not wait on the simulator, in transactions per
+#   second. Results are logged and written as JSON to +BENCH_JSON. Usually
+#   run through run_benchmarks.py, by hand from the sim directory:
+#
+#     make TRACE=off TOPLEVEL=bench_top VERILOG_SOURCES=$PWD/benchmarks/bench_top.v \
+#          MODULE=benchmarks.component_bench PLUSARGS="+BENCH_JSON=bench.json"
+#################################################################################
+import sys
+sys.path.append('externals/Wishbone_Standard_Master/')
+import json
+import time
+import cocotb
+import numpy as np
+from cocotb.clock import Clock
+from cocotb.triggers import ClockCycles, Timer
+from externals.Wishbone_Standard_Master.wb_standard_master_if import *
+from externals.Wishbone_Standard_Master.wb_standard_master_config import *
+from externals.Wishbone_Standard_Master.wb_standard_master_seq import *
+from externals.Wishbone_Standard_Master.wb_standard_master_driver import *
+from externals.Wishbone_Standard_Master.wb_standard_master_monitor import *
+from tb_env_config import *
+from iir_filter_predictor import *
+from scoreboard_stream import *
+from benchmarks.monitor_bench import drive_strobes
+
+BUS_MAP_INST = {"clk_i": "i_clk", "rst_i": "i_reset_sync", "adr_o": "adr_o",
+                "dat_i": "i_master_read_data", "dat_o": "dat_o", "we_o": "we_o",
+                "sel_o": "sel_o", "stb_o": "o_master_read_stb", "ack_i": "i_master_read_ack",
+                "cyc_o": "cyc_o", "stall_i": "stall_i", "tga_o": "tga_o", "tgd_i": "tgd_i",
+                "tgd_o": "tgd_o", "tgc_o": "tgc_o"}
+
+BUS_MAP_READ = dict(BUS_MAP_INST, **{"dat_i": "o_slave_read_data", "stb_o": "i_slave_read_stb",
+                                     "ack_i": "o_slave_read_ack"})
+
+
+class stand_in_port():
+    """
+       Class: Stand-in Sequence Item Port
+
+       Definition: Hands the same item to the driver on every request, the
+         sequencer is not part of the measurement.
+    """
+
+    def __init__(self, item):
+        self.item      = item
+        self.num_items = 0
+
+    async def get(self, tr):
+        self.num_items += 1
+        tr.append(self.item)
+
+    async def get_next_item(self, tr):
+        await self.get(tr)
+
+    def item_done(self):
+        pass
+
+
+class stand_in_phase():
+    """
+       Class: Stand-in Phase
+
+       Definition: Ignores the driver's objections.
+    """
+
+    def raise_objection(self, obj, description=""):
+        pass
+
+    def drop_objection(self, obj, description=""):
+        pass
+
+
+def result(cycles, elapsed, transactions):
+    """
+       Function: result
+
+       Definition: One benchmark entry.
+    """
+    return {"cycles"            : cycles,
+            "wall_time_s"       : elapsed,
+            "clocks_per_s"      : cycles / elapsed if cycles else None,
+            "transactions"      : transactions,
+            "transactions_per_s": transactions / elapsed}
+
+
+async def bench_clocks(dut, cycles):
+    """
+       Function: bench_clocks
+
+       Definition: The simulator and clock alone, the reference of the
+         other clocked benchmarks.
+    """
+    start = time.perf_counter()
+    await ClockCycles(dut.i_clk, cycles)
+    return result(cycles, time.perf_counter() - start, 0)
+
+
+async def bench_driver(dut, vif, cycles, pipelined, burst_size=256):
+    """
+       Function: bench_driver
+
+       Definition: The driver answering the sample read strobe of bench_top.
+
+       Args:
+         dut: bench_top handle.
+         vif: wb_standard_master_if of the sample interface.
+         cycles: Clocks to simulate.
+         pipelined: Driver mode, burst items when True.
+         burst_size: Samples per burst item.
+    """
+    cfg = wb_standard_master_config("bench_drv_cfg_%d" % int(pipelined))
+    cfg.pipelined = pipelined
+    drv = wb_standard_master_driver("bench_drv_%d" % int(pipelined), None)
+    drv.cfg = cfg
+    drv.vif = vif
+    if (pipelined):
+        item = wb_standard_master_burst_seq("bench_burst")
+        item.data = list(range(burst_size))
+    else:
+        item = wb_standard_master_seq("bench_item")
+        item.data_in = 0x1234
+    drv.seq_item_port = stand_in_port(item)
+
+    task = cocotb.fork(drv.run_phase(stand_in_phase()))
+    start = time.perf_counter()
+    await ClockCycles(dut.i_clk, cycles)
+    elapsed = time.perf_counter() - start
+    task.kill()
+    vif.ack_i <= 0
+    vif.stall_i <= 0
+    return result(cycles, elapsed, drv.seq_item_port.num_items * (burst_size if pipelined else 1))
+
+
+async def bench_monitor(dut, vif, cycles, event_driven, pool_size):
+    """
+       Function: bench_monitor
+
+       Definition: The monitor of the output interface, strobed every
+         fourth clock.
+
+       Args:
+         dut: bench_top handle.
+         vif: wb_standard_master_if of the output interface.
+         cycles: Clocks to simulate.
+         event_driven: Monitor mode.
+         pool_size: Transfer pool size, 0 creates sequence items.
+    """
+    cfg = wb_standard_master_config("bench_mon_cfg_%d_%d" % (int(event_driven), pool_size))
+    cfg.event_driven = event_driven
+    cfg.pool_size    = pool_size
+    mon = wb_standard_master_monitor("bench_mon_%d_%d" % (int(event_driven), pool_size), None)
+    mon.cfg = cfg
+    mon.build_phase(None)
+    mon.vif = vif
+    task = cocotb.fork(mon.run_phase(None))
+    start = time.perf_counter()
+    await ClockCycles(dut.i_clk, cycles)
+    elapsed = time.perf_counter() - start
+    task.kill()
+    return result(cycles, elapsed, mon.num_items)
+
+
+def bench_predictor(cfg, num_samples):
+    """
+       Function: bench_predictor
+
+       Definition: num_samples handshakes and reads through the clock
+         model of iir_filter_predictor, two clocks per sample like on a
+         bus that never stalls, model blocks included. Simulation time
+         does not move here, the clocks are given directly.
+    """
+    predictor = iir_filter_predictor("bench_predictor", None)
+    predictor.cfg = cfg
+    predictor.build_phase(None)
+    clock_model = predictor.clock_model
+    values = np.random.randint(0, 1 << (cfg.data_msb + 1), num_samples).tolist()
+    start = time.perf_counter()
+    for step, value in enumerate(values):
+        clock_model.sample(2*step, value)
+        clock_model.read(2*step + 1)
+    predictor.flush()
+    return result(0, time.perf_counter() - start, num_samples)
+
+
+def bench_scoreboard(cfg, num_samples):
+    """
+       Function: bench_scoreboard
+
+       Definition: scoreboard_stream fed matching streams, the expected one a
+         block at a time like the predictor and the observed one per item.
+    """
+    scoreboard = scoreboard_stream("bench_scoreboard", None)
+    scoreboard.cfg = cfg
+    scoreboard.build_phase(None)
+    item = wb_standard_master_seq("bench_output")
+    block = cfg.model_block_size
+    values = np.random.randint(0, 1 << (cfg.data_msb + 1), num_samples).astype(np.uint64)
+    start = time.perf_counter()
+    for first in range(0, num_samples, block):
+        scoreboard.write_expected(values[first:first + block])
+        for value in values[first:first + block].tolist():
+            item.data_in = value
+            scoreboard.write_observed(item)
+    scoreboard.checker.finish()
+    elapsed = time.perf_counter() - start
+    if (scoreboard.checker.num_mismatches != 0):
+        raise AssertionError("scoreboard benchmark streams mismatched")
+    return result(0, elapsed, num_samples)
+
+
+@cocotb.test()
+async def component_bench(dut):
+    """ Test bench components throughput against bench_top """
+
+    cycles  = int(cocotb.plusargs.get("BENCH_CYCLES", 100000))
+    samples = int(cocotb.plusargs.get("BENCH_SAMPLES", 200000))
+    vif      = wb_standard_master_if(dut, BUS_MAP_INST)
+    vif_read = wb_standard_master_if(dut, BUS_MAP_READ)
+
+    cocotb.fork(Clock(dut.i_clk, 1, units="ns").start())
+    vif.ack_i      <= 0
+    vif.stall_i    <= 0
+    vif_read.stb_o <= 0
+    vif.rst_i      <= 1
+    await Timer(10, "NS")
+    vif.rst_i      <= 0
+
+    results = {}
+    results["clock"]               = await bench_clocks(dut, cycles)
+    results["driver"]              = await bench_driver(dut, vif, cycles, False)
+    results["driver_pipelined"]    = await bench_driver(dut, vif, cycles, True)
+    strobes = cocotb.fork(drive_strobes(vif_read, 4))
+    results["monitor"]             = await bench_monitor(dut, vif_read, cycles, False, 0)
+    results["monitor_event"]       = await bench_monitor(dut, vif_read, cycles, True, 0)
+    results["monitor_event_pool"]  = await bench_monitor(dut, vif_read, cycles, True, 64)
+    strobes.kill()
+
+    cfg = tb_env_config("bench_env_cfg")
+    cfg.summary_interval = 0
+    results["predictor"]  = bench_predictor(cfg, samples)
+    results["scoreboard"] = bench_scoreboard(cfg, samples)
+
+    for name, r in results.items():
+        dut._log.info("%-20s : %12s clocks/s %12.0f transactions/s" % (
+            name, "-" if r["clocks_per_s"] is None else "%.0f" % r["clocks_per_s"], r["transactions_per_s"]))
+    if ("BENCH_JSON" in cocotb.plusargs):
+        with open(cocotb.plusargs["BENCH_JSON"], "w") as f:
+            json.dump(results, f, indent=1)
@@ -0,0 +1,152 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : monitor_bench.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 12:20:44
+# Last modified : 2026/10/18 12:20:44
+# Project Name  : IIR Filter
+# Module Name   : monitor_bench
+# Description   : Wishbone monitor simulation speed benchmark.
+#
+# Additional Comments:
+#   Runs the same stimulus with no monitor, the per clock monitor and the
+#   event driven monitor and logs the simulated clocks per wall clock second.
+#   From the sim directory:
+#
+#     make MODULE=benchmarks.monitor_bench PLUSARGS="+BENCH_CYCLES=200000 +BENCH_PERIOD=16"
+#
+#   BENCH_PERIOD is the number of clocks between read strobes.
+#################################################################################
+import sys
+sys.path.append('externals/Wishbone_Standard_Master/')
+import time
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import ClockCycles, RisingEdge, Timer
+from externals.Wishbone_Standard_Master.wb_standard_master_if import *
+from externals.Wishbone_Standard_Master.wb_standard_master_config import *
+from externals.Wishbone_Standard_Master.wb_standard_master_monitor import *
+
+
+async def drive_strobes(vif, period):
+    """
+       Function: drive_strobes
+
+       Definition: Pulses the read strobe for one clock every period clocks.
+
+       Args:
+         vif: wb_standard_master_if of the read interface.
+         period: Clocks between strobes.
+    """
+    while True:
+        await RisingEdge(vif.clk_i)
+        vif.stb_o <= 1
+        await RisingEdge(vif.clk_i)
+        vif.stb_o <= 0
+        await ClockCycles(vif.clk_i, period - 1)
+
+
+async def measure(dut, vif, cycles, event_driven=None):
+    """
+       Function: measure
+
+       Definition: Simulates cycles clocks and returns the clocks per wall
+         clock second and the transactions captured.
+
+       Args:
+         dut: IIR_Filter_TOP handle.
+         vif: wb_standard_master_if of the read interface.
+         cycles: Clocks to simulate.
+         event_driven: None runs without a monitor, otherwise the monitor mode.
+    """
+    task = None
+    mon  = None
+    if (event_driven is not None):
+        cfg = wb_standard_master_config("bench_cfg")
+        cfg.event_driven = event_driven
+        mon = wb_standard_master_monitor("bench_mon_" + str(int(event_driven)), None)
+        mon.cfg = cfg
+        mon.build_phase(None)
+        mon.vif = vif
+        task = cocotb.fork(mon.run_phase(None))
+
+    start = time.perf_counter()
+    await ClockCycles(dut.i_clk, cycles)
+    elapsed = time.perf_counter() - start
+
+    if (task is not None):
+        task.kill()
+    return cycles / elapsed, (mon.num_items if mon is not None else 0)
+
+
+@cocotb.test()
+async def monitor_bench(dut):
+    """ Wishbone monitor clocks per second, per clock vs event driven """
+
+    cycles = int(cocotb.plusargs.get("BENCH_CYCLES", 100000))
+    period = int(cocotb.plusargs.get("BENCH_PERIOD", 16))
+
+    bus_map_read = {"clk_i": "i_clk",
+                    "rst_i": "i_reset_sync",
+                    "adr_o": "adr_o",
+                    "dat_i": "o_slave_read_data",
+                    "dat_o": "dat_o",
+                    "we_o": "we_o",
+                    "sel_o": "sel_o",
+                    "stb_o": "i_slave_read_stb",
+                    "ack_i": "o_slave_read_ack",
+                    "cyc_o": "cyc_o",
+                    "stall_i": "stall_i",
+                    "tga_o": "tga_o",
+                    "tgd_i": "tgd_i",
+                    "tgd_o": "tgd_o",
+                    "tgc_o": "tgc_o"}
+    vif = wb_standard_master_if(dut, bus_map_read)
+
+    cocotb.fork(Clock(dut.i_clk, 1, units="ns").start())
+    vif.stb_o <= 0
+    vif.rst_i <= 1
+    await Timer(330, "NS")
+    vif.rst_i <= 0
+    cocotb.fork(drive_strobes(vif, period))
+
+    results = {}
+    for name, mode in (("no monitor", None), ("every clock", False), ("event driven", True)):
+        results[name] = await measure(dut, vif, cycles, mode)
+        dut._log.info("%-12s : %10.0f clocks/s, %d transactions" % (name, results[name][0], results[name][1]))
+
+    base = results["no monitor"][0]
+    dut._log.info("Event driven monitor speed up: %.2fx (monitor overhead %.1f%% -> %.1f%%)" % (
+        results["event driven"][0] / results["every clock"][0],
+        100.0 * (base / results["every clock"][0] - 1.0),
+        100.0 * (base / results["event driven"][0] - 1.0)))
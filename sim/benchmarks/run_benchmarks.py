@@ -0,0 +1,178 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : run_benchmarks.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 17:02:26
+# Last modified : 2026/10/18 17:02:26
+# Project Name  : IIR Filter
+# Module Name   : run_benchmarks
+# Description   : Runs the test bench benchmarks and tracks their results.
+#
+# Additional Comments:
+#   Runs component_bench against bench_top.v and the full test bench (top.py
+#   on IIR_Filter_TOP), both built with TRACE=off, and writes one JSON file
+#   with the clocks and transactions per second of each. With --baseline the
+#   results are compared against an earlier file and any rate that dropped
+#   by more than --tolerance makes the script fail.
+#
+#     python benchmarks/run_benchmarks.py --out bench.json --baseline last.json
+#################################################################################
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import platform
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SIM_DIR   = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, SIM_DIR)
+from regression import parse_results
+
+RATES = ("clocks_per_s", "transactions_per_s")
+
+
+def run_make(args, work_dir, plusargs, sim):
+    """
+       Function: run_make
+
+       Definition: One make run of the sim directory, built in work_dir.
+         Returns (returncode, wall_time_s, sim_time_ns).
+    """
+    results = os.path.join(work_dir, "results.xml")
+    command = ["make", "-C", SIM_DIR, "SIM=" + sim, "TRACE=off",
+               "SIM_BUILD=" + os.path.join(work_dir, "sim_build"),
+               "COCOTB_RESULTS_FILE=" + results, "PLUSARGS=" + " ".join(plusargs)] + args
+    os.makedirs(work_dir, exist_ok=True)
+    # Build first so the wall time only covers the simulation.
+    with open(os.path.join(work_dir, "build.log"), "w") as log:
+        target = os.path.join(work_dir, "sim_build", "Vtop" if sim == "verilator" else "sim.vvp")
+        subprocess.call(command + [target], stdout=log, stderr=subprocess.STDOUT)
+    start = time.time()
+    with open(os.path.join(work_dir, "sim.log"), "w") as log:
+        returncode = subprocess.call(command, stdout=log, stderr=subprocess.STDOUT)
+    wall_time = time.time() - start
+    passed, testcases, sim_time_ns = parse_results(results)
+    return returncode if passed else (returncode or 1), wall_time, sim_time_ns
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "-C", SIM_DIR, "rev-parse", "HEAD"], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True).stdout.strip()
+    except OSError:
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """
+       Function: compare
+
+       Definition: Names of the rates that dropped by more than tolerance,
+         as (benchmark, rate, old, new).
+    """
+    regressions = []
+    for name, entry in results["benchmarks"].items():
+        old = baseline.get("benchmarks", {}).get(name)
+        if (old is None):
+            continue
+        for rate in RATES:
+            if (entry.get(rate) and old.get(rate) and entry[rate] < old[rate] * (1.0 - tolerance)):
+                regressions.append((name, rate, old[rate], entry[rate]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the test bench throughput.")
+    parser.add_argument("--sim", default=os.environ.get("SIM", "verilator"))
+    parser.add_argument("--cycles", type=int, default=100000, help="clocks per clocked component benchmark")
+    parser.add_argument("--samples", type=int, default=200000, help="samples per predictor/scoreboard benchmark")
+    parser.add_argument("--work", default=os.path.join(SIM_DIR, "benchmarks", "work"))
+    parser.add_argument("--out", default="benchmarks.json")
+    parser.add_argument("--baseline", default=None, help="earlier output to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative drop")
+    args = parser.parse_args(argv)
+
+    work = os.path.abspath(args.work)
+    components_path = os.path.join(work, "components.json")
+    if (os.path.exists(components_path)):
+        os.remove(components_path)
+    returncode, wall_time, _ = run_make(
+        ["TOPLEVEL=bench_top", "VERILOG_SOURCES=" + os.path.join(BENCH_DIR, "bench_top.v"),
+         "MODULE=benchmarks.component_bench"],
+        os.path.join(work, "components"),
+        ["+BENCH_JSON=" + components_path, "+BENCH_CYCLES=%d" % args.cycles,
+         "+BENCH_SAMPLES=%d" % args.samples], args.sim)
+    if (not os.path.exists(components_path)):
+        print("run_benchmarks: component benchmark failed, see %s" % os.path.join(work, "components"))
+        return 1
+    with open(components_path, "r") as f:
+        benchmarks = json.load(f)
+
+    returncode, wall_time, sim_time_ns = run_make(["MODULE=top"], os.path.join(work, "top"), [], args.sim)
+    cycles = int(sim_time_ns)  # 1 ns clock, see top.py
+    benchmarks["top"] = {"cycles"            : cycles,
+                         "wall_time_s"       : wall_time,
+                         "clocks_per_s"      : cycles / wall_time if cycles else None,
+                         "transactions"      : None,
+                         "transactions_per_s": None,
+                         "passed"            : returncode == 0}
+
+    results = {"timestamp" : time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "commit"    : git_commit(),
+               "host"      : socket.gethostname(),
+               "python"    : platform.python_version(),
+               "sim"       : args.sim,
+               "benchmarks": benchmarks}
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=1)
+
+    for name, entry in benchmarks.items():
+        print("%-20s %14s clocks/s %14s transactions/s" % (name,
+            "-" if not entry["clocks_per_s"] else "%.0f" % entry["clocks_per_s"],
+            "-" if not entry["transactions_per_s"] else "%.0f" % entry["transactions_per_s"]))
+
+    if (args.baseline is not None):
+        with open(args.baseline, "r") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for name, rate, old, new in regressions:
+            print("REGRESSION %s %s: %.0f -> %.0f (%.0f%%)" % (name, rate, old, new, 100.0 * (new / old - 1.0)))
+        if (regressions):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : build_cache.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 16:02:51
+# Last modified : 2026/10/18 21:11:26
+# Project Name  : IIR Filter
+# Module Name   : build_cache
+# Description   : Content addressed cache of compiled simulation models.
+#
+# Additional Comments:
+#   The key is the SHA-256 of the RTL sources, the top level, the parameter
+#   overrides, the compile flags, the TRACE and CHECKPOINT modes, the number
+#   of CHANNELS and the simulator and cocotb versions. A hit
+#   copies the cached build into SIM_BUILD with fresh timestamps so make
+#   sees it up to date; a miss runs the build target of the cocotb makefiles
+#   and stores the result. Entries are evicted least recently used first
+#   once the cache exceeds its size limit.
+#
+#   The Makefile is read without running make, its ifeq/ifneq blocks are
+#   evaluated for SIM and the TRACE, CHECKPOINT and CHANNELS of the
+#   environment, and computing a key writes nothing.
+#
+#     python build_cache.py --sim-build sim_build   (make cached does this)
+#     python build_cache.py --key                   (make CHECKPOINT=on does this)
+#
+#   Cache location and size: $IIR_BUILD_CACHE (default sim/.build_cache) and
+#   $IIR_BUILD_CACHE_SIZE in bytes (default 4 GiB).
+#################################################################################
+import os
+import re
+import sys
+import json
+import time
+import fcntl
+import shutil
+import hashlib
+import argparse
+import subprocess
+from bank_top import BANK_FILE, bank_verilog
+
+SIM_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR  = os.path.join(SIM_DIR, ".build_cache")
+DEFAULT_CACHE_SIZE = 4 << 30
+
+# Build target of the cocotb makefiles, relative to SIM_BUILD
+BUILD_TARGETS = {"verilator": "Vtop", "icarus": "sim.vvp"}
+
+
+def expand(text, variables):
+    """
+       Function: expand
+
+       Definition: Replaces the $(NAME) references of text by their values,
+         unknown names by nothing as make does.
+    """
+    return re.sub(r"\$\(([A-Z_]+)\)", lambda m: variables.get(m.group(1), ""), text)
+
+
+def makefile_variables(path=os.path.join(SIM_DIR, "Makefile"), overrides=None, environ=os.environ):
+    """
+       Function: makefile_variables
+
+       Definition: Reads the assignments of the sim Makefile the way make
+         does. ifeq/ifneq blocks are evaluated, += lines are appended and ?=
+         takes the environment first. $(shell pwd) is replaced by the sim
+         directory, other $(shell) calls are left unexpanded, so nothing is
+         run.
+
+       Args:
+         path: Makefile.
+         overrides: Command line variables, they win over every assignment.
+         environ: Environment, seen by ?= assignments.
+    """
+    overrides = dict(overrides or {})
+    variables = dict(overrides)
+    active    = []  # one flag per open ifeq/ifneq, whether its branch is taken
+    with open(path, "r") as f:
+        for line in f:
+            line = line.split("#", 1)[0].rstrip()
+            match = re.match(r"^\s*(ifeq|ifneq)\s*\((.*),(.*)\)\s*$", line)
+            if (match is not None):
+                kind, a, b = match.groups()
+                equal = (expand(a, variables).strip() == expand(b, variables).strip())
+                active.append(equal == (kind == "ifeq"))
+                continue
+            if (re.match(r"^\s*else\s*$", line)):
+                active[-1] = not active[-1]
+                continue
+            if (re.match(r"^\s*endif\s*$", line)):
+                active.pop()
+                continue
+            if (not all(active)):
+                continue
+            match = re.match(r"^\s*([A-Z_]+)\s*(\+?=|\?=|:=)\s*(.*)$", line)
+            if (match is None):
+                continue
+            name, op, value = match.groups()
+            if (name in overrides):
+                continue
+            value = value.replace("$(shell pwd)", SIM_DIR).strip()
+            if (op == "+=" and name in variables):
+                variables[name] = variables[name] + " " + value
+            elif (op == "?="):
+                variables.setdefault(name, environ.get(name, value))
+            else:
+                variables[name] = value
+    return variables
+
+
+def strip_makefile_args(value, makefile_value):
+    """
+       Function: strip_makefile_args
+
+       Definition: Removes the flags the Makefile appended to a variable
+         given to make, so only the caller's own flags are left.
+    """
+    args, makefile_args = value.split(), makefile_value.split()
+    if (makefile_args and args[-len(makefile_args):] == makefile_args):
+        args = args[:-len(makefile_args)]
+    return " ".join(args)
+
+
+def tool_version(command):
+    """
+       Function: tool_version
+
+       Definition: First line printed by command, "unknown" if it fails.
+    """
+    try:
+        out = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                             universal_newlines=True, timeout=30).stdout
+        return out.strip().splitlines()[0] if out.strip() else "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+def build_key(sim="verilator", extra_args="", compile_args="", overrides=None):
+    """
+       Function: build_key
+
+       Definition: SHA-256 of everything the compiled model depends on.
+         Nothing is written, IIR_Filter_BANK.v is hashed from the text
+         bank_top would write.
+
+       Args:
+         sim: SIM of the cocotb makefiles.
+         extra_args: EXTRA_ARGS given on top of the Makefile's, the
+           parameter overrides of regression.py go here.
+         compile_args: COMPILE_ARGS.
+         overrides: Command line variables of make, see makefile_variables.
+    """
+    variables = makefile_variables(overrides=dict(overrides or {}, SIM=sim))
+    digest = hashlib.sha256()
+    channels = int(variables.get("CHANNELS", "1"))
+    sources = [s for s in variables["VERILOG_SOURCES"].split() if "$(" not in s]
+    for source in sources:
+        path = source if os.path.isabs(source) else os.path.join(SIM_DIR, source)
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    if (channels > 1):
+        digest.update(os.path.basename(BANK_FILE).encode() + b"\0")
+        digest.update(hashlib.sha256(bank_verilog(channels).encode()).digest())
+    tools = {"verilator": ["verilator", "--version"], "icarus": ["iverilog", "-V"]}
+    description = {"sim"          : sim,
+                   "toplevel"     : variables.get("TOPLEVEL"),
+                   "channels"     : channels,
+                   "trace"        : variables.get("TRACE"),
+                   "checkpoint"   : variables.get("CHECKPOINT"),
+                   "makefile_args": variables.get("EXTRA_ARGS", ""),
+                   "makefile_compile_args": variables.get("COMPILE_ARGS", ""),
+                   "extra_args"   : " ".join(extra_args.split()),
+                   "compile_args" : " ".join(compile_args.split()),
+                   "simulator"    : tool_version(tools.get(sim, [sim, "--version"])),
+                   "cocotb"       : tool_version(["cocotb-config", "--version"])}
+    digest.update(json.dumps(description, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def directory_size(path):
+    """
+       Function: directory_size
+
+       Definition: Bytes used by the files under path.
+    """
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def touch_tree(path, now):
+    """
+       Function: touch_tree
+
+       Definition: Gives every file under path the same modification time.
+    """
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            os.utime(os.path.join(root, name), (now, now))
+
+
+class build_cache():
+    """
+       Class: Build Cache
+
+       Definition: Directory of compiled models, one subdirectory per key.
+    """
+
+    def __init__(self, path=None, max_bytes=None):
+        """
+           Function: new
+
+           Definition: Opens (creates) the cache.
+
+           Args:
+             path: Cache directory, default $IIR_BUILD_CACHE or sim/.build_cache.
+             max_bytes: Size limit, default $IIR_BUILD_CACHE_SIZE or 4 GiB.
+        """
+        self.path      = path or os.environ.get("IIR_BUILD_CACHE", DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes or int(os.environ.get("IIR_BUILD_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+        os.makedirs(self.path, exist_ok=True)
+
+
+    def entry(self, key):
+        return os.path.join(self.path, key)
+
+
+    def lock(self, key):
+        """
+           Function: lock
+
+           Definition: Exclusive lock of one key, so jobs with the same key
+             build once and the others wait for the entry.
+        """
+        f = open(os.path.join(self.path, key + ".lock"), "w")
+        fcntl.flock(f, fcntl.LOCK_EX)
+        return f
+
+
+    def try_lock(self, key):
+        """
+           Function: try_lock
+
+           Definition: Lock of one key without waiting, None when another job
+             holds it.
+        """
+        f = open(os.path.join(self.path, key + ".lock"), "w")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            return None
+        return f
+
+
+    def restore(self, key, sim_build):
+        """
+           Function: restore
+
+           Definition: Copies the entry into sim_build. Returns False on a
+             miss. Call with the lock of key held, evict skips locked entries.
+        """
+        entry = self.entry(key)
+        if (not os.path.isdir(entry)):
+            return False
+        if (os.path.exists(sim_build)):
+            shutil.rmtree(sim_build)
+        shutil.copytree(os.path.join(entry, "build"), sim_build, symlinks=True)
+        now = time.time()
+        touch_tree(sim_build, now)
+        os.utime(entry, (now, now))  # last use, for LRU
+        return True
+
+
+    def store(self, key, sim_build, description=None):
+        """
+           Function: store
+
+           Definition: Adds sim_build as the entry of key and evicts old
+             entries if the cache got too large.
+        """
+        entry = self.entry(key)
+        if (os.path.isdir(entry)):
+            return
+        tmp = entry + ".tmp%d" % os.getpid()
+        shutil.copytree(sim_build, os.path.join(tmp, "build"), symlinks=True)
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump({"key": key, "created": time.time(), "size": directory_size(tmp),
+                       "description": description or {}}, f, indent=1)
+        os.rename(tmp, entry)
+        self.evict()
+
+
+    def evict(self):
+        """
+           Function: evict
+
+           Definition: Removes least recently used entries until the cache
+             fits max_bytes. The newest entry is always kept, and so is every
+             entry whose lock another job holds to restore or store it.
+        """
+        entries = []
+        for name in os.listdir(self.path):
+            path = os.path.join(self.path, name)
+            meta = os.path.join(path, "meta.json")
+            if (os.path.isdir(path) and os.path.exists(meta)):
+                with open(meta, "r") as f:
+                    size = json.load(f)["size"]
+                entries.append((os.path.getmtime(path), size, path))
+        entries.sort()
+        total = sum(e[1] for e in entries)
+        for last_used, size, path in entries[:-1]:
+            if (total <= self.max_bytes):
+                break
+            lock = self.try_lock(os.path.basename(path))
+            if (lock is None):
+                continue
+            with lock:
+                # Restored or replaced while waiting for the lock.
+                if (os.path.isdir(path) and os.path.getmtime(path) == last_used):
+                    shutil.rmtree(path, ignore_errors=True)
+                    total -= size
+
+
+    def prepare(self, sim_build, sim="verilator", extra_args="", compile_args="", log=None):
+        """
+           Function: prepare
+
+           Definition: Makes sim_build hold a compiled model for the given
+             arguments, from the cache or by building and storing it.
+             Returns (key, hit). Raises CalledProcessError if the build fails.
+
+           Args:
+             sim_build: SIM_BUILD directory to fill.
+             sim: SIM of the cocotb makefiles.
+             extra_args: EXTRA_ARGS on top of the Makefile's.
+             compile_args: COMPILE_ARGS.
+             log: File object receiving the build output.
+        """
+        sim_build = os.path.abspath(sim_build)
+        key = build_key(sim, extra_args, compile_args)
+        with self.lock(key):
+            if (self.restore(key, sim_build)):
+                return key, True
+            env = dict(os.environ)
+            env["EXTRA_ARGS"]   = extra_args
+            env["COMPILE_ARGS"] = compile_args
+            target = os.path.join(sim_build, BUILD_TARGETS.get(sim, "Vtop"))
+            subprocess.run(["make", "-C", SIM_DIR, "SIM=" + sim, "SIM_BUILD=" + sim_build, target],
+                           stdout=log, stderr=subprocess.STDOUT if log else None, env=env, check=True)
+            self.store(key, sim_build, {"sim": sim, "extra_args": extra_args,
+                                        "compile_args": compile_args})
+        return key, False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Restore or build the compiled simulation model.")
+    parser.add_argument("--sim", default=os.environ.get("SIM", "verilator"))
+    parser.add_argument("--sim-build", default=os.environ.get("SIM_BUILD", "sim_build"))
+    parser.add_argument("--cache", default=None, help="cache directory")
+    parser.add_argument("--max-bytes", type=int, default=None, help="cache size limit")
+    parser.add_argument("--key", action="store_true", help="print the build key and exit")
+    parser.add_argument("--variable", action="append", default=[], metavar="NAME=VALUE",
+                        help="make command line variable, e.g. TRACE=off")
+    parser.add_argument("--extra-args", default=os.environ.get("EXTRA_ARGS", ""))
+    parser.add_argument("--compile-args", default=os.environ.get("COMPILE_ARGS", ""))
+    args = parser.parse_args(argv)
+
+    # Under make EXTRA_ARGS and COMPILE_ARGS already carry the Makefile's own flags.
+    overrides = dict(v.split("=", 1) for v in args.variable)
+    variables = makefile_variables(overrides=dict(overrides, SIM=args.sim))
+    extra_args = strip_makefile_args(args.extra_args, variables.get("EXTRA_ARGS", ""))
+    compile_args = strip_makefile_args(args.compile_args, variables.get("COMPILE_ARGS", ""))
+
+    if (args.key):
+        print(build_key(args.sim, extra_args, compile_args, overrides))
+        return 0
+
+    cache = build_cache(args.cache, args.max_bytes)
+    key, hit = cache.prepare(args.sim_build, args.sim, extra_args, compile_args)
+    print("build_cache: %s %s" % ("hit" if hit else "stored", key[:16]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : checkpoint.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 18:58:14
+# Last modified : 2026/10/18 21:11:26
+# Project Name  : IIR Filter
+# Module Name   : checkpoint
+# Description   : Register snapshots of the UUT after reset and coefficient load.
+#
+# Additional Comments:
+#   The cocotb Verilator main does not expose Verilator's save/restore, so a
+#   checkpoint is the value of every register (r_* name) under the top level,
+#   read and deposited through VPI. The IIR Filter holds all of its state in
+#   those registers, depositing them after one reset clock gives the state
+#   the full reset and the coefficient writes would have left.
+#
+#   Checkpoints are JSON files in +CHECKPOINT_DIR named by the SHA-256 of the
+#   compiled model, the parameters and the coefficient words. The key of the
+#   compiled model is build_cache.build_key, computed by make and passed as
+#   +BUILD_KEY, so the simulation runs no tools to find it. Verilator only
+#   lets VPI write internal registers when built with --public-flat-rw, make
+#   CHECKPOINT=on adds both.
+#################################################################################
+import os
+import json
+import hashlib
+from cocotb.handle import HierarchyObject, HierarchyArrayObject, NonHierarchyIndexableObject, ModifiableObject
+
+
+def checkpoint_key(build, num_coefficients, data_msb, coefficients, channel_coefficients=()):
+    """
+       Function: checkpoint_key
+
+       Definition: SHA-256 of what the state after the coefficient load
+         depends on.
+
+       Args:
+         build: Key of the compiled model, +BUILD_KEY.
+         num_coefficients: P_NUM_COEFFICIENTS
+         data_msb: P_DATA_MSB
+         coefficients: Words written at start.
+         channel_coefficients: Words of IIR_Filter_BANK channels 1 and up,
+           None for a channel left unwritten.
+    """
+    description = {"build"       : build,
+                   "parameters"  : [num_coefficients, data_msb],
+                   "coefficients": [int(c) for c in coefficients]}
+    if (channel_coefficients):
+        description["channel_coefficients"] = [None if (words is None) else [int(c) for c in words]
+                                               for words in channel_coefficients]
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+def registers(handle):
+    """
+       Function: registers
+
+       Definition: Yields every register under handle, scalars, vectors and
+         register arrays. Window trace controls are left out.
+    """
+    for child in handle:
+        if (isinstance(child, (HierarchyObject, HierarchyArrayObject))):
+            yield from registers(child)
+        elif (child._name.startswith("r_") and not child._name.startswith("r_trace")):
+            yield child
+
+
+def snapshot_registers(handle):
+    """
+       Function: snapshot_registers
+
+       Definition: {path: value} of the registers under handle, a list of
+         values for arrays. Unresolved (X/Z) values are left out.
+    """
+    state = {}
+    for register in registers(handle):
+        if (type(register) is NonHierarchyIndexableObject):
+            values = [element.value for element in register]
+            if (all(v.is_resolvable for v in values)):
+                state[register._path] = [v.integer for v in values]
+        elif (isinstance(register, ModifiableObject) and register.value.is_resolvable):
+            state[register._path] = register.value.integer
+    return state
+
+
+def restore_registers(handle, state):
+    """
+       Function: restore_registers
+
+       Definition: Deposits a snapshot. Call right after a rising edge with
+         the reset released, the registers take the values before the next
+         edge. Returns the number of registers written.
+    """
+    count = 0
+    for register in registers(handle):
+        value = state.get(register._path)
+        if (value is None):
+            continue
+        if (isinstance(value, list)):
+            for element, v in zip(register, value):
+                element <= v
+        else:
+            register <= value
+        count = count + 1
+    return count
+
+
+def load_checkpoint(directory, key):
+    """
+       Function: load_checkpoint
+
+       Definition: The snapshot stored under key, None if there is none.
+    """
+    path = os.path.join(directory, key + ".json")
+    if (not os.path.exists(path)):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_checkpoint(directory, key, state):
+    """
+       Function: save_checkpoint
+
+       Definition: Stores a snapshot under key. Written to a temporary file
+         and renamed, parallel runs never see half a checkpoint.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, key + ".json")
+    tmp  = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
@@ -0,0 +1,373 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : coefficient_designer.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 14:52:17
+# Last modified : 2026/10/18 20:31:12
+# Project Name  : IIR Filter
+# Module Name   : coefficient_designer
+# Description   : Filter design, quantization and coefficient write list.
+#
+# Additional Comments:
+#   Designs coefficients for what IIR_Filter computes, not for the filter of
+#   octave/coefficients_ex.m, which it cannot realize:
+#
+#   - BiQuad[i] reads r_coefficients[i] through r_coefficients[i+3], so the
+#     feedback multipliers of one BiQuad are the output multipliers of the
+#     one before it and the sections cannot be set independently.
+#   - Products keep product[P_DATA_MSB:0] without a shift, so coefficients
+#     are integers. An integer feedback coefficient other than 0 makes a
+#     pole on or outside the unit circle, and no integer choice of the
+#     overlapping words cancels them, so every feedback word must be 0.
+#
+#   With r_coefficients[0] through r_coefficients[L_NUM_BIQUADS+1] at 0 the
+#   filter is FIR. Each sample is held SAMPLE_CLOCKS clocks and one output is
+#   read per sample, and per sample two words are left as clean taps:
+#
+#     y[k] = c[N-1] x[k] + c[L_NUM_BIQUADS+2] x[k-1]
+#
+#   (the direct multiplier, and multiplier_d of the last BiQuad; the other
+#   output multipliers add the same sample twice). design_taps fits h0 +
+#   h1 z^-1 to the magnitude of the spec in least squares, and the taps are
+#   quantized to frac_bits fractional bits. With no shift in the RTL the
+#   output carries a gain of 2^frac_bits, so the input needs that many bits
+#   of headroom (see headroom.py). frac_bits None picks the smallest number
+#   of bits whose quantized response is within tolerance of the fit, and
+#   every design is run through iir_filter_model before it is returned.
+#   Two taps cannot follow a band pass spec closely: the fit error against
+#   the spec is checked against spec_tolerance, a warning (or ValueError
+#   with strict) names the limitation when it is over.
+#
+#   Designs are cached on disk as JSON, keyed by the SHA-256 of the spec, the
+#   widths and the tolerance, so scipy is only needed the first time.
+#################################################################################
+import os
+import json
+import hashlib
+import warnings
+import numpy as np
+from iir_filter_model import iir_filter_model, to_signed, to_unsigned
+
+try:
+    import scipy.signal as signal
+except ImportError:
+    signal = None
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".coefficient_cache")
+
+# octave/coefficients_ex.m: butter(3, [62/sf2, 5800/sf2]) at 48 kHz
+DEFAULT_SPEC = {"ftype": "butter", "btype": "bandpass", "order": 3,
+                "band": [62.0, 5800.0], "fs": 48000.0}
+
+# Largest quantization error, over the peak of the fitted response
+DEFAULT_TOLERANCE = 0.01
+
+# Largest error of the fit against the spec, over the peak of the spec
+DEFAULT_SPEC_TOLERANCE = 0.1
+
+NUM_POINTS = 512  # frequency grid, 0 to fs/2
+
+
+def spec_response(spec, num_points=NUM_POINTS):
+    """
+       Function: spec_response
+
+       Definition: Returns the frequency grid (rad/sample) and the complex
+         response of spec on it.
+
+       Args:
+         spec: dict with ftype, btype, order, band (Hz) and fs (Hz), passed
+           to scipy.signal.iirfilter. Optional rp/rs for ripple designs.
+         num_points: Points of the grid.
+    """
+    if (signal is None):
+        raise ImportError("scipy is required to design coefficients, pip install scipy "
+                          "(cached designs load without it)")
+    b, a = signal.iirfilter(spec["order"], spec["band"], rp=spec.get("rp"), rs=spec.get("rs"),
+                            btype=spec["btype"], ftype=spec["ftype"], output="ba", fs=spec["fs"])
+    w, h = signal.freqz(b, a, worN=num_points)
+    return w, h
+
+
+def tap_response(taps, w):
+    """
+       Function: tap_response
+
+       Definition: Magnitude of h0 + h1 z^-1 on the grid w.
+    """
+    return np.abs(taps[0] + taps[1] * np.exp(-1j * w))
+
+
+def design_taps(spec, num_points=NUM_POINTS):
+    """
+       Function: design_taps
+
+       Definition: Returns the (h0, h1) of h0 + h1 z^-1 whose magnitude is
+         the least squares fit of the magnitude of spec. |H|^2 = p + q cos w
+         is fitted to |H_spec|^2, then h0 + h1 = sqrt(p + q) and h0 - h1 =
+         sqrt(p - q), each clamped at 0.
+
+       Args:
+         spec: Filter spec, see spec_response.
+         num_points: Points of the grid.
+    """
+    w, h = spec_response(spec, num_points)
+    basis = np.stack([np.ones_like(w), np.cos(w)], axis=1)
+    p, q = np.linalg.lstsq(basis, np.abs(h)**2, rcond=None)[0]
+    total = np.sqrt(max(p + q, 0.0))
+    difference = np.sqrt(max(p - q, 0.0))
+    return (float((total + difference) / 2), float((total - difference) / 2))
+
+
+def tap_addresses(num_coefficients=13):
+    """
+       Function: tap_addresses
+
+       Definition: Addresses of h0 and h1, the direct multiplier and
+         multiplier_d of the last BiQuad.
+    """
+    num_biquads = (num_coefficients - 1) // 4  # L_NUM_BIQUADS
+    if (num_biquads < 1):
+        raise ValueError("P_NUM_COEFFICIENTS=%d has no BiQuad" % num_coefficients)
+    return (num_coefficients - 1, num_biquads + 2)
+
+
+def quantize(taps, data_msb=15, frac_bits=8, num_coefficients=13):
+    """
+       Function: quantize
+
+       Definition: Rounds the taps to frac_bits fractional bits and returns
+         the P_DATA_MSB+1 bit two's complement words, by address. Every
+         other word, the feedback ones included, is 0.
+
+       Args:
+         taps: (h0, h1) from design_taps.
+         data_msb: P_DATA_MSB of the RTL.
+         frac_bits: Fractional bits of the taps.
+         num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+    """
+    words = np.zeros(num_coefficients, dtype=np.int64)
+    for address, tap in zip(tap_addresses(num_coefficients), taps):
+        words[address] = int(round(tap * (1 << frac_bits)))
+    low, high = -(1 << data_msb), (1 << data_msb) - 1
+    bad = np.flatnonzero((words < low) | (words > high))
+    if (bad.size > 0):
+        raise ValueError("Coefficients %s do not fit %d bits with %d fractional bits" %
+                         (bad.tolist(), data_msb + 1, frac_bits))
+    return [int(w) for w in to_unsigned(words, data_msb)]
+
+
+def realized_taps(words, data_msb=15, num_coefficients=13, length=8):
+    """
+       Function: realized_taps
+
+       Definition: Per sample impulse response of words, from the bit exact
+         model with each sample held as the RTL holds it, starting at the
+         first tap that is not 0.
+
+       Args:
+         words: Coefficient words by address.
+         data_msb: P_DATA_MSB of the RTL.
+         num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+         length: Samples after the impulse.
+    """
+    model = iir_filter_model(num_coefficients, data_msb)
+    model.load_coefficients(words)
+    impulse = np.zeros(2 * length, dtype=np.uint64)
+    impulse[length // 2] = 1
+    response = to_signed(model.process_stream(impulse), data_msb).astype(np.float64)
+    nonzero = np.flatnonzero(response)
+    return response[nonzero[0]:] if nonzero.size else response
+
+
+def validate(words, taps, frac_bits, data_msb=15, num_coefficients=13, tolerance=DEFAULT_TOLERANCE,
+             num_points=NUM_POINTS):
+    """
+       Function: validate
+
+       Definition: Runs words through the model and returns the largest
+         error of the realized magnitude response, scaled by 2^-frac_bits,
+         against the fit of taps, over the peak of the fit. Raises
+         ValueError when it is over tolerance.
+
+       Args:
+         words: Coefficient words by address.
+         taps: (h0, h1) the words were quantized from.
+         frac_bits: Fractional bits of the words.
+         data_msb: P_DATA_MSB of the RTL.
+         num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+         tolerance: Largest error over the peak of the fit.
+         num_points: Points of the grid.
+    """
+    w = np.linspace(0.0, np.pi, num_points, endpoint=False)
+    realized = realized_taps(words, data_msb, num_coefficients) / (1 << frac_bits)
+    response = np.abs(np.polyval(realized[::-1], np.exp(-1j * w)))
+    fit = tap_response(taps, w)
+    error = float(np.max(np.abs(response - fit)) / max(np.max(fit), 1e-12))
+    if (error > tolerance):
+        raise ValueError("Quantized response is %0.4f off the fit with %d fractional bits, tolerance %0.4f" %
+                         (error, frac_bits, tolerance))
+    return error
+
+
+def choose_frac_bits(taps, data_msb=15, num_coefficients=13, tolerance=DEFAULT_TOLERANCE):
+    """
+       Function: choose_frac_bits
+
+       Definition: Smallest frac_bits whose quantized taps pass validate,
+         so the input keeps the most headroom.
+    """
+    for frac_bits in range(data_msb):
+        try:
+            validate(quantize(taps, data_msb, frac_bits, num_coefficients), taps, frac_bits,
+                     data_msb, num_coefficients, tolerance)
+            return frac_bits
+        except ValueError:
+            continue
+    raise ValueError("No frac_bits below %d quantizes %s within %0.4f" % (data_msb, taps, tolerance))
+
+
+def coefficient_writes(words):
+    """
+       Function: coefficient_writes
+
+       Definition: Returns the (address, data) writes that load words.
+
+       Args:
+         words: Coefficient words by address.
+    """
+    return list(enumerate(words))
+
+
+def cache_key(spec, data_msb, frac_bits, num_coefficients, tolerance=DEFAULT_TOLERANCE):
+    """
+       Function: cache_key
+
+       Definition: SHA-256 of everything that determines a design.
+    """
+    text = json.dumps({"version": CACHE_VERSION, "spec": spec, "data_msb": data_msb,
+                       "frac_bits": frac_bits, "num_coefficients": num_coefficients,
+                       "tolerance": tolerance}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def check_spec_error(spec_error, spec_tolerance=DEFAULT_SPEC_TOLERANCE, num_coefficients=13, strict=False):
+    """
+       Function: check_spec_error
+
+       Definition: Warns, or raises ValueError with strict, when the fit is
+         further than spec_tolerance from the spec. The message states the
+         2 tap FIR the RTL realizes, see the comments at the top.
+
+       Args:
+         spec_error: Largest error of the fit over the peak of the spec.
+         spec_tolerance: Largest error accepted.
+         num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+         strict: Raise instead of warning.
+    """
+    if (spec_error <= spec_tolerance):
+        return
+    direct, last = tap_addresses(num_coefficients)
+    message = ("Design is %0.4f off the spec (tolerance %0.4f): IIR_Filter only realizes the 2 tap FIR "
+               "y[k] = c[%d] x[k] + c[%d] x[k-1], its feedback words must be 0" %
+               (spec_error, spec_tolerance, direct, last))
+    if (strict):
+        raise ValueError(message)
+    warnings.warn(message, stacklevel=3)
+
+
+def design_coefficients(spec=DEFAULT_SPEC, data_msb=15, frac_bits=None, num_coefficients=13,
+                        cache_dir=None, tolerance=DEFAULT_TOLERANCE,
+                        spec_tolerance=DEFAULT_SPEC_TOLERANCE, strict=False):
+    """
+       Function: design_coefficients
+
+       Definition: Returns the coefficient words of spec by address, from the
+         disk cache when the same design was done before.
+
+       Args:
+         spec: Filter spec, see spec_response.
+         data_msb: P_DATA_MSB of the RTL.
+         frac_bits: Fractional bits of the taps, None for the smallest that
+           is within tolerance.
+         num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+         cache_dir: Cache directory, defaults to $IIR_COEFFICIENT_CACHE or
+           sim/.coefficient_cache. Empty string disables the cache.
+         tolerance: Largest quantization error over the peak of the fit.
+         spec_tolerance: Largest fit error over the peak of the spec, see
+           check_spec_error.
+         strict: Raise ValueError instead of warning past spec_tolerance.
+    """
+    if (cache_dir is None):
+        cache_dir = os.environ.get("IIR_COEFFICIENT_CACHE", DEFAULT_CACHE_DIR)
+    key  = cache_key(spec, data_msb, frac_bits, num_coefficients, tolerance)
+    path = os.path.join(cache_dir, key + ".json") if cache_dir else None
+
+    if (path is not None and os.path.exists(path)):
+        with open(path, "r") as f:
+            design = json.load(f)
+        check_spec_error(design["spec_error"], spec_tolerance, num_coefficients, strict)
+        return design["words"]
+
+    taps = design_taps(spec)
+    if (frac_bits is None):
+        frac_bits = choose_frac_bits(taps, data_msb, num_coefficients, tolerance)
+    words = quantize(taps, data_msb, frac_bits, num_coefficients)
+    quantization_error = validate(words, taps, frac_bits, data_msb, num_coefficients, tolerance)
+    w, h = spec_response(spec)
+    spec_error = float(np.max(np.abs(tap_response(taps, w) - np.abs(h))) / np.max(np.abs(h)))
+    check_spec_error(spec_error, spec_tolerance, num_coefficients, strict)
+
+    if (path is not None):
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"spec": spec, "data_msb": data_msb, "frac_bits": frac_bits,
+                       "num_coefficients": num_coefficients, "taps": taps,
+                       "quantization_error": quantization_error, "spec_error": spec_error,
+                       "words": words}, f, indent=1)
+        os.replace(path + ".tmp", path)
+    return words
+
+
+if __name__ == "__main__":
+    taps = design_taps(DEFAULT_SPEC)
+    frac_bits = choose_frac_bits(taps)
+    words = design_coefficients(frac_bits=frac_bits)
+    w, h = spec_response(DEFAULT_SPEC)
+    print("h0 %0.6f, h1 %0.6f, %d fractional bits" % (taps[0], taps[1], frac_bits))
+    print("Quantization error %0.4f, fit error against the spec %0.4f (of the peak)" % (
+        validate(words, taps, frac_bits),
+        np.max(np.abs(tap_response(taps, w) - np.abs(h))) / np.max(np.abs(h))))
+    for address, data in coefficient_writes(words):
+        print("COEFFICIENT[%d] = 0x%04x" % (address, data))
@@ -33,7 +33,7 @@
 # File name     : wb_standard_master_agent.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/09 21:43:54
-# Last modified : 2021/01/10 11:40:42
+# Last modified : 2026/10/18 13:35:06
 # Project Name  : UVM-Python Verification Library
 # Module Name   : wb_standard_master_agent
 # Description   : Wishbone Bus Master Verification Component Agent.
@@ -89,11 +89,13 @@ class wb_standard_master_agent(UVMAgent):
         
         if (self.cfg.has_driver == 1):
             self.drv = wb_standard_master_driver.type_id.create("drv", self)
+            self.drv.cfg = self.cfg
             # self.sqr = wb_standard_master_agent_sequencer.type_id.create("sqr", self)
             self.sqr = UVMSequencer.type_id.create("sqr", self)
        
         if (self.cfg.has_monitor == 1):
             self.mon = wb_standard_master_monitor.type_id.create("mon", self)
+            self.mon.cfg = self.cfg
 
 
     def connect_phase(self, phase):
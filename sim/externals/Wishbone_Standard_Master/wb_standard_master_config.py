@@ -33,7 +33,7 @@
 # File name     : wb_standard_master_config.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/22 10:13:34
-# Last modified : 2021/01/10 11:40:46
+# Last modified : 2026/10/18 21:24:37
 # Project Name  : UVM-Python Verification Library
 # Module Name   : wb_standard_master_config
 # Description   : Wishbone Bus Master Agent configuration object.
@@ -67,6 +67,13 @@ class wb_standard_master_config(UVMObject):
         self.vif              = None # wb_standard_master_if
         self.has_driver       = None
         self.has_monitor      = None
+        self.event_driven     = False # monitor sleeps until stb_o rises instead of every clock
+        self.pool_size        = 0     # monitor recycles compact transfers, 0 creates sequence items
+        self.summary_interval = 1000  # transactions between monitor summaries, 0 off
+        self.pipelined        = False # driver answers bursts, one transfer per clock while stb_o is high
+        self.initiator        = False # driver drives stb_o/adr_o and writes items instead of answering
+        self.write_cycles     = 2     # clocks per write in initiator mode, the UUT's ack toggle period
+        self.reader           = False # driver holds stb_o high for the reads of each item, see read_burst
 
 
     def build_phase(self, phase):
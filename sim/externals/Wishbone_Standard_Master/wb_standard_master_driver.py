@@ -33,13 +33,29 @@
 # File name     : wb_standard_master_driver.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/22 12:45:43
-# Last modified : 2021/01/10 11:40:49
+# Last modified : 2026/10/18 21:24:37
 # Project Name  : UVM-Python Verification Library
 # Module Name   : wb_standard_master_driver
 # Description   : Wishbone Bus Interface Driver.
 #
 # Additional Comments:
 #   This driver drives the signals to respond to a WB Master.
+#
+#   With cfg.pipelined the driver takes whole bursts from the sequencer,
+#   holds one objection per burst and acknowledges one transfer on every
+#   clock that stb_o is high (Wishbone pipelined mode). Each burst starts
+#   with transmit_delay clocks of stall_i.
+#
+#   With cfg.initiator the driver starts the transfers itself: it holds
+#   stb_o high and presents a new address/data pair every cfg.write_cycles
+#   clocks. The data is driven on dat_i, the same signal the responder modes
+#   use, see the bus maps in top.py.
+#
+#   With cfg.reader the driver reads from a slave: it holds stb_o high until
+#   one read per entry of each item was acknowledged and never drives the
+#   read data (wb_standard_master_protocol.read_burst). Reads go on for as
+#   long as the sequence sends items and raise no objection, the test ends
+#   when the stimulus does.
 ##################################################################################################
 import cocotb
 from cocotb.triggers import *
@@ -51,6 +67,7 @@ from uvm.macros import uvm_component_utils, uvm_info
 
 from wb_standard_master_seq import *
 from wb_standard_master_if import *
+from wb_standard_master_protocol import *
 
 class wb_standard_master_driver(UVMDriver):
     """         
@@ -101,6 +118,15 @@ class wb_standard_master_driver(UVMDriver):
            Args:
              phase: run_phase
         """
+        if (self.cfg is not None and self.cfg.reader):
+            await self.drive_reads(phase)
+
+        if (self.cfg is not None and self.cfg.initiator):
+            await self.drive_writes(phase)
+
+        if (self.cfg is not None and self.cfg.pipelined):
+            await self.drive_bursts(phase)
+
         while True:
     
             await RisingEdge(self.vif.clk_i)
@@ -109,6 +135,136 @@ class wb_standard_master_driver(UVMDriver):
                 await self.get_and_drive(phase)
 
 
+    async def drive_bursts(self, phase):
+        """         
+           Function: drive_bursts
+          
+           Definition: Pipelined mode. Items are taken with get() so the
+                       sequence can build the next burst while this one is
+                       driven. wb_standard_master_seq items are one transfer
+                       bursts.
+
+           Args:
+             phase: run_phase
+        """
+        while True:
+            tr = []
+            await self.seq_item_port.get(tr)
+            tr = tr[0]
+            # Checked by attribute, the sequences may import this package
+            # under a different module name.
+            if (hasattr(tr, "data")):
+                data = tr.data
+            else:
+                data = [tr.data_in]
+            phase.raise_objection(self, self.tag + "objection")
+            await self.drive_burst(tr, data)
+            phase.drop_objection(self, "wb_standard_master_driver drop objection")
+            self.trig.set()
+
+
+    async def drive_burst(self, tr, data):
+        """         
+           Function: drive_burst
+          
+           Definition: Stalls for tr.transmit_delay clocks, then presents one
+                       entry of data on every rising edge where stb_o is high.
+
+           Args:
+             tr: wb_standard_master_seq or wb_standard_master_burst_seq
+             data: DATA_i values.
+        """
+        clk_edge = RisingEdge(self.vif.clk_i)
+        if (tr.transmit_delay > 0):
+            self.vif.stall_i <= 1
+            await ClockCycles(self.vif.clk_i, tr.transmit_delay)
+        self.vif.stall_i <= 0
+        self.vif.tgd_i   <= tr.response_data_tag
+
+        for sample in data:
+            await clk_edge
+            while (self.vif.stb_o.value != 1):
+                self.vif.ack_i <= 0
+                await clk_edge
+            self.vif.dat_i <= sample
+            self.vif.ack_i <= tr.acknowledge
+
+        await clk_edge
+        self.vif.ack_i <= 0
+
+
+    async def drive_writes(self, phase):
+        """         
+           Function: drive_writes
+          
+           Definition: Initiator mode. Each item is written back to back, a
+                       burst item writes data[i] to addresses[i] (consecutive
+                       addresses from tr.address when addresses is empty).
+
+           Args:
+             phase: run_phase
+        """
+        self.vif.stb_o <= 0
+        while True:
+            tr = []
+            await self.seq_item_port.get(tr)
+            tr = tr[0]
+            base = getattr(tr, "address", 0)
+            if (hasattr(tr, "data")):
+                data      = tr.data
+                addresses = tr.addresses if len(tr.addresses) > 0 else range(base, base + len(data))
+            else:
+                data      = [tr.data_in]
+                addresses = [base]
+            phase.raise_objection(self, self.tag + "objection")
+            await self.write_burst(addresses, data)
+            phase.drop_objection(self, "wb_standard_master_driver drop objection")
+            self.trig.set()
+
+
+    async def drive_reads(self, phase):
+        """         
+           Function: drive_reads
+          
+           Definition: Reader mode. A burst item reads len(data) times, a
+                       single item once.
+
+           Args:
+             phase: run_phase
+        """
+        self.vif.stb_o <= 0
+        clk_edge = RisingEdge(self.vif.clk_i)
+        ack_edge = RisingEdge(self.vif.ack_i)
+        while True:
+            tr = []
+            await self.seq_item_port.get(tr)
+            tr = tr[0]
+            count = len(tr.data) if hasattr(tr, "data") else 1
+            await read_burst(self.vif, count, clk_edge, ack_edge)
+            self.trig.set()
+
+
+    async def write_burst(self, addresses, data):
+        """         
+           Function: write_burst
+          
+           Definition: Holds stb_o high and changes the address/data pair
+                       every write_cycles clocks. A single await per write.
+
+           Args:
+             addresses: Address of each write.
+             data: Data of each write.
+        """
+        cycles = self.cfg.write_cycles
+        await RisingEdge(self.vif.clk_i)
+        for address, value in zip(addresses, data):
+            self.vif.adr_o <= address
+            self.vif.dat_i <= value
+            self.vif.stb_o <= 1
+            await ClockCycles(self.vif.clk_i, cycles)
+        self.vif.stb_o <= 0
+
+
     async def feed_data(self, tr):
         # Feed the read data
         count = 0
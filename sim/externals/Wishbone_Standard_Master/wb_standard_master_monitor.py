@@ -33,12 +33,16 @@
 # File name     : wb_standard_master_monitor.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/05 20:08:35
-# Last modified : 2021/01/10 11:40:57
+# Last modified : 2026/10/18 15:24:48
 # Project Name  : UVM Python Verification Library
 # Module Name   : wb_standard_master_monitor
 # Description   : Wishbone Master Monitor.
 #
 # Additional Comments:
+#   With cfg.event_driven the monitor waits for stb_o to rise instead of
+#   waking on every clock, and only creates a transaction on a handshake.
+#   With cfg.pool_size the transactions are wb_standard_master_transfer
+#   records taken from a pool and given back once ap.write() returns.
 #
 ##################################################################################################
 import cocotb
@@ -75,6 +79,8 @@ class wb_standard_master_monitor(UVMMonitor):
         self.cfg       = None  # config loaded by the agent
         self.errors    = 0
         self.num_items = 0
+        self.pool      = None  # wb_standard_master_pool when cfg.pool_size > 0
+        self.summary_interval = 0  # transactions between summaries
         self.tag       = "wb_standard_master_" + name
 
 
@@ -89,26 +95,42 @@ class wb_standard_master_monitor(UVMMonitor):
              phase: build_phase
         """
         self.ap = UVMAnalysisPort("ap", self)
+        if (self.cfg is not None and self.cfg.pool_size > 0):
+            self.pool = wb_standard_master_pool(self.cfg.pool_size)
+        if (self.cfg is not None):
+            self.summary_interval = self.cfg.summary_interval
 
     
     async def run_phase(self, phase):
         """         
            Function: run_phase
           
-           Definition: Task executed during run phase. Drives the signals in
-                       response to a DUT read request. 
+           Definition: Task executed during run phase. Captures the bus
+                       transactions and sends them through the analysis port.
 
            Args:
              phase: run_phase
         """
+        if (self.cfg is not None and self.cfg.event_driven):
+            await self.monitor_handshakes()
+        else:
+            await self.monitor_every_clock()
+
+
+    async def monitor_every_clock(self):
+        """         
+           Function: monitor_every_clock
+          
+           Definition: Samples the bus on every rising edge of the clock.
+        """
         while True:
-            tr = None  # Clean transaction for every loop.
-            # Create sequence item for this transaction.
-            tr = wb_standard_master_seq.type_id.create("tr", self)
-            
             await RisingEdge(self.vif.clk_i)
             
-            if (self.vif.stb_o == 1):
+            # A strobe seen while ack_i is high belongs to the transfer
+            # being acknowledged, the UUT only accepts stb with ack low.
+            if (self.vif.stb_o == 1 and self.vif.ack_i.value != 1):
+                # Create sequence item for this transaction.
+                tr = self.new_transaction()
                 # Load signals values into sequence item to describe the transaction
                 tr.address     = self.vif.adr_o.value.integer
                 tr.data_out    = self.vif.dat_o.value.integer
@@ -130,7 +152,94 @@ class wb_standard_master_monitor(UVMMonitor):
                 tr.acknowledge       = self.vif.ack_i.value.integer
 
                 self.ap.write(tr) # Send transaction through analysis port
-                uvm_info(self.tag, tr.convert2string(), UVM_FULL)
+                self.log_transaction(tr)
+                self.free_transaction(tr)
+
+
+    async def monitor_handshakes(self):
+        """         
+           Function: monitor_handshakes
+          
+           Definition: Sleeps while the strobe is low. Samples the bus on the
+                       same clock edges as monitor_every_clock, but idle clocks
+                       cost nothing and a transaction is only created once a
+                       strobe is seen.
+        """
+        clk_edge = RisingEdge(self.vif.clk_i)
+        stb_edge = RisingEdge(self.vif.stb_o)
+        ack_edge = RisingEdge(self.vif.ack_i)
+        while True:
+            if (self.vif.stb_o.value != 1):
+                await stb_edge
+            await clk_edge
+
+            if (self.vif.stb_o.value == 1 and self.vif.ack_i.value != 1):
+                tr = self.new_transaction()
+                tr.address     = self.vif.adr_o.value.integer
+                tr.data_out    = self.vif.dat_o.value.integer
+                tr.select      = self.vif.sel_o.value.integer
+                tr.cycle       = self.vif.cyc_o
+                tr.strobe      = self.vif.stb_o.value.integer
+                tr.address_tag = self.vif.tga_o.value.integer
+                tr.data_tag    = self.vif.tgd_o.value.integer
+                tr.cycle_tag   = self.vif.tgc_o.value.integer
+
+                await ack_edge
+
+                self.num_items += 1
+                tr.data_in           = self.vif.dat_i.value.integer
+                tr.stall             = self.vif.stall_i.value.integer
+                tr.response_data_tag = self.vif.tgd_i.value.integer
+                tr.acknowledge       = self.vif.ack_i.value.integer
+
+                self.ap.write(tr)
+                self.log_transaction(tr)
+                self.free_transaction(tr)
+
+
+    def log_transaction(self, tr):
+        """         
+           Function: log_transaction
+          
+           Definition: Prints the transaction at UVM_FULL and a summary every
+                       summary_interval transactions at UVM_MEDIUM. Messages
+                       are only formatted when their verbosity is enabled.
+
+           Args:
+             tr: Transaction sent through ap.
+        """
+        if (self.uvm_report_enabled(UVM_FULL, UVM_INFO, self.tag)):
+            uvm_info(self.tag, tr.convert2string(), UVM_FULL)
+        if (self.summary_interval > 0 and self.num_items % self.summary_interval == 0 and
+            self.uvm_report_enabled(UVM_MEDIUM, UVM_INFO, self.tag)):
+            uvm_info(self.tag, sv.sformatf("%0d transactions, last DATA_i 0x%0h",
+                self.num_items, tr.data_in), UVM_MEDIUM)
+
+
+    def new_transaction(self):
+        """         
+           Function: new_transaction
+          
+           Definition: Returns a pooled transfer record, or a sequence item
+                       from the factory when the pool is off.
+        """
+        if (self.pool is not None):
+            return self.pool.acquire()
+        return wb_standard_master_seq.type_id.create("tr", self)
+
+
+    def free_transaction(self, tr):
+        """         
+           Function: free_transaction
+          
+           Definition: Gives a transfer record back to the pool. Analysis
+                       writes are synchronous, every subscriber is done with it.
+
+           Args:
+             tr: Transaction sent through ap.
+        """
+        if (self.pool is not None):
+            self.pool.release(tr)
 
 
     async def wait_for_ack(self):
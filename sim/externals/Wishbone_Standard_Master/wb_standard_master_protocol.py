@@ -0,0 +1,86 @@
+##################################################################################################
+# BSD 3-Clause License
+# 
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name     : wb_standard_master_protocol.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 21:24:37
+# Last modified : 2026/10/18 21:24:37
+# Project Name  : UVM-Python Verification Library
+# Module Name   : burst_sizes, read_burst
+# Description   : Wishbone bus protocols shared with the model only runs.
+#
+# Additional Comments:
+#   Nothing here imports cocotb or uvm. The coroutines await the triggers
+#   they are given, so wb_standard_master_driver runs them on cocotb
+#   triggers and sim/fast_mode.py on the triggers of its own scheduler, and
+#   both drive the bus the same way.
+##################################################################################################
+
+
+def burst_sizes(count, burst_size):
+    """
+       Function: burst_sizes
+
+       Definition: Splits count transfers in bursts of up to burst_size,
+         forever when count is None.
+
+       Args:
+         count: Transfers, None for no end.
+         burst_size: Largest burst.
+    """
+    while (count is None or count > 0):
+        size = burst_size if (count is None) else min(burst_size, count)
+        yield size
+        if (count is not None):
+            count = count - size
+
+
+async def read_burst(vif, count, clk_edge, ack_edge):
+    """
+       Function: read_burst
+
+       Definition: Reader mode. Raises stb_o on a rising edge and holds it
+         until the slave acknowledged count reads. The read data is left to
+         the monitor, it is driven by the slave. A slave that acknowledges
+         one strobe at a time answers every other clock.
+
+       Args:
+         vif: wb_standard_master_if, or any object with the same signals.
+         count: Reads.
+         clk_edge: Awaitable, next rising edge of clk_i.
+         ack_edge: Awaitable, next rise of ack_i.
+    """
+    await clk_edge
+    vif.stb_o <= 1
+    for _ in range(count):
+        await ack_edge
+    vif.stb_o <= 0
@@ -33,15 +33,18 @@
 # File name     : wb_standard_master_seq.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/22 10:24:13
-# Last modified : 2021/01/10 11:41:01
+# Last modified : 2026/10/18 21:24:37
 # Project Name  : UVM Python Verification Library
-# Module Name   : wb_standard_master_seq, wb_standard_master_base_sequence
+# Module Name   : wb_standard_master_seq, wb_standard_master_burst_seq, wb_standard_master_transfer,
+#                 wb_standard_master_pool, wb_standard_master_base_sequence, stream_sequence,
+#                 read_stream_sequence
 # Description   : Wishbone Bus Sequence Item and Sequences.
 #
 # Additional Comments:
 #   Create a a read or write transaction.
 ##################################################################################################
 from uvm import *
+from wb_standard_master_protocol import burst_sizes
 
 class wb_standard_master_seq(UVMSequenceItem):
     """         
@@ -81,6 +84,153 @@ class wb_standard_master_seq(UVMSequenceItem):
 uvm_object_utils(wb_standard_master_seq)
 
 
+class wb_standard_master_burst_seq(wb_standard_master_seq):
+    """         
+       Class: Wishbone Master Burst Sequence Item
+        
+       Definition: Carries the data of several consecutive transfers. A
+         driver in pipelined mode answers one strobe per entry of data, a
+         driver in initiator mode writes each entry to its address.
+    """
+
+    def __init__(self, name="wb_standard_master_burst_seq"):
+        super().__init__(name)
+        self.data      = []  # DATA_i of each transfer
+        self.addresses = []  # address of each transfer, initiator mode
+
+
+    def do_copy(self, rhs):
+        super().do_copy(rhs)
+        self.data      = list(rhs.data)
+        self.addresses = list(rhs.addresses)
+
+
+    def do_clone(self):
+        new_obj = wb_standard_master_burst_seq()
+        new_obj.copy(self)
+        return new_obj
+
+
+    def convert2string(self):
+        return sv.sformatf("\n =================================== \n    ACK_i : %d \n    TDG_i : 0x%0h \n    Burst : %d transfers \n    Stall : %d  clocks \n =================================== \n ",
+                self.acknowledge, self.response_data_tag, len(self.data), self.transmit_delay)
+
+
+uvm_object_utils(wb_standard_master_burst_seq)
+
+
+class wb_standard_master_transfer():
+    """         
+       Class: Wishbone Master Transfer
+        
+       Definition: Compact, __slots__ based record of one bus transfer. Used
+         by the monitor instead of a full sequence item. Subscribers must copy
+         what they need during write(), the record is reused afterwards. Use
+         to_item() to get a real wb_standard_master_seq.
+    """
+    __slots__ = ("address", "data_out", "select", "cycle", "strobe", "address_tag",
+                 "data_tag", "cycle_tag", "data_in", "stall", "response_data_tag",
+                 "acknowledge", "transmit_delay")
+
+    def __init__(self):
+        self.clear()
+
+
+    def clear(self):
+        """         
+           Function: clear
+          
+           Definition: Sets every field to the sequence item defaults.
+        """
+        for field in self.__slots__:
+            setattr(self, field, 0)
+        self.acknowledge = 1
+
+
+    def to_item(self, name="wb_standard_master_seq"):
+        """         
+           Function: to_item
+          
+           Definition: Returns a new wb_standard_master_seq with these values.
+
+           Args:
+             name: Name of the sequence item.
+        """
+        item = wb_standard_master_seq(name)
+        for field in self.__slots__:
+            setattr(item, field, getattr(self, field))
+        return item
+
+
+    def from_item(self, item):
+        """         
+           Function: from_item
+          
+           Definition: Loads the values of a sequence item, fields the item
+             does not have keep their defaults.
+
+           Args:
+             item: wb_standard_master_seq
+        """
+        self.clear()
+        for field in self.__slots__:
+            if (hasattr(item, field)):
+                setattr(self, field, getattr(item, field))
+        return self
+
+
+    def convert2string(self):
+        return sv.sformatf("\n =================================== \n    ACK_i : %d \n    TDG_i : 0x%0h \n   DATA_i : 0x%0h \n    Delay : %d  clocks \n =================================== \n ",
+                self.acknowledge, self.response_data_tag, self.data_in, self.transmit_delay)
+
+
+class wb_standard_master_pool():
+    """         
+       Class: Wishbone Master Transfer Pool
+        
+       Definition: Free list of wb_standard_master_transfer records.
+    """
+
+    def __init__(self, size=64):
+        """         
+           Function: new
+          
+           Definition: Pool constructor.
+
+           Args:
+             size: Records kept on the free list, extra releases are dropped.
+        """
+        self.size        = size
+        self.free        = []
+        self.num_created = 0
+
+
+    def acquire(self):
+        """         
+           Function: acquire
+          
+           Definition: Returns a cleared record, new only when the list is empty.
+        """
+        if (self.free):
+            return self.free.pop()
+        self.num_created += 1
+        return wb_standard_master_transfer()
+
+
+    def release(self, tr):
+        """         
+           Function: release
+          
+           Definition: Returns a record to the free list.
+
+           Args:
+             tr: wb_standard_master_transfer
+        """
+        if (len(self.free) < self.size):
+            tr.clear()
+            self.free.append(tr)
+
+
 class wb_standard_master_base_sequence(UVMSequence):
 
     def __init__(self, name="wb_standard_master_base_sequence"):
@@ -128,6 +278,8 @@ class write_single_sequence(wb_standard_master_base_sequence):
     """
     def __init__(self, name="write_single_sequence"):
         wb_standard_master_base_sequence.__init__(self, name)
+        self.data              = 0
+        self.address           = 0
         self.stall             = 0
         self.transmit_delay    = 0
         self.response_data_tag = 0
@@ -136,7 +288,8 @@ class write_single_sequence(wb_standard_master_base_sequence):
 
     async def body(self):
         # Build the sequence item
-        self.req.data_in           = 0
+        self.req.data_in           = self.data
+        self.req.address           = self.address
         self.req.stall             = self.stall
         self.req.response_data_tag = self.response_data_tag
         self.req.acknowledge       = self.acknowledge
@@ -147,3 +300,68 @@ class write_single_sequence(wb_standard_master_base_sequence):
 
 
 uvm_object_utils(write_single_sequence)
+
+
+class stream_sequence(wb_standard_master_base_sequence):
+    """         
+       Class: Wishbone Stream Sequence
+        
+       Definition: Sends a sample stream as wb_standard_master_burst_seq items
+         of up to burst_size transfers. Meant for a driver in pipelined mode.
+    """
+    def __init__(self, name="stream_sequence"):
+        wb_standard_master_base_sequence.__init__(self, name)
+        self.samples           = []   # any iterable of DATA_i values
+        self.burst_size        = 256
+        self.transmit_delay    = 0    # stall clocks before each burst
+        self.response_data_tag = 0
+        self.acknowledge       = 1
+
+
+    async def body(self):
+        burst = []
+        for sample in self.samples:
+            burst.append(int(sample))
+            if (len(burst) == self.burst_size):
+                await self.send_burst(burst)
+                burst = []
+        if (len(burst) > 0):
+            await self.send_burst(burst)
+
+
+    async def send_burst(self, burst):
+        # A new item per burst, the driver may still be driving the last one.
+        req = wb_standard_master_burst_seq("burst")
+        req.data              = burst
+        req.response_data_tag = self.response_data_tag
+        req.acknowledge       = self.acknowledge
+        req.transmit_delay    = self.transmit_delay
+
+        await uvm_do_with(self, req) # start_item 
+
+
+uvm_object_utils(stream_sequence)
+
+
+class read_stream_sequence(wb_standard_master_base_sequence):
+    """         
+       Class: Wishbone Read Stream Sequence
+        
+       Definition: Reads count times, in wb_standard_master_burst_seq items
+         of up to burst_size reads, forever when count is None. Meant for a
+         driver in reader mode.
+    """
+    def __init__(self, name="read_stream_sequence"):
+        wb_standard_master_base_sequence.__init__(self, name)
+        self.count      = None
+        self.burst_size = 256
+
+
+    async def body(self):
+        for size in burst_sizes(self.count, self.burst_size):
+            req = wb_standard_master_burst_seq("burst")
+            req.data = [0] * size
+            await uvm_do_with(self, req) # start_item 
+
+
+uvm_object_utils(read_stream_sequence)
@@ -33,7 +33,7 @@
 # File name     : wb_standard_slave_agent.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/09 21:43:54
-# Last modified : 2021/01/10 11:42:39
+# Last modified : 2026/10/18 12:43:41
 # Project Name  : UVM-Python Verification Library
 # Module Name   : wb_standard_slave_agent
 # Description   : Wishbone Bus Master Verification Component Agent.
@@ -94,6 +94,7 @@ class wb_standard_slave_agent(UVMAgent):
        
         if (self.cfg.has_monitor == 1):
             self.mon = wb_standard_slave_monitor.type_id.create("mon", self)
+            self.mon.cfg = self.cfg
 
 
     def connect_phase(self, phase):
@@ -33,7 +33,7 @@
 # File name     : wb_standard_slave_config.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/22 10:13:34
-# Last modified : 2021/01/10 11:42:42
+# Last modified : 2026/10/18 13:11:02
 # Project Name  : UVM-Python Verification Library
 # Module Name   : wb_standard_slave_config
 # Description   : Wishbone Bus Master Agent configuration object.
@@ -67,6 +67,8 @@ class wb_standard_slave_config(UVMObject):
         self.vif              = None # wb_standard_slave_if
         self.has_driver       = None
         self.has_monitor      = None
+        self.pool_size        = 0     # monitor recycles compact transfers, 0 creates sequence items
+        self.summary_interval = 1000  # transactions between monitor summaries, 0 off
 
 
     def build_phase(self, phase):
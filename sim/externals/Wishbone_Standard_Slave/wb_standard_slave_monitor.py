@@ -33,12 +33,14 @@
 # File name     : wb_standard_slave_monitor.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/05 20:08:35
-# Last modified : 2021/01/10 11:42:54
+# Last modified : 2026/10/18 13:11:02
 # Project Name  : UVM Python Verification Library
 # Module Name   : wb_standard_slave_monitor
 # Description   : Wishbone Master Monitor.
 #
 # Additional Comments:
+#   With cfg.pool_size the transactions are wb_standard_slave_transfer
+#   records taken from a pool and given back once ap.write() returns.
 #
 ##################################################################################################
 import cocotb
@@ -75,6 +77,8 @@ class wb_standard_slave_monitor(UVMMonitor):
         self.cfg       = None  # config loaded by the agent
         self.errors    = 0
         self.num_items = 0
+        self.pool      = None  # wb_standard_slave_pool when cfg.pool_size > 0
+        self.summary_interval = 0  # transactions between summaries
         self.tag       = "wb_standard_slave_" + name
 
 
@@ -89,6 +93,10 @@ class wb_standard_slave_monitor(UVMMonitor):
              phase: build_phase
         """
         self.ap = UVMAnalysisPort("ap", self)
+        if (self.cfg is not None and self.cfg.pool_size > 0):
+            self.pool = wb_standard_slave_pool(self.cfg.pool_size)
+        if (self.cfg is not None):
+            self.summary_interval = self.cfg.summary_interval
 
     
     async def run_phase(self, phase):
@@ -102,13 +110,11 @@ class wb_standard_slave_monitor(UVMMonitor):
              phase: run_phase
         """
         while True:
-            tr = None  # Clean transaction for every loop.
-            # Create sequence item for this transaction.
-            tr = wb_standard_slave_seq.type_id.create("tr", self)
-            
             await RisingEdge(self.vif.clk_i)
             
             if (self.vif.stb_o == 1):
+                # Create sequence item for this transaction.
+                tr = self.new_transaction()
                 # Load signals values into sequence item to describe the transaction
                 tr.address     = self.vif.adr_o.value.integer
                 tr.data_out    = self.vif.dat_o.value.integer
@@ -130,7 +136,53 @@ class wb_standard_slave_monitor(UVMMonitor):
                 tr.acknowledge       = self.vif.ack_i.value.integer
 
                 self.ap.write(tr) # Send transaction through analysis port
-                uvm_info(self.tag, tr.convert2string(), UVM_FULL)
+                self.log_transaction(tr)
+                self.free_transaction(tr)
+
+
+    def log_transaction(self, tr):
+        """         
+           Function: log_transaction
+          
+           Definition: Prints the transaction at UVM_FULL and a summary every
+                       summary_interval transactions at UVM_MEDIUM. Messages
+                       are only formatted when their verbosity is enabled.
+
+           Args:
+             tr: Transaction sent through ap.
+        """
+        if (self.uvm_report_enabled(UVM_FULL, UVM_INFO, self.tag)):
+            uvm_info(self.tag, tr.convert2string(), UVM_FULL)
+        if (self.summary_interval > 0 and self.num_items % self.summary_interval == 0 and
+            self.uvm_report_enabled(UVM_MEDIUM, UVM_INFO, self.tag)):
+            uvm_info(self.tag, sv.sformatf("%0d transactions, last DATA_i 0x%0h",
+                self.num_items, tr.data_in), UVM_MEDIUM)
+
+
+    def new_transaction(self):
+        """         
+           Function: new_transaction
+          
+           Definition: Returns a pooled transfer record, or a sequence item
+                       from the factory when the pool is off.
+        """
+        if (self.pool is not None):
+            return self.pool.acquire()
+        return wb_standard_slave_seq.type_id.create("tr", self)
+
+
+    def free_transaction(self, tr):
+        """         
+           Function: free_transaction
+          
+           Definition: Gives a transfer record back to the pool. Analysis
+                       writes are synchronous, every subscriber is done with it.
+
+           Args:
+             tr: Transaction sent through ap.
+        """
+        if (self.pool is not None):
+            self.pool.release(tr)
 
 
     async def wait_for_ack(self):
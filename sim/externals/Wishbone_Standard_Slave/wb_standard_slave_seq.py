@@ -33,9 +33,10 @@
 # File name     : wb_standard_slave_seq.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/22 10:24:13
-# Last modified : 2021/01/10 11:42:57
+# Last modified : 2026/10/18 12:41:32
 # Project Name  : UVM Python Verification Library
-# Module Name   : wb_standard_slave_seq, wb_standard_slave_base_sequence
+# Module Name   : wb_standard_slave_seq, wb_standard_slave_transfer, wb_standard_slave_pool,
+#                 wb_standard_slave_base_sequence
 # Description   : Wishbone Bus Sequence Item and Sequences.
 #
 # Additional Comments:
@@ -85,6 +86,118 @@ class wb_standard_slave_seq(UVMSequenceItem):
 uvm_object_utils(wb_standard_slave_seq)
 
 
+class wb_standard_slave_transfer():
+    """         
+       Class: Wishbone Slave Transfer
+        
+       Definition: Compact, __slots__ based record of one bus transfer. Used
+         by the monitor instead of a full sequence item. Subscribers must copy
+         what they need during write(), the record is reused afterwards. Use
+         to_item() to get a real wb_standard_slave_seq.
+    """
+    __slots__ = ("address", "data_out", "select", "cycle", "strobe", "address_tag",
+                 "data_tag", "cycle_tag", "data_in", "addr", "stall", "response_data_tag",
+                 "acknowledge", "transmit_delay")
+
+    def __init__(self):
+        self.clear()
+
+
+    def clear(self):
+        """         
+           Function: clear
+          
+           Definition: Sets every field to the sequence item defaults.
+        """
+        for field in self.__slots__:
+            setattr(self, field, 0)
+        self.acknowledge = 1
+
+
+    def to_item(self, name="wb_standard_slave_seq"):
+        """         
+           Function: to_item
+          
+           Definition: Returns a new wb_standard_slave_seq with these values.
+
+           Args:
+             name: Name of the sequence item.
+        """
+        item = wb_standard_slave_seq(name)
+        for field in self.__slots__:
+            setattr(item, field, getattr(self, field))
+        return item
+
+
+    def from_item(self, item):
+        """         
+           Function: from_item
+          
+           Definition: Loads the values of a sequence item, fields the item
+             does not have keep their defaults.
+
+           Args:
+             item: wb_standard_slave_seq
+        """
+        self.clear()
+        for field in self.__slots__:
+            if (hasattr(item, field)):
+                setattr(self, field, getattr(item, field))
+        return self
+
+
+    def convert2string(self):
+        return sv.sformatf("\n =================================== \n    ACK_i : %d \n    TDG_i : 0x%0h \n   DATA_i : 0x%0h \n    Delay : %d  clocks \n =================================== \n ",
+                self.acknowledge, self.response_data_tag, self.data_in, self.transmit_delay)
+
+
+class wb_standard_slave_pool():
+    """         
+       Class: Wishbone Slave Transfer Pool
+        
+       Definition: Free list of wb_standard_slave_transfer records.
+    """
+
+    def __init__(self, size=64):
+        """         
+           Function: new
+          
+           Definition: Pool constructor.
+
+           Args:
+             size: Records kept on the free list, extra releases are dropped.
+        """
+        self.size        = size
+        self.free        = []
+        self.num_created = 0
+
+
+    def acquire(self):
+        """         
+           Function: acquire
+          
+           Definition: Returns a cleared record, new only when the list is empty.
+        """
+        if (self.free):
+            return self.free.pop()
+        self.num_created += 1
+        return wb_standard_slave_transfer()
+
+
+    def release(self, tr):
+        """         
+           Function: release
+          
+           Definition: Returns a record to the free list.
+
+           Args:
+             tr: wb_standard_slave_transfer
+        """
+        if (len(self.free) < self.size):
+            tr.clear()
+            self.free.append(tr)
+
+
 class wb_standard_slave_base_sequence(UVMSequence):
 
     def __init__(self, name="wb_standard_slave_base_sequence"):
@@ -0,0 +1,522 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : fast_mode.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 18:41:27
+# Last modified : 2026/10/18 21:40:12
+# Project Name  : IIR Filter
+# Module Name   : fast_scheduler, fast_bench
+# Description   : Model only run of the test bench, no simulator.
+#
+# Additional Comments:
+#   iir_filter_top_model stands in for IIR_Filter_TOP and fast_scheduler
+#   runs the clock. Coroutines await clock_edge, clock_cycles and
+#   signal_rise, and write the ports through wb_standard_master_if style
+#   interfaces built from the top.py bus maps. Like cocotb, writes made by
+#   the coroutines woken on an edge are applied after all of them ran.
+#
+#   fast_bench is a pre-commit check of the stand-in, not a run of
+#   iir_filter_tb_env. uvm-python runs its phases, objections and sequencers
+#   on the cocotb scheduler, whose triggers are callbacks registered in the
+#   simulator through the GPI; cocotb cannot even be imported without one.
+#   So the buses are driven by bus functional coroutines that follow the
+#   protocol of the agents' drivers, and the outputs are checked with the
+#   pieces of the environment that do not need cocotb: the predictor's
+#   iir_filter_clock_model and the scoreboard's stream_checker. The read
+#   port is strobed by the driver's own read_burst, split in the bursts of
+#   read_stream_sequence, from the first sample to the end of the run as
+#   iir_filter_reg_test does.
+#
+#     python fast_mode.py --samples 20000 --seed 1
+#     python fast_mode.py --stimulus dhry.hex --stop 7600
+#
+#   --sweep runs the iir_filter_sweep_test stimulus instead and checks the
+#   response captured from the stand-in against the golden output that test
+#   computes, with frequency_response.analyze.
+#
+#     python fast_mode.py --sweep
+#################################################################################
+import sys
+import json
+import argparse
+import numpy as np
+from iir_filter_top_model import *
+from iir_filter_model import iir_filter_model, iir_filter_model_bank, iir_filter_clock_model, to_signed, to_unsigned
+from stream_checker import stream_checker
+from externals.Wishbone_Standard_Master.wb_standard_master_protocol import burst_sizes, read_burst
+
+
+class clock_edge():
+    """
+       Class: Clock Edge
+
+       Definition: Awaitable, resumes on the next rising or falling edge.
+    """
+
+    def __init__(self, rising=True):
+        self.rising = rising
+
+    def __await__(self):
+        yield self
+
+
+class clock_cycles():
+    """
+       Class: Clock Cycles
+
+       Definition: Awaitable, resumes after a number of rising edges.
+    """
+
+    def __init__(self, cycles):
+        self.cycles = cycles
+
+    def __await__(self):
+        yield self
+
+
+class signal_rise():
+    """
+       Class: Signal Rise
+
+       Definition: Awaitable, resumes when a signal goes from 0 to 1.
+    """
+
+    def __init__(self, signal):
+        self.signal = signal
+
+    def __await__(self):
+        yield self
+
+
+class fast_if():
+    """
+       Class: Fast Interface
+
+       Definition: wb_standard_master_if without sv_if, the bus map names
+         bound to the ports of the stand-in.
+    """
+
+    def __init__(self, dut, bus_map):
+        for name, port in bus_map.items():
+            setattr(self, name, getattr(dut, port))
+
+
+class fast_scheduler():
+    """
+       Class: Fast Scheduler
+
+       Definition: Runs the clock of the stand-in and the coroutines waiting
+         on it.
+    """
+
+    def __init__(self, dut):
+        """
+           Function: new
+
+           Definition: Scheduler constructor. Takes over the writes to every
+             port of dut.
+
+           Args:
+             dut: iir_filter_top_model
+        """
+        self.dut      = dut
+        self.cycle    = 0
+        self.writes   = []  # (signal, value) written since the last apply
+        self.rising   = []  # coroutines waiting on clock_edge(True)
+        self.falling  = []
+        self.counting = []  # [cycles left, coroutine]
+        self.rises    = []  # (signal, last value, coroutine)
+        self.running  = 0   # coroutines started and not finished
+        for signal in vars(dut).values():
+            if (isinstance(signal, model_signal)):
+                signal.writes = self.writes
+
+
+    def start(self, coroutine):
+        """
+           Function: start
+
+           Definition: Runs a coroutine up to its first await.
+
+           Args:
+             coroutine: Coroutine object.
+        """
+        self.running = self.running + 1
+        self.resume(coroutine)
+        self.settle()
+
+
+    def resume(self, coroutine):
+        try:
+            trigger = coroutine.send(None)
+        except StopIteration:
+            self.running = self.running - 1
+            return
+        if (isinstance(trigger, clock_edge)):
+            (self.rising if trigger.rising else self.falling).append(coroutine)
+        elif (isinstance(trigger, clock_cycles)):
+            self.counting.append([trigger.cycles, coroutine])
+        elif (isinstance(trigger, signal_rise)):
+            self.rises.append((trigger.signal, trigger.signal.word, coroutine))
+        else:
+            raise TypeError("fast_scheduler cannot wait on %r" % (trigger,))
+
+
+    def settle(self):
+        """
+           Function: settle
+
+           Definition: Wakes the coroutines waiting on a signal that rose,
+             then applies the pending writes, until nothing changes. Rises
+             caused by the stand-in are seen before the writes of the
+             coroutines woken on the same edge.
+        """
+        while True:
+            ready   = []
+            waiting = []
+            for signal, last, coroutine in self.rises:
+                if (signal.word == 1 and last == 0):
+                    ready.append(coroutine)
+                else:
+                    waiting.append((signal, signal.word, coroutine))
+            self.rises = waiting
+            for coroutine in ready:
+                self.resume(coroutine)
+            if (len(ready) == 0 and len(self.writes) == 0):
+                return
+            writes = list(self.writes)
+            del self.writes[:]
+            for signal, value in writes:
+                signal.word = int(value) & signal.mask
+
+
+    def step(self):
+        """
+           Function: step
+
+           Definition: One i_clk period, rising edge then falling edge.
+        """
+        clk = self.dut.i_clk
+        clk.word = 1
+        self.dut.posedge()
+        self.cycle = self.cycle + 1
+        woken = self.rising
+        self.rising = []
+        counting = []
+        for entry in self.counting:
+            entry[0] = entry[0] - 1
+            if (entry[0] <= 0):
+                woken.append(entry[1])
+            else:
+                counting.append(entry)
+        self.counting = counting
+        for coroutine in woken:
+            self.resume(coroutine)
+        self.settle()
+
+        clk.word = 0
+        self.dut.negedge()
+        woken = self.falling
+        self.falling = []
+        for coroutine in woken:
+            self.resume(coroutine)
+        self.settle()
+
+
+    def run(self, cycles):
+        """
+           Function: run
+
+           Definition: Runs a number of clock periods.
+        """
+        for _ in range(cycles):
+            self.step()
+
+
+async def write_coefficients(vif, coefficients, write_cycles=2):
+    """
+       Function: write_coefficients
+
+       Definition: wb_standard_master_driver in initiator mode, one write
+         every write_cycles clocks with stb_o held high.
+    """
+    await clock_edge()
+    for address, value in enumerate(coefficients):
+        vif.adr_o <= address
+        vif.dat_i <= value
+        vif.stb_o <= 1
+        await clock_cycles(write_cycles)
+    vif.stb_o <= 0
+
+
+async def stream_samples(vif, samples):
+    """
+       Function: stream_samples
+
+       Definition: wb_standard_master_driver in pipelined mode, one sample
+         on every rising edge with stb_o high.
+    """
+    for sample in samples:
+        await clock_edge()
+        while (vif.stb_o.value != 1):
+            vif.ack_i <= 0
+            await clock_edge()
+        vif.dat_i <= sample
+        vif.ack_i <= 1
+    await clock_edge()
+    vif.ack_i <= 0
+
+
+async def read_outputs(vif, count=None, burst_size=256):
+    """
+       Function: read_outputs
+
+       Definition: read_stream_sequence on wb_standard_master_driver in
+         reader mode, the same read_burst on the scheduler's triggers.
+    """
+    clk_edge = clock_edge()
+    ack_edge = signal_rise(vif.ack_i)
+    for size in burst_sizes(count, burst_size):
+        await read_burst(vif, size, clk_edge, ack_edge)
+
+
+async def monitor(vif, write):
+    """
+       Function: monitor
+
+       Definition: wb_standard_master_monitor. Every rise of ack_i is a
+         transfer, write(address, data) gets adr_o and dat_i.
+    """
+    while True:
+        await signal_rise(vif.ack_i)
+        write(vif.adr_o.word, vif.dat_i.word)
+
+
+class fast_bench():
+    """
+       Class: Fast Bench
+
+       Definition: The iir_filter_reg_test stimulus on the stand-in, its
+         outputs checked against the predictor's clock model.
+    """
+
+    def __init__(self, num_coefficients=13, data_msb=15, block_size=4096, depth=8192,
+                 context=8, max_failures=16, align_window=1024, max_latency=64):
+        """
+           Function: new
+
+           Definition: Builds the stand-in, the interfaces, the predictor and
+             the scoreboard. Defaults are the tb_env_config ones.
+        """
+        self.dut       = iir_filter_top_model(num_coefficients, data_msb=data_msb)
+        self.scheduler = fast_scheduler(self.dut)
+        self.vif       = fast_if(self.dut, BUS_MAP_INST)
+        self.vif_read  = fast_if(self.dut, BUS_MAP_READ)
+        self.vif_write = fast_if(self.dut, BUS_MAP_WRITE)
+        # Predictor, clocks are the scheduler's cycles
+        self.model       = iir_filter_model_bank(1, num_coefficients, data_msb)
+        self.clock_model = iir_filter_clock_model(self.model, block_size, self.write_expected)
+        # Scoreboard
+        self.checker = stream_checker(data_msb, depth, context, max_failures, align_window, max_latency)
+        self.num_writes = 0
+        self.captured   = []  # outputs read, in order
+
+
+    def write_sample(self, address, data):
+        # iir_filter_predictor.write
+        self.clock_model.sample(self.scheduler.cycle, data)
+
+
+    def write_coefficient(self, address, data):
+        # scoreboard_stream.write_coeff, then iir_filter_predictor.write_coeff
+        self.num_writes = self.num_writes + 1
+        self.checker.realign()
+        self.clock_model.write_coefficient(self.scheduler.cycle, address, data, 0)
+
+
+    def write_output(self, address, data):
+        # iir_filter_predictor.write_read, then scoreboard_stream.write_observed
+        self.clock_model.read(self.scheduler.cycle)
+        self.checker.push_observed(data)
+        self.captured.append(data)
+
+
+    def write_expected(self, predicted):
+        # iir_filter_predictor.send, then scoreboard_stream.write_expected
+        self.checker.push_expected(predicted[0])
+
+
+    def flush(self):
+        self.clock_model.flush()
+
+
+    def run(self, samples, coefficients=None, reset_cycles=32, write_cycles=2, drain_cycles=256):
+        """
+           Function: run
+
+           Definition: Resets, loads the coefficients, streams the samples
+             and returns the checker once the outputs drained.
+
+           Args:
+             samples: Unsigned sample words.
+             coefficients: Words written at start, None skips.
+             reset_cycles: Clocks of i_reset_sync.
+             write_cycles: Clocks per coefficient write.
+             drain_cycles: Clocks run after the last sample, reads go on.
+        """
+        scheduler = self.scheduler
+        self.vif.rst_i <= 1
+        scheduler.settle()
+        scheduler.run(reset_cycles)
+        self.vif.rst_i <= 0
+        scheduler.settle()
+        scheduler.start(monitor(self.vif, self.write_sample))
+        scheduler.start(monitor(self.vif_read, self.write_output))
+        scheduler.start(monitor(self.vif_write, self.write_coefficient))
+        if (coefficients is not None):
+            scheduler.start(write_coefficients(self.vif_write, [int(c) for c in coefficients], write_cycles))
+            scheduler.run(write_cycles * (len(coefficients) + 2))
+        # iir_filter_reg_test: reads start with the stream and go on while the
+        # last outputs drain.
+        scheduler.start(read_outputs(self.vif_read))
+        scheduler.start(stream_samples(self.vif, [int(s) for s in samples]))
+        streaming = scheduler.running
+        while (scheduler.running == streaming):
+            scheduler.step()
+        scheduler.run(drain_cycles)
+        self.flush()
+        self.checker.finish()
+        return self.checker
+
+
+def sweep(bench, coefficients, args):
+    """
+       Function: sweep
+
+       Definition: iir_filter_sweep_test on the stand-in. Returns the
+         frequency_response.analyze report, the golden output is the one the
+         test computes.
+
+       Args:
+         bench: fast_bench.
+         coefficients: Coefficient words by address.
+         args: Parsed arguments, the SWEEP_* plusargs of the test.
+    """
+    from frequency_response import tone_bins, multitone, analyze
+    bins = tone_bins(args.sweep_n, args.sweep_tones)
+    stimulus = multitone(args.sweep_n, bins, args.sweep_level, args.data_msb, args.sweep_periods)
+    bench.run(to_unsigned(stimulus, args.data_msb), coefficients)
+    model = iir_filter_model(args.num_coefficients, args.data_msb)
+    model.load_coefficients(coefficients)
+    golden = to_signed(model.process_stream(stimulus), args.data_msb)
+    # sample_capture keeps the first stimulus.size outputs
+    captured = to_signed(np.array(bench.captured[:stimulus.size], dtype=np.uint64), args.data_msb)
+    return analyze(stimulus, captured, golden, args.sweep_n, bins)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs iir_filter_reg_test on a Python stand-in of IIR_Filter_TOP.")
+    parser.add_argument("--stimulus", default=None,
+                        help=".npy, .hex or audio sample file, see stimulus_source.py; random samples by default")
+    parser.add_argument("--stop", type=int, default=None, help="samples read from --stimulus")
+    parser.add_argument("--samples", type=int, default=20000, help="random samples")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--coefficients", default=None,
+                        help="JSON list of coefficient words; the coefficient_designer default design by default")
+    parser.add_argument("--no-coefficients", action="store_true", help="keep the coefficients cleared by reset")
+    parser.add_argument("--num-coefficients", type=int, default=13)
+    parser.add_argument("--data-msb", type=int, default=15)
+    parser.add_argument("--json", default=None, help="checker counters and failures")
+    parser.add_argument("--sweep", action="store_true", help="run the iir_filter_sweep_test stimulus")
+    parser.add_argument("--sweep-n", type=int, default=4096)
+    parser.add_argument("--sweep-tones", type=int, default=32)
+    parser.add_argument("--sweep-periods", type=int, default=3)
+    parser.add_argument("--sweep-level", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    if (args.stimulus is None):
+        rng = np.random.default_rng(args.seed)
+        samples = rng.integers(0, 1 << (args.data_msb + 1), args.samples, dtype=np.uint64)
+    elif (args.stimulus.endswith((".wav", ".pcm", ".raw"))):
+        from stimulus_source import pcm_source
+        samples = to_unsigned(np.concatenate(list(pcm_source(args.stimulus, args.data_msb).chunks())), args.data_msb)
+        samples = samples[:args.stop]
+    else:
+        from stimulus_source import stimulus_source
+        if (args.stimulus.endswith(".hex")):
+            source = stimulus_source.from_hex(args.stimulus, stop=args.stop)
+        else:
+            source = stimulus_source(args.stimulus, stop=args.stop)
+        samples = to_unsigned(np.concatenate(list(source.chunks())), args.data_msb)
+
+    if (args.no_coefficients):
+        coefficients = None
+    elif (args.coefficients is not None):
+        with open(args.coefficients, "r") as f:
+            coefficients = json.load(f)
+    else:
+        from coefficient_designer import design_coefficients
+        coefficients = design_coefficients(data_msb=args.data_msb, num_coefficients=args.num_coefficients)
+
+    bench = fast_bench(args.num_coefficients, args.data_msb)
+    if (args.sweep):
+        if (coefficients is None):
+            coefficients = [0] * args.num_coefficients
+        report = sweep(bench, coefficients, args)
+        for v in report["violations"]:
+            print("%s tone at %0.5f fs: UUT %0.2f dB, model %0.2f dB, phase error %0.2f deg" % (
+                "Pass band" if v["passband"] else "Stop band", v["frequency"], v["uut_db"], v["golden_db"],
+                v["phase_error"]))
+        print("%d tones, capture offset %d samples, %d outside the response masks" % (
+            args.sweep_tones, report["offset"], len(report["violations"])))
+        passed = (not report["violations"]) and bench.checker.passed()
+        print("PASSED" if passed else "FAILED")
+        return 0 if passed else 1
+
+    checker = bench.run(samples, coefficients)
+    print("%d samples, %d coefficient writes, %d clocks" % (len(samples), bench.num_writes, bench.scheduler.cycle))
+    print(checker.convert2string())
+    if (args.json is not None):
+        with open(args.json, "w") as f:
+            json.dump({"passed"    : checker.passed(),
+                       "expected"  : checker.num_expected,
+                       "observed"  : checker.num_observed,
+                       "mismatches": checker.num_mismatches,
+                       "latency"   : checker.latency,
+                       "failures"  : checker.failures}, f, indent=1)
+    print("PASSED" if checker.passed() else "FAILED")
+    return 0 if checker.passed() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
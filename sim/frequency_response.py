@@ -0,0 +1,182 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : frequency_response.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 17:58:33
+# Last modified : 2026/10/18 17:58:33
+# Project Name  : IIR Filter
+# Module Name   : frequency_response
+# Description   : Multi-tone stimulus and FFT response analysis.
+#
+# Additional Comments:
+#   The stimulus is a periodic sum of tones that sit exactly on FFT bins of
+#   an n sample period, so one period of the steady state output gives the
+#   response at every tone at once, without windowing. Schroeder phases keep
+#   the crest factor low. The response of the UUT is compared against the
+#   response of the bit accurate model on the same stimulus: in the pass
+#   band (golden magnitude within floor_db of its peak) magnitude and phase
+#   must match within tolerance, in the stop band the UUT may not rise more
+#   than mag_tol_db above the golden level or the floor.
+#################################################################################
+import numpy as np
+
+
+def tone_bins(n, num_tones, low=0.002, high=0.45):
+    """
+       Function: tone_bins
+
+       Definition: Up to num_tones distinct FFT bins spaced logarithmically
+         between low and high, in fractions of the sample rate.
+
+       Args:
+         n: Samples per period.
+         num_tones: Tones wanted.
+         low: Lowest frequency, in cycles per sample.
+         high: Highest frequency, in cycles per sample.
+    """
+    first = max(int(round(low * n)), 1)
+    last  = min(int(round(high * n)), n // 2 - 1)
+    return np.unique(np.round(np.geomspace(first, last, num_tones)).astype(np.int64))
+
+
+def multitone(n, bins, amplitude, data_msb, periods=1):
+    """
+       Function: multitone
+
+       Definition: periods repetitions of an n sample multi-tone, as signed
+         integers whose peak is amplitude times full scale.
+
+       Args:
+         n: Samples per period.
+         bins: FFT bin of each tone.
+         amplitude: Peak as a fraction of full scale.
+         data_msb: Most significant bit of the samples.
+         periods: Periods generated.
+    """
+    k = np.arange(bins.size)
+    phases = -np.pi * k * (k - 1) / bins.size
+    t = np.arange(n)
+    x = np.cos(2.0 * np.pi * np.outer(bins, t) / n + phases[:, np.newaxis]).sum(axis=0)
+    x *= amplitude * ((1 << data_msb) - 1) / np.abs(x).max()
+    return np.tile(np.round(x).astype(np.int64), periods)
+
+
+def find_offset(captured, golden, n, max_offset):
+    """
+       Function: find_offset
+
+       Definition: Samples the capture trails the golden output by, found by
+         matching the last n captured samples.
+
+       Args:
+         captured: Output samples captured from the UUT.
+         golden: Model output for the whole stimulus.
+         n: Samples compared.
+         max_offset: Largest offset tried.
+    """
+    window = captured[captured.size - n:]
+    end = min(captured.size, golden.size)
+    best, best_score = 0, -1
+    for offset in range(0, max_offset + 1):
+        stop = end - offset
+        if (stop - n < 0):
+            break
+        score = int(np.count_nonzero(golden[stop - n:stop] == window))
+        if (score > best_score):
+            best, best_score = offset, score
+    return best
+
+
+def response(x, y, bins):
+    """
+       Function: response
+
+       Definition: y over x at the tone bins, one period of each.
+    """
+    return np.fft.rfft(y)[bins] / np.fft.rfft(x)[bins]
+
+
+def analyze(stimulus, captured, golden, n, bins, mag_tol_db=0.5, phase_tol_deg=5.0,
+            floor_db=-60.0, max_offset=64):
+    """
+       Function: analyze
+
+       Definition: Response of the UUT and of the model over the last full
+         period captured, and the tones outside the tolerance masks.
+
+       Args:
+         stimulus: Signed input samples.
+         captured: Signed output samples captured from the UUT.
+         golden: Signed model output for stimulus.
+         n: Samples per period.
+         bins: FFT bin of each tone.
+         mag_tol_db: Allowed magnitude difference.
+         phase_tol_deg: Allowed phase difference, pass band only.
+         floor_db: Pass band limit, relative to the golden peak.
+         max_offset: Largest capture offset searched.
+    """
+    if (captured.size < n + max_offset):
+        raise ValueError("Captured %d samples, at least %d are needed" % (captured.size, n + max_offset))
+    offset = find_offset(captured, golden, n, max_offset)
+    stop = min(captured.size, golden.size) - offset
+    x = stimulus[stop - n:stop].astype(np.float64)
+    h_uut  = response(x, captured[captured.size - n:].astype(np.float64), bins)
+    h_gold = response(x, golden[stop - n:stop].astype(np.float64), bins)
+
+    tiny = np.finfo(np.float64).tiny
+    uut_db  = 20.0 * np.log10(np.abs(h_uut) + tiny)
+    gold_db = 20.0 * np.log10(np.abs(h_gold) + tiny)
+    phase_error = np.degrees(np.angle(h_uut * np.conj(h_gold)))
+    limit = gold_db.max() + floor_db
+    passband = gold_db >= limit
+    mag_fail   = passband & (np.abs(uut_db - gold_db) > mag_tol_db)
+    phase_fail = passband & (np.abs(phase_error) > phase_tol_deg)
+    stop_fail  = ~passband & (uut_db > np.maximum(gold_db, limit) + mag_tol_db)
+
+    violations = []
+    for i in np.flatnonzero(mag_fail | phase_fail | stop_fail).tolist():
+        violations.append({"bin"          : int(bins[i]),
+                           "frequency"    : float(bins[i]) / n,
+                           "uut_db"       : float(uut_db[i]),
+                           "golden_db"    : float(gold_db[i]),
+                           "phase_error"  : float(phase_error[i]),
+                           "passband"     : bool(passband[i])})
+    return {"n"          : n,
+            "offset"     : offset,
+            "frequency"  : (bins / n).tolist(),
+            "uut_db"     : uut_db.tolist(),
+            "golden_db"  : gold_db.tolist(),
+            "uut_phase"  : np.degrees(np.angle(h_uut)).tolist(),
+            "golden_phase": np.degrees(np.angle(h_gold)).tolist(),
+            "passband"   : passband.tolist(),
+            "violations" : violations}
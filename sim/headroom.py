@@ -0,0 +1,385 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : headroom.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 18:24:50
+# Last modified : 2026/10/18 18:24:50
+# Project Name  : IIR Filter
+# Module Name   : headroom
+# Description   : Overflow and headroom analysis of coefficient sets.
+#
+# Additional Comments:
+#   Runs stimulus corpora through iir_filter_model_bank, every coefficient
+#   set in one bank, and rebuilds the value of each adder and multiplier of
+#   the RTL from the r_z2 history the model keeps. Each node is evaluated
+#   on the wrapped operands the RTL really sees, so a count is the number
+#   of clocks that node wrapped; the peak is the largest magnitude the
+#   node would have needed. Every sample is held SAMPLE_CLOCKS clocks on
+#   i_master_read_data as in iir_filter_model.process_stream, and the RTL
+#   steps on every clock, so nodes are rebuilt per clock. Nodes, per
+#   BiQuad and IIR_Filter:
+#
+#     w_a_product, w_b_product, w_c_product, w_d_product, w_product
+#     w_xa_acc = x + r_z0,  w_a_acc = r_z1 + a,  w_cd_acc = c + d
+#     w_accumulator (BiQuad output chain),  r_accumulator (chain + direct)
+#
+#   The recommended scaling is the smallest right shift of the input that
+#   runs every corpus without a wrap, found by running the model again.
+#   Headroom bits are floor(log2(limit/peak)) of the worst node, negative
+#   when that many bits are missing.
+#
+#     python headroom.py --sets sets.json --length 65536 --json report.json
+#################################################################################
+import sys
+import json
+import argparse
+import numpy as np
+from iir_filter_model import iir_filter_model_bank, to_signed, to_unsigned, SAMPLE_CLOCKS
+
+NODES = ("w_a_product", "w_b_product", "w_c_product", "w_d_product", "w_product",
+         "w_xa_acc", "w_a_acc", "w_cd_acc", "w_accumulator", "r_accumulator")
+
+CORPORA = ("noise", "steps", "nyquist", "chirp", "worst")
+
+
+def noise(n, data_msb, seed=1):
+    """
+       Function: noise
+
+       Definition: Uniform full scale white noise.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(-(1 << data_msb), 1 << data_msb, n, dtype=np.int64)
+
+
+def steps(n, data_msb, period=256):
+    """
+       Function: steps
+
+       Definition: Full scale square wave, the DC worst case of a low pass.
+    """
+    return np.where((np.arange(n) // (period // 2)) % 2 == 0, (1 << data_msb) - 1, -(1 << data_msb))
+
+
+def nyquist(n, data_msb):
+    """
+       Function: nyquist
+
+       Definition: Full scale alternating samples.
+    """
+    return np.where(np.arange(n) % 2 == 0, (1 << data_msb) - 1, -(1 << data_msb))
+
+
+def chirp(n, data_msb):
+    """
+       Function: chirp
+
+       Definition: Full scale linear chirp from DC to half the sample rate.
+    """
+    t = np.arange(n) / n
+    return np.round(((1 << data_msb) - 1) * np.sin(np.pi * 0.5 * n * t * t)).astype(np.int64)
+
+
+def worst_case(impulse_response, n, data_msb):
+    """
+       Function: worst_case
+
+       Definition: The full scale input that drives the output of a linear
+         filter with this impulse response to its largest value, repeated
+         with alternating sign to n samples.
+
+       Args:
+         impulse_response: Signed output for a unit impulse.
+         n: Samples returned.
+         data_msb: Most significant bit of the samples.
+    """
+    sequence = np.where(impulse_response[::-1] >= 0, (1 << data_msb) - 1, -(1 << data_msb))
+    sequence = np.concatenate((sequence, -sequence))
+    return np.resize(sequence, n)
+
+
+class headroom_analyzer():
+    """
+       Class: Headroom Analyzer
+
+       Definition: Peak magnitude and wrap count of every node, per
+         coefficient set.
+    """
+
+    def __init__(self, coefficient_sets, num_coefficients=13, data_msb=15, block_size=4096):
+        """
+           Function: new
+
+           Definition: Analyzer constructor.
+
+           Args:
+             coefficient_sets: (sets, P_NUM_COEFFICIENTS) signed or unsigned words.
+             num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+             data_msb: P_DATA_MSB of the RTL, up to 31 so products fit int64.
+             block_size: Samples per model block.
+        """
+        if (data_msb > 31):
+            raise ValueError("P_DATA_MSB up to 31 is supported, got %d" % data_msb)
+        self.words            = to_unsigned(np.atleast_2d(coefficient_sets), data_msb)
+        self.num_sets         = self.words.shape[0]
+        self.num_coefficients = num_coefficients
+        self.data_msb         = data_msb
+        self.high             = (1 << data_msb) - 1
+        self.low              = -(1 << data_msb)
+        self.model = iir_filter_model_bank(self.num_sets, num_coefficients, data_msb, block_size)
+        self.model.keep_history = True
+        self.block_size = self.model.block_size
+        c = to_signed(self.words, data_msb)
+        nb = self.model.num_biquads
+        self.c0 = c[:, 0:nb, np.newaxis]
+        self.c1 = c[:, 1:nb+1, np.newaxis]
+        self.c2 = c[:, 2:nb+2, np.newaxis]
+        self.c3 = c[:, 3:nb+3, np.newaxis]
+        self.cn = c[:, num_coefficients-1, np.newaxis]
+
+
+    def wrap(self, values):
+        """
+           Function: wrap
+
+           Definition: Signed values as seen on a P_DATA_MSB+1 bit bus.
+        """
+        half    = 1 << self.data_msb
+        wrapped = np.add(values, half)
+        np.bitwise_and(wrapped, (half << 1) - 1, out=wrapped)
+        wrapped -= half
+        return wrapped
+
+
+    def run(self, x):
+        """
+           Function: run
+
+           Definition: Runs signed samples x from reset, each held
+             SAMPLE_CLOCKS clocks, and returns {node: (peak, overflows)},
+             each an array over the sets.
+
+           Args:
+             x: Signed input samples.
+        """
+        self.model.reset()
+        self.model.load_coefficients(self.words)
+        peak = {node: np.zeros(self.num_sets, dtype=np.int64) for node in NODES}
+        wraps = {node: np.zeros(self.num_sets, dtype=np.int64) for node in NODES}
+        previous = np.zeros(2, dtype=np.int64)  # last two clocks, for r_multiplier1
+        x = np.repeat(np.asarray(x, dtype=np.int64).reshape(-1), SAMPLE_CLOCKS)
+        for start in range(0, x.size, self.block_size):
+            block = x[start:start + self.block_size]
+            self.model.process(block)
+            nodes = self.nodes(self.wrap(block), self.wrap(self.model.history.view(np.int64)), previous)
+            for node, values in nodes.items():
+                flat    = values.reshape(self.num_sets, -1)
+                highest = flat.max(axis=1)
+                lowest  = flat.min(axis=1)
+                peak[node] = np.maximum(peak[node], np.maximum(highest, -lowest))
+                # Only sets that wrapped somewhere need the count.
+                wrapped = np.flatnonzero((highest > self.high) | (lowest < self.low))
+                if (wrapped.size > 0):
+                    flat = flat[wrapped]
+                    wraps[node][wrapped] += np.count_nonzero((flat > self.high) | (flat < self.low), axis=1)
+            previous = np.concatenate((previous, self.wrap(block)))[-2:]
+        return {node: (peak[node], wraps[node]) for node in NODES}
+
+
+    def nodes(self, x, h, previous):
+        """
+           Function: nodes
+
+           Definition: Unwrapped value of every node for one block, from the
+             signed i_master_read_data x of each clock and the signed r_z2
+             history h (sets, biquads, clocks+3), h[k+3] being r_z2 after
+             clock k. Offsets are in clocks, at clock k:
+               a = c0*r_z2[k-1], b = c1*r_z2[k-1]
+               w_a_acc  = r_z1 + a = wrap(c1*r_z2[k-2]) + wrap(c0*r_z2[k-1])
+               w_xa_acc = x[k] + r_z0 = x[k] + wrap(w_a_acc[k-1])
+               w_cd_acc = c2*r_z3 + c3*r_z4 = wrap(c2*r_z2[k-2]) + wrap(c3*r_z2[k-3])
+             and r_accumulator adds the chain to r_multiplier1 = w_product[k-2],
+             previous holding x of the last two clocks of the block before.
+        """
+        n = x.size
+        a  = self.c0 * h[:, :, 2:n+2]
+        b  = self.c1 * h[:, :, 2:n+2]
+        c  = self.c2 * h[:, :, 1:n+1]
+        d  = self.c3 * h[:, :, 0:n]
+        w_a_acc  = self.wrap(self.c1 * h[:, :, 1:n+1]) + self.wrap(a)
+        w_xa_acc = x + self.wrap(self.wrap(self.c1 * h[:, :, 0:n]) + self.wrap(self.c0 * h[:, :, 1:n+1]))
+        w_cd_acc = self.wrap(c) + self.wrap(d)
+        # IIR_Filter sums the BiQuad outputs in a chain.
+        r_y = self.wrap(w_cd_acc)
+        chain = np.empty_like(r_y)
+        chain[:, 0] = r_y[:, 0]
+        for j in range(1, r_y.shape[1]):
+            chain[:, j] = self.wrap(chain[:, j-1]) + r_y[:, j]
+        product = self.cn * x
+        delayed = np.concatenate((previous, x))[:n]
+        r_accumulator = self.wrap(chain[:, -1]) + self.wrap(self.cn * delayed)
+        return {"w_a_product"  : a,
+                "w_b_product"  : b,
+                "w_c_product"  : c,
+                "w_d_product"  : d,
+                "w_product"    : product,
+                "w_xa_acc"     : w_xa_acc,
+                "w_a_acc"      : w_a_acc,
+                "w_cd_acc"     : w_cd_acc,
+                "w_accumulator": chain,
+                "r_accumulator": r_accumulator}
+
+
+    def impulse_responses(self, length):
+        """
+           Function: impulse_responses
+
+           Definition: Signed output of every set for a unit impulse, one
+             value per sample read on the last of its SAMPLE_CLOCKS clocks.
+        """
+        self.model.reset()
+        self.model.load_coefficients(self.words)
+        x = np.zeros(length, dtype=np.int64)
+        x[0] = 1
+        y = self.model.process(np.repeat(x, SAMPLE_CLOCKS))[:, SAMPLE_CLOCKS-1::SAMPLE_CLOCKS]
+        return to_signed(y, self.data_msb)
+
+
+    def corpus(self, name, n, shift=0, seed=1):
+        """
+           Function: corpus
+
+           Definition: Runs one corpus, input shifted right by shift bits.
+             The worst case corpus differs per set and runs each set alone.
+        """
+        if (name != "worst"):
+            x = {"noise"  : lambda: noise(n, self.data_msb, seed),
+                 "steps"  : lambda: steps(n, self.data_msb),
+                 "nyquist": lambda: nyquist(n, self.data_msb),
+                 "chirp"  : lambda: chirp(n, self.data_msb)}[name]()
+            return self.run(x >> shift)
+        responses = self.impulse_responses(min(n, 1024))
+        result = {node: (np.zeros(self.num_sets, dtype=np.int64), np.zeros(self.num_sets, dtype=np.int64))
+                  for node in NODES}
+        for i in range(self.num_sets):
+            single = headroom_analyzer(self.words[i], self.num_coefficients, self.data_msb, self.block_size)
+            stats = single.run(worst_case(responses[i], n, self.data_msb) >> shift)
+            for node in NODES:
+                result[node][0][i] = stats[node][0][0]
+                result[node][1][i] = stats[node][1][0]
+        return result
+
+
+    def analyze(self, corpora=CORPORA, n=65536, max_shift=8):
+        """
+           Function: analyze
+
+           Definition: Runs the corpora and finds the input shift each set
+             needs to run them all without wrapping.
+
+           Args:
+             corpora: Corpus names, see CORPORA.
+             n: Samples per corpus.
+             max_shift: Largest input shift tried.
+        """
+        per_corpus = {name: self.corpus(name, n) for name in corpora}
+        peak  = {node: np.max([per_corpus[c][node][0] for c in corpora], axis=0) for node in NODES}
+        wraps = {node: np.sum([per_corpus[c][node][1] for c in corpora], axis=0) for node in NODES}
+        total = np.sum([wraps[node] for node in NODES], axis=0)
+
+        # Smallest input shift without wraps, -1 when max_shift is not enough.
+        shift = np.where(total == 0, 0, -1)
+        for s in range(1, max_shift + 1):
+            pending = np.flatnonzero(shift < 0)
+            if (pending.size == 0):
+                break
+            subset = headroom_analyzer(self.words[pending], self.num_coefficients, self.data_msb, self.block_size)
+            count = np.zeros(pending.size, dtype=np.int64)
+            for name in corpora:
+                stats = subset.corpus(name, n, s)
+                count += np.sum([stats[node][1] for node in NODES], axis=0)
+            shift[pending[count == 0]] = s
+
+        worst = np.max([peak[node] for node in NODES], axis=0)
+        headroom_bits = np.floor(np.log2(self.high / np.maximum(worst, 1))).astype(np.int64)
+        return {"num_sets"     : self.num_sets,
+                "corpora"      : list(corpora),
+                "samples"      : n,
+                "limit"        : self.high,
+                "peak"         : {node: peak[node].tolist() for node in NODES},
+                "overflows"    : {node: wraps[node].tolist() for node in NODES},
+                "per_corpus"   : {c: {node: per_corpus[c][node][1].tolist() for node in NODES} for c in corpora},
+                "headroom_bits": headroom_bits.tolist(),
+                "input_shift"  : shift.tolist()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Overflow and headroom analysis of IIR Filter coefficient sets.")
+    parser.add_argument("--sets", default=None,
+                        help="JSON list of coefficient word lists, or one coefficient_designer cache file; "
+                             "default is the coefficient_designer default design")
+    parser.add_argument("--num-coefficients", type=int, default=13)
+    parser.add_argument("--data-msb", type=int, default=15)
+    parser.add_argument("--length", type=int, default=65536, help="samples per corpus")
+    parser.add_argument("--corpora", nargs="+", default=list(CORPORA), choices=CORPORA)
+    parser.add_argument("--max-shift", type=int, default=8)
+    parser.add_argument("--json", default=None, help="report file")
+    args = parser.parse_args(argv)
+
+    if (args.sets is None):
+        from coefficient_designer import design_coefficients
+        sets = [design_coefficients(data_msb=args.data_msb, num_coefficients=args.num_coefficients)]
+    else:
+        with open(args.sets, "r") as f:
+            sets = json.load(f)
+        if (isinstance(sets, dict)):
+            sets = [sets["words"]]
+
+    analyzer = headroom_analyzer(np.array(sets, dtype=np.int64), args.num_coefficients, args.data_msb)
+    report = analyzer.analyze(args.corpora, args.length, args.max_shift)
+    if (args.json is not None):
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
+
+    print("%6s %-14s %12s %10s %9s %6s" % ("set", "worst node", "peak/limit", "overflows", "headroom", "shift"))
+    for i in range(report["num_sets"]):
+        node = max(NODES, key=lambda k: report["peak"][k][i])
+        overflows = sum(report["overflows"][k][i] for k in NODES)
+        shift = report["input_shift"][i]
+        print("%6d %-14s %12.3f %10d %9d %6s" % (i, node, report["peak"][node][i] / report["limit"],
+              overflows, report["headroom_bits"][i], shift if shift >= 0 else ">%d" % args.max_shift))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
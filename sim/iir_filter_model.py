@@ -0,0 +1,592 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : iir_filter_model.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 09:12:40
+# Last modified : 2026/10/18 20:14:05
+# Project Name  : IIR Filter
+# Module Name   : iir_filter_model_bank, iir_filter_model
+# Description   : Bit exact, block based model of IIR_Filter.
+#
+# Additional Comments:
+#   One model step is one i_clk period as seen by the test bench. The negedge
+#   registers (BiQuad r_z0..r_z4, r_y, r_multiplier0/1 and r_accumulator)
+#   update first, then the posedge Multiplier registers sample the new values.
+#   The sample on i_master_read_data is stable across both edges because the
+#   drivers update it right after the rising edge.
+#
+#   All arithmetic is done on uint64 arrays. Only the low P_DATA_MSB+1 bits of
+#   every product and sum are used by the RTL, and those bits are not affected
+#   by the mod 2^64 wraparound of the uint64 operations.
+#
+#   iir_filter_model_bank steps several coefficient sets in lockstep. Its
+#   registers are (sets x biquads) arrays and every set sees the same samples.
+#
+#   The filter steps on every clock, not on every sample. o_master_read_stb
+#   and o_slave_read_ack toggle, so with both buses kept busy a sample is
+#   held on i_master_read_data for SAMPLE_CLOCKS clocks and the output is
+#   read on the last of them. iir_filter_clock_model follows the buses clock
+#   by clock for the predictor, iir_filter_model.process_stream is the same
+#   thing for a continuous stream.
+#################################################################################
+import numpy as np
+
+SAMPLE_CLOCKS = 2  # clocks per sample when the sample and read buses never stall
+
+
+def to_signed(values, data_msb):
+    """
+       Function: to_signed
+
+       Definition: Converts P_DATA_MSB+1 bit two's complement words into signed
+         integers.
+
+       Args:
+         values: Array of unsigned words.
+         data_msb: Most significant bit of the words.
+    """
+    width  = data_msb + 1
+    values = np.asarray(values, dtype=np.uint64)
+    if (width == 64):
+        return values.view(np.int64)
+    signed = values.astype(np.int64)
+    return np.where(signed >= (1 << data_msb), signed - (1 << width), signed)
+
+
+def to_unsigned(values, data_msb):
+    """
+       Function: to_unsigned
+
+       Definition: Converts signed or unsigned integers into P_DATA_MSB+1 bit
+         two's complement words, wrapping the same way the RTL buses do.
+
+       Args:
+         values: Array of integers.
+         data_msb: Most significant bit of the words.
+    """
+    values = np.asarray(values)
+    if (values.dtype.kind == 'u'):
+        words = values.astype(np.uint64)
+    else:
+        words = values.astype(np.int64).view(np.uint64)
+    return words & np.uint64((1 << (data_msb + 1)) - 1)
+
+
+class iir_filter_model_bank():
+    """
+       Class: IIR Filter Model Bank
+
+       Definition: Reproduces IIR_Filter, its BiQuad instances and Multipliers
+         bit for bit for several coefficient sets at once. Samples are
+         processed in blocks; the BiQuad feedback is solved with a parallel
+         prefix scan so no Python code runs per sample or per set.
+    """
+
+    def __init__(self, num_sets=1, num_coefficients=13, data_msb=15, block_size=16384,
+                 max_block_elements=1 << 21):
+        """
+           Function: new
+
+           Definition: Model constructor. Starts in the reset state.
+
+           Args:
+             num_sets: Number of coefficient sets stepped in lockstep.
+             num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+             data_msb: P_DATA_MSB of the RTL.
+             block_size: Maximum number of samples solved per scan.
+             max_block_elements: Bounds sets*biquads*samples held per scan.
+        """
+        self.num_sets         = num_sets
+        self.num_coefficients = num_coefficients
+        self.data_msb         = data_msb
+        self.num_biquads      = (num_coefficients - 1) // 4  # L_NUM_BIQUADS
+        self.mask             = np.uint64((1 << (data_msb + 1)) - 1)
+        # Banks at least this wide (sets*biquads) are solved in lockstep.
+        self.lockstep_width   = 24
+        # Keep the r_z2 history of the last block in self.history, see headroom.py
+        self.keep_history     = False
+        self.history          = None
+
+        if (num_sets < 1):
+            raise ValueError("At least one coefficient set is required, got %d" % num_sets)
+        if (self.num_biquads < 1):
+            raise ValueError("P_NUM_COEFFICIENTS must be at least 5, got %d" % num_coefficients)
+        if (data_msb < 0 or data_msb > 63):
+            raise ValueError("P_DATA_MSB must be within 0 and 63, got %d" % data_msb)
+
+        # Keep the scan working set bounded when many sets are evaluated.
+        per_sample = num_sets * self.num_biquads
+        self.block_size = max(64, min(block_size, max_block_elements // per_sample))
+
+        self.coefficients = np.zeros((num_sets, num_coefficients), dtype=np.uint64)
+        self.reset()
+
+
+    def reset(self):
+        """
+           Function: reset
+
+           Definition: Applies i_reset_sync. Clears every register, including
+             r_coefficients.
+        """
+        shape = (self.num_sets, self.num_biquads)
+        self.coefficients[:] = 0
+        # BiQuad delay registers
+        self.z0 = np.zeros(shape, dtype=np.uint64)
+        self.z1 = np.zeros(shape, dtype=np.uint64)
+        self.z2 = np.zeros(shape, dtype=np.uint64)
+        self.z3 = np.zeros(shape, dtype=np.uint64)
+        self.z4 = np.zeros(shape, dtype=np.uint64)
+        # BiQuad multiplier_a..d registered products, low bits only
+        self.pa = np.zeros(shape, dtype=np.uint64)
+        self.pb = np.zeros(shape, dtype=np.uint64)
+        self.pc = np.zeros(shape, dtype=np.uint64)
+        self.pd = np.zeros(shape, dtype=np.uint64)
+        # IIR_Filter registers
+        self.r_y           = np.zeros(shape, dtype=np.uint64)
+        self.p_top         = np.zeros(self.num_sets, dtype=np.uint64)  # multiplier product
+        self.r_multiplier0 = np.zeros(self.num_sets, dtype=np.uint64)
+        self.r_multiplier1 = np.zeros(self.num_sets, dtype=np.uint64)
+        self.r_accumulator = np.zeros(self.num_sets, dtype=np.uint64)
+
+
+    def write_coefficient(self, address, data, sets=slice(None)):
+        """
+           Function: write_coefficient
+
+           Definition: Writes r_coefficients[address]. The new value is used by
+             the products of the next processed step. Addresses outside of the
+             coefficient space are ignored like in the RTL.
+
+           Args:
+             address: i_slave_write_addr
+             data: i_slave_write_data
+             sets: Sets receiving the write, all of them by default.
+        """
+        if (0 <= address < self.num_coefficients):
+            self.coefficients[sets, address] = np.uint64(int(data) & int(self.mask))
+
+
+    def load_coefficients(self, coefficients, sets=slice(None)):
+        """
+           Function: load_coefficients
+
+           Definition: Writes the whole coefficient space at once.
+
+           Args:
+             coefficients: P_NUM_COEFFICIENTS signed or unsigned words, or one
+               row of them per selected set.
+             sets: Sets receiving the coefficients, all of them by default.
+        """
+        words = to_unsigned(coefficients, self.data_msb)
+        if (words.shape[-1:] != (self.num_coefficients,)):
+            raise ValueError("Expected %d coefficients per set, got %d" % (self.num_coefficients, words.shape[-1]))
+        self.coefficients[sets] = words
+
+
+    def process(self, samples):
+        """
+           Function: process
+
+           Definition: Runs one step per sample and returns the value of
+             o_slave_read_data after each step as unsigned words, one row per
+             coefficient set. The model state carries over between calls.
+
+           Args:
+             samples: i_master_read_data for each clock, signed or unsigned.
+        """
+        x   = to_unsigned(samples, self.data_msb).reshape(-1)
+        out = np.empty((self.num_sets, x.size), dtype=np.uint64)
+        for start in range(0, x.size, self.block_size):
+            stop = min(start + self.block_size, x.size)
+            out[:, start:stop] = self.process_block(x[start:stop])
+        return out
+
+
+    def process_block(self, x):
+        """
+           Function: process_block
+
+           Definition: Solves a block of steps with constant coefficients.
+
+           Args:
+             x: Unsigned uint64 samples, already masked.
+        """
+        n    = x.size
+        mask = self.mask
+        if (n == 0):
+            return np.empty((self.num_sets, 0), dtype=np.uint64)
+
+        # BiQuad[i] is wired to r_coefficients[i] through r_coefficients[i+3].
+        # Axes are (sets, biquads, samples).
+        nb = self.num_biquads
+        c  = self.coefficients
+        c0 = c[:, 0:nb, np.newaxis]
+        c1 = c[:, 1:nb+1, np.newaxis]
+        c2 = c[:, 2:nb+2, np.newaxis]
+        c3 = c[:, 3:nb+3, np.newaxis]
+        cn = c[:, self.num_coefficients-1, np.newaxis]
+
+        # First negedge uses the products registered before this block.
+        first = (self.z1 + self.pa, self.pb, x[0] + self.z0)
+        if (self.num_sets * nb < self.lockstep_width):
+            z0, z1, v2 = self.scan(x, first, c0, c1)
+        else:
+            z0, z1, v2 = self.lockstep(x, first, c0, c1)
+
+        # r_z2 history, oldest first: r_z4, r_z3, r_z2 before the block.
+        h = np.concatenate((self.z4[:, :, np.newaxis], self.z3[:, :, np.newaxis],
+                            self.z2[:, :, np.newaxis], v2), axis=2)
+        if (self.keep_history):
+            self.history = h
+
+        # r_y <= w_y, the sum of the multiplier_c and multiplier_d products.
+        r_y = np.empty((self.num_sets, nb, n), dtype=np.uint64)
+        r_y[:, :, 0]  = self.pc + self.pd
+        r_y[:, :, 1:] = c2*h[:, :, 2:n+1] + c3*h[:, :, 1:n]
+        r_y &= mask
+        w_accumulator = r_y.sum(axis=1, dtype=np.uint64)
+
+        # Direct path, multiplier -> r_multiplier0 -> r_multiplier1
+        p_top = (x * cn) & mask
+        r_multiplier0 = np.empty((self.num_sets, n), dtype=np.uint64)
+        r_multiplier0[:, 0]  = self.p_top
+        r_multiplier0[:, 1:] = p_top[:, :-1]
+        r_multiplier1 = np.empty((self.num_sets, n), dtype=np.uint64)
+        r_multiplier1[:, 0]  = self.r_multiplier0
+        r_multiplier1[:, 1:] = r_multiplier0[:, :-1]
+
+        # r_accumulator <= w_accumulator[L_NUM_BIQUADS-1] + r_multiplier1
+        r_accumulator = np.empty((self.num_sets, n), dtype=np.uint64)
+        r_accumulator[:, 0]  = self.r_y.sum(axis=1, dtype=np.uint64) + self.r_multiplier1
+        r_accumulator[:, 1:] = w_accumulator[:, :-1] + r_multiplier1[:, :-1]
+        r_accumulator &= mask
+
+        # Carry the registers into the next block.
+        self.z0 = z0
+        self.z1 = z1
+        self.z2 = v2[:, :, -1].copy()
+        self.z3 = h[:, :, n+1].copy()
+        self.z4 = h[:, :, n].copy()
+        self.pa = (c0[:, :, 0]*self.z2) & mask
+        self.pb = (c1[:, :, 0]*self.z2) & mask
+        self.pc = (c2[:, :, 0]*self.z3) & mask
+        self.pd = (c3[:, :, 0]*self.z4) & mask
+        self.r_y           = r_y[:, :, -1].copy()
+        self.p_top         = p_top[:, -1].copy()
+        self.r_multiplier0 = r_multiplier0[:, -1].copy()
+        self.r_multiplier1 = r_multiplier1[:, -1].copy()
+        self.r_accumulator = r_accumulator[:, -1].copy()
+
+        return r_accumulator
+
+
+    def scan(self, x, first, c0, c1):
+        """
+           Function: scan
+
+           Definition: Solves the BiQuad feedback of a block with a Hillis-Steele
+             prefix scan over (r_z0, r_z1, r_z2). Costs log2(block) passes over
+             the block and suits a few sets. Every negedge after the first one
+             is affine in the three registers:
+               r_z0 <= r_z1 + c0*r_z2, r_z1 <= c1*r_z2, r_z2 <= x + r_z0
+
+           Args:
+             x: Unsigned uint64 samples.
+             first: (r_z0, r_z1, r_z2) after the first negedge of the block.
+             c0, c1: coeff_00 and coeff_01 of every BiQuad, (sets, biquads, 1).
+        """
+        n     = x.size
+        mask  = self.mask
+        shape = (self.num_sets, self.num_biquads, n)
+        v0 = np.zeros(shape, dtype=np.uint64)
+        v1 = np.zeros(shape, dtype=np.uint64)
+        v2 = np.empty(shape, dtype=np.uint64)
+        v0[:, :, 0] = first[0]
+        v1[:, :, 0] = first[1]
+        v2[:, :, 0] = first[2]
+        v2[:, :, 1:] = x[1:]
+
+        zero = np.zeros_like(c0)
+        one  = np.ones_like(c0)
+        m = [[zero, one,  c0],
+             [zero, zero, c1],
+             [one,  zero, zero]]
+        # v[k] += M^d v[k-d]
+        d = 1
+        while (d < n):
+            a0 = v0[:, :, :-d]
+            a1 = v1[:, :, :-d]
+            a2 = v2[:, :, :-d]
+            n0 = m[0][0]*a0 + m[0][1]*a1 + m[0][2]*a2
+            n1 = m[1][0]*a0 + m[1][1]*a1 + m[1][2]*a2
+            n2 = m[2][0]*a0 + m[2][1]*a1 + m[2][2]*a2
+            v0[:, :, d:] += n0
+            v1[:, :, d:] += n1
+            v2[:, :, d:] += n2
+            m = [[(m[i][0]*m[0][j] + m[i][1]*m[1][j] + m[i][2]*m[2][j]) & mask
+                  for j in range(3)] for i in range(3)]
+            d = d * 2
+        v2 &= mask
+        return v0[:, :, -1] & mask, v1[:, :, -1] & mask, v2
+
+
+    def lockstep(self, x, first, c0, c1):
+        """
+           Function: lockstep
+
+           Definition: Solves the BiQuad feedback of a block one step at a time,
+             with every set and BiQuad updated together as one (sets, biquads)
+             array. Costs a handful of array operations per sample and suits
+             wide banks, where the scan would do log2(block) times more work.
+
+           Args:
+             x: Unsigned uint64 samples.
+             first: (r_z0, r_z1, r_z2) after the first negedge of the block.
+             c0, c1: coeff_00 and coeff_01 of every BiQuad, (sets, biquads, 1).
+        """
+        n    = x.size
+        mask = self.mask
+        c0   = c0[:, :, 0]
+        c1   = c1[:, :, 0]
+        history = np.empty((n, self.num_sets, self.num_biquads), dtype=np.uint64)
+        z0, z1, z2 = first
+        history[0] = z2
+        # Wraparound keeps the low bits exact, masking is left for the end.
+        samples = x.tolist()
+        for k in range(1, n):
+            z0, z1, z2 = z1 + c0*z2, c1*z2, z0 + samples[k]
+            history[k] = z2
+        v2 = np.ascontiguousarray(history.transpose(1, 2, 0)) & mask
+        return z0 & mask, z1 & mask, v2
+
+
+class iir_filter_model(iir_filter_model_bank):
+    """
+       Class: IIR Filter Model
+
+       Definition: Single coefficient set view of iir_filter_model_bank, the
+         model of the filter instantiated in the test bench.
+    """
+
+    def __init__(self, num_coefficients=13, data_msb=15, block_size=16384):
+        """
+           Function: new
+
+           Definition: Model constructor. Starts in the reset state.
+
+           Args:
+             num_coefficients: P_NUM_COEFFICIENTS of the RTL.
+             data_msb: P_DATA_MSB of the RTL.
+             block_size: Maximum number of samples solved per scan.
+        """
+        super().__init__(1, num_coefficients, data_msb, block_size)
+
+
+    def process(self, samples):
+        """
+           Function: process
+
+           Definition: Runs one step per sample and returns the value of
+             o_slave_read_data after each step as unsigned words.
+
+           Args:
+             samples: i_master_read_data for each clock, signed or unsigned.
+        """
+        return super().process(samples)[0]
+
+
+    def process_stream(self, samples):
+        """
+           Function: process_stream
+
+           Definition: Returns the output read after each sample when the
+             sample and read buses never stall: every sample is held for
+             SAMPLE_CLOCKS clocks and the output is read on the last one.
+
+           Args:
+             samples: i_master_read_data for each handshake, signed or unsigned.
+        """
+        x = np.repeat(to_unsigned(samples, self.data_msb).reshape(-1), SAMPLE_CLOCKS)
+        return self.process(x)[SAMPLE_CLOCKS-1::SAMPLE_CLOCKS]
+
+
+class iir_filter_clock_model():
+    """
+       Class: IIR Filter Clock Model
+
+       Definition: Steps an iir_filter_model_bank once per clock from the bus
+         events of the UUT. A sample stays on i_master_read_data until the
+         next handshake, the outputs are taken on the clocks of the read
+         acks. Clocks are buffered and solved a block at a time.
+    """
+
+    def __init__(self, bank, block_size=4096, emit=None):
+        """
+           Function: new
+
+           Definition: Clock model constructor.
+
+           Args:
+             bank: iir_filter_model_bank stepped by this model.
+             block_size: Clocks solved per model call.
+             emit: Called with the (sets, reads) outputs of every solved block.
+        """
+        self.bank       = bank
+        self.mask       = int(bank.mask)
+        self.samples    = np.zeros(block_size, dtype=np.uint64)  # i_master_read_data per clock
+        self.count      = 0     # clocks in the buffer
+        self.reads      = []    # buffer positions of the read acks
+        self.step       = None  # next clock to buffer, set by the first event after a reset
+        self.x          = 0     # sample held since the last handshake
+        self.emit       = emit
+        self.num_clocks = 0     # clocks solved
+
+
+    def reset(self):
+        """
+           Function: reset
+
+           Definition: Follows i_reset_sync. Buffered clocks are dropped, call
+             flush first to keep the predictions of their reads, and the bank
+             is reset, the clock count starts again at the next
+             event. Until then the registers and the held sample stay 0.
+        """
+        self.count = 0
+        self.reads = []
+        self.step  = None
+        self.x     = 0
+        self.bank.reset()
+
+
+    def advance(self, step):
+        """
+           Function: advance
+
+           Definition: Buffers the clocks before step with the held sample.
+
+           Args:
+             step: Clock of the next event.
+        """
+        if (self.step is None):
+            self.step = step
+        if (step < self.step):
+            raise ValueError("Bus event at clock %d after clock %d was buffered" % (step, self.step))
+        while (self.step < step):
+            n = min(step - self.step, self.samples.size - self.count)
+            self.samples[self.count:self.count+n] = self.x
+            self.count = self.count + n
+            self.step  = self.step + n
+            if (self.count == self.samples.size):
+                self.flush()
+
+
+    def sample(self, step, data):
+        """
+           Function: sample
+
+           Definition: A handshake on the sample bus. The sample is driven
+             right after the rising edge, the negedge of the same clock is the
+             first to use it.
+
+           Args:
+             step: Clock of the handshake.
+             data: i_master_read_data
+        """
+        self.advance(step)
+        self.x = int(data) & self.mask
+
+
+    def read(self, step):
+        """
+           Function: read
+
+           Definition: A read ack, o_slave_read_data holds the output of this
+             clock.
+
+           Args:
+             step: Clock of the ack.
+        """
+        self.advance(step)
+        self.samples[self.count] = self.x
+        self.reads.append(self.count)
+        self.count = self.count + 1
+        self.step  = self.step + 1
+        if (self.count == self.samples.size):
+            self.flush()
+
+
+    def write_coefficient(self, step, address, data, sets=slice(None)):
+        """
+           Function: write_coefficient
+
+           Definition: A coefficient write acked on the rising edge of step.
+             The products of that edge still use the old value.
+
+           Args:
+             step: Clock of the write ack.
+             address: i_slave_write_addr
+             data: i_slave_write_data
+             sets: Sets receiving the write.
+        """
+        self.advance(step)
+        self.flush()
+        self.bank.write_coefficient(address, data, sets)
+
+
+    def load_coefficients(self, coefficients, sets=slice(None)):
+        """
+           Function: load_coefficients
+
+           Definition: Writes the whole coefficient space between two clocks.
+        """
+        self.flush()
+        self.bank.load_coefficients(coefficients, sets)
+
+
+    def flush(self):
+        """
+           Function: flush
+
+           Definition: Solves the buffered clocks and emits the outputs of
+             the read acks among them.
+        """
+        if (self.count == 0):
+            return
+        out = self.bank.process(self.samples[:self.count])
+        self.num_clocks = self.num_clocks + self.count
+        reads = self.reads
+        self.count = 0
+        self.reads = []
+        if (len(reads) > 0 and self.emit is not None):
+            self.emit(out[:, reads])
@@ -33,38 +33,48 @@
 # File name     : iir_filter_predictor.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/05 20:08:35
-# Last modified : 2021/02/14 21:14:38
-# Project Name  : ORCs
+# Last modified : 2026/10/18 20:14:05
+# Project Name  : IIR Filter
 # Module Name   : iir_filter_predictor
-# Description   : Non Time Consuming R32I model.
+# Description   : Non Time Consuming IIR Filter model.
 #
 # Additional Comments:
+#   The UUT steps on every clock and a sample is held on i_master_read_data
+#   until the next handshake, two clocks when the bus never stalls. The
+#   predictor follows that with iir_filter_clock_model: the clock of every
+#   sample handshake, read ack and coefficient write is taken from the
+#   simulation time, the clocks in between are buffered with the held
+#   sample and solved in blocks by iir_filter_model_bank. A block is
+#   flushed when the buffer is full, before a coefficient write is applied,
+#   before a reset and at the end of the test.
 #
+#   Only the outputs of the read ack clocks are predicted, one per read,
+#   and each flushed block is written to block_ap as one array. Per sample
+#   response items are only created when something is connected to ap.
+#
+#   Alternative coefficient sets listed in tb_env_config.coefficient_hypotheses
+#   are stepped in lockstep with the programmed set, see iir_filter_model_bank.
 #################################################################################
 import cocotb
+import numpy as np
 from cocotb.triggers import *
+from cocotb.utils import get_sim_time
 from uvm.base import *
 from uvm.comps import *
 from uvm.tlm1 import *
 from uvm.macros import *
+from uvm.macros.uvm_tlm_defines import uvm_analysis_imp_decl
 from externals.Wishbone_Standard_Master.wb_standard_master_seq import *
+from iir_filter_model import *
 
-# Local defines
-LUI = 55
-AUIPC = 23
-JAL = 111
-JALR = 103
-BCC = 99
-RRO = 51
-RII = 19
-LCC = 3
-SCC = 35
+uvm_analysis_imp_coeff = uvm_analysis_imp_decl("_coeff")
+uvm_analysis_imp_read  = uvm_analysis_imp_decl("_read")
 
 class iir_filter_predictor(UVMSubscriber):
     """         
        Class: Predictor
         
-       Definition: Contains functions, tasks and methods of this agent's monitor.
+       Definition: Predicts the IIR Filter output for every sample sent to the UUT.
     """
 
     def __init__(self, name, parent=None):
@@ -72,26 +82,25 @@ class iir_filter_predictor(UVMSubscriber):
         """         
            Function: new
           
-           Definition: R32I Predictor constructor.
+           Definition: IIR Filter Predictor constructor.
 
            Args:
              name: This component's name.
              parent: NONE
         """
-        self.ap = None
-        self.num_items = 0
-        self.instruction = None
-        self.opcode = 0
-        self.fct3 = 0
-        self.fct7 = 0
-        self.rd = 0
-        self.rs1 = 0
-        self.rs2 = 0
-        self.signed_imm = 0
-        self.unsigned_imm = 0
-        self.pc = 0
-        self.regs = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-        self.tag = "iir_filter_predictor" + name
+        self.ap            = None
+        self.block_ap      = None  # predicted outputs, one array per block
+        self.hypothesis_ap = None  # predictions of the alternative coefficient sets
+        self.coeff_export  = None  # coefficient writes from the write agent
+        self.read_export   = None  # output reads from the read agent
+        self.cfg           = None  # tb_env_config, set by the environment
+        self.model         = None  # iir_filter_model_bank, set 0 follows the UUT
+        self.clock_model   = None  # iir_filter_clock_model stepping model per clock
+        self.period_ps     = 1000  # i_clk period
+        self.num_items     = 0
+        self.num_samples   = 0     # outputs predicted
+        self.next_summary  = 0     # num_samples of the next summary message
+        self.tag           = "iir_filter_predictor" + name
 
 
     def build_phase(self, phase):
@@ -99,12 +108,58 @@ class iir_filter_predictor(UVMSubscriber):
         """         
            Function: build_phase
           
-           Definition: Brings this agent's virtual interface.
+           Definition: Creates the analysis ports and the filter model.
 
            Args:
              phase: build_phase
         """
         self.ap = UVMAnalysisPort("ap", self)
+        self.block_ap = UVMAnalysisPort("block_ap", self)
+        self.hypothesis_ap = UVMAnalysisPort("hypothesis_ap", self)
+        self.coeff_export = uvm_analysis_imp_coeff("coeff_export", self)
+        self.read_export = uvm_analysis_imp_read("read_export", self)
+
+        hypotheses = self.cfg.coefficient_hypotheses
+        self.model = iir_filter_model_bank(1 + len(hypotheses), self.cfg.num_coefficients, self.cfg.data_msb)
+        self.clock_model = iir_filter_clock_model(self.model, self.cfg.model_block_size, self.send)
+        self.period_ps = int(round(self.cfg.clock_period_ns * 1000))
+        self.load_hypotheses()
+        self.next_summary = self.cfg.summary_interval
+
+
+    def load_hypotheses(self):
+        """         
+           Function: load_hypotheses
+          
+           Definition: Loads tb_env_config.coefficient_hypotheses into sets 1 and up.
+        """
+        if (len(self.cfg.coefficient_hypotheses) > 0):
+            self.model.load_coefficients(self.cfg.coefficient_hypotheses, slice(1, None))
+
+
+    def reset(self):
+        """         
+           Function: reset
+          
+           Definition: Follows a UUT reset. The reads acked before it are
+             solved and sent first, their outputs are already on their way to
+             the scoreboard, which realigns after this. Then the programmed
+             coefficients are cleared, the hypotheses are kept.
+        """
+        self.clock_model.flush()
+        self.clock_model.reset()
+        self.load_hypotheses()
+
+
+    def clock(self):
+        """         
+           Function: clock
+          
+           Definition: The clock of the current simulation time. Handshakes
+             right after a rising edge and acks on the falling edge that
+             follows it get the same clock.
+        """
+        return int(get_sim_time("ps")) // self.period_ps
 
    
     def write(self, t):
@@ -112,132 +167,114 @@ class iir_filter_predictor(UVMSubscriber):
            Function: write
           
            Definition: This function immediately receives the transaction sent to
-             the UUT by the agent. Decodes the instruction and generates a response
-             sent to the scoreboard. 
+             the UUT by the agent. The sample is the model input from this
+             clock until the next handshake.
 
            Args:
              t: wb_standard_master_seq (Sequence Item)
         """
-        #  Convert data_in from integer into a string array of binary characters.
-        #  Index 0 in the array is the MSB index 32 is the LSB.
-        self.instruction = f'{t.data_in:032b}'
-
-        #  Select the bit fields associate with the instruction's opcode
-        #  and convert to interger
-        self.opcode = int(self.instruction[26:32], 2)
-        uvm_info(self.tag, sv.sformatf("\n    OPCODE:  %d\n", self.opcode), UVM_LOW)
-
-        if (self.opcode == LUI):
-            #  Get rd and imm
-            self.rd = int(self.instruction[21:25], 2)
-            self.unsigned_imm = int(self.instruction[0:19] + '000000000000' , 2)
-            self.regs[self.rd] = self.unsigned_imm
-            uvm_info(self.tag, sv.sformatf("\n    OPCODE: LUI\n      Regs: %d", self.regs[self.rd]), UVM_LOW)
-
-            
-        if (self.opcode == AUIPC):
-            #  Get rd and imm
-            self.rd = int(self.instruction[21:25], 2)
-            self.unsigned_imm = int(self.instruction[0:19] + '000000000000' , 2)
-            self.regs[self.rd] = self.unsigned_imm + self.pc 
-            uvm_info(self.tag, sv.sformatf("\n    OPCODE: AUIPC\n      Regs: %d", self.regs[self.rd]), UVM_LOW)
-
-            
-        if (self.opcode == JAL):
-            #  Get rd and imm
-            self.rd = int(self.instruction[21:25], 2)
-            self.signed_imm = int(self.instruction[0] + self.instruction[13:20] + self.instruction[12] + self.instruction[1:11] + '0' , 2)
-            self.regs[self.rd] = self.pc + 4
-            uvm_info(self.tag, '\n    Got JAL', UVM_LOW)
-
+        self.clock_model.sample(self.clock(), t.data_in)
 
-        if (self.opcode == JALR):
-            #  Get rd and imm
-            self.rd = int(self.instruction[21:25], 2)
-            self.signed_imm = int(self.instruction[0] + self.instruction[13:20] + self.instruction[12] + self.instruction[1:11] + '0' , 2)
-            self.regs[self.rd] = self.pc + 4
-            uvm_info(self.tag, '\n    Got JALR', UVM_LOW)
 
+    def write_read(self, t):
+        """         
+           Function: write_read
+          
+           Definition: Receives the reads of the read agent. The output of
+             this clock is predicted.
 
-        if (self.opcode == BCC):
-            self.fct3 = int(self.instruction[17:19], 2)
-            uvm_info(self.tag, sv.sformatf("\n    OPCODE: BRANCH\n      FCT3: %d", self.fct3), UVM_LOW)
-
-            if (self.fct3 == 0):
-              if (self.regs[self.rs1] == self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got BRANCH, PASSED TEST EQ\n', UVM_LOW)
-
-            if (self.fct3 == 1):
-              if (self.regs[self.rs1] != self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got BRANCH, PASSED TEST NEQ\n', UVM_LOW)
-
-            if (self.fct3 == 4):
-              if (self.regs[self.rs1] < self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got BRANCH, PASSED TEST Less Than\n', UVM_LOW)
-
-            if (self.fct3 == 5):
-              if (self.regs[self.rs1] >= self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got BRANCH, PASSED TEST Greater or Equal\n', UVM_LOW)
-
-            if (self.fct3 == 6):
-              if (self.regs[self.rs1] < self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got BRANCH, PASSED Less Than UnSigned\n', UVM_LOW)
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        self.clock_model.read(self.clock())
 
-            if (self.fct3 == 5):
-              if (self.regs[self.rs1] >= self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got BRANCH, PASSED TEST Greater or Equal UnSigned\n', UVM_LOW)
 
+    def load_coefficients(self, words):
+        """         
+           Function: load_coefficients
+          
+           Definition: Programs the coefficients without bus writes, used when
+             the UUT registers are restored from a checkpoint.
 
-        if (self.opcode == RRO):
-            self.fct3 = int(self.instruction[12:14], 2)
-            if (self.fct3 == 0):
-              if (self.regs[self.rs1] == self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got RRO, PASSED TEST EQ', UVM_LOW)
+           Args:
+             words: P_NUM_COEFFICIENTS words.
+        """
+        self.clock_model.load_coefficients(words, slice(0, 1))
 
-            if (self.fct3 == 1):
-              if (self.regs[self.rs1] != self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got RRO, PASSED TEST NEQ', UVM_LOW)
 
-            if (self.fct3 == 4):
-              if (self.regs[self.rs1] < self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got RRO, PASSED TEST Less Than', UVM_LOW)
+    def write_coeff(self, t):
+        """         
+           Function: write_coeff
+          
+           Definition: Receives the coefficient writes seen by the write agent.
+             Clocks before the write are solved with the old coefficients.
 
-            if (self.fct3 == 5):
-              if (self.regs[self.rs1] >= self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got RRO, PASSED TEST Greater or Equal', UVM_LOW)
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        self.clock_model.write_coefficient(self.clock(), t.address, t.data_in, 0)
+        if (self.uvm_report_enabled(UVM_HIGH, UVM_INFO, self.tag)):
+            uvm_info(self.tag, sv.sformatf("\n    COEFFICIENT[%0d] = 0x%0h\n", t.address, t.data_in), UVM_HIGH)
 
-            if (self.fct3 == 6):
-              if (self.regs[self.rs1] < self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got RRO, PASSED Less Than UnSigned', UVM_LOW)
 
-            if (self.fct3 == 5):
-              if (self.regs[self.rs1] >= self.regs[self.rs2]):
-                  uvm_info(self.tag, '\n    Got RRO, PASSED TEST Greater or Equal UnSigned', UVM_LOW)
+    def flush(self):
+        """         
+           Function: flush
+          
+           Definition: Runs the buffered clocks through the model, the
+             predicted outputs go to send.
+        """
+        self.clock_model.flush()
 
-        if (self.opcode == RII):
-            uvm_info(self.tag, '\n    Got RII', UVM_LOW)
 
-        if (self.opcode == LCC):
-            uvm_info(self.tag, '\n    Got LCC', UVM_LOW)
+    def send(self, predicted):
+        """         
+           Function: send
+          
+           Definition: Sends the outputs predicted for a block of reads to
+             the scoreboard. The block and the hypotheses are sent as arrays,
+             (reads) and (hypotheses, reads).
 
-        if (self.opcode == SCC):
-            uvm_info(self.tag, '\n    Got SCC', UVM_LOW)
+           Args:
+             predicted: (sets, reads) array from iir_filter_clock_model.
+        """
+        self.num_samples = self.num_samples + predicted.shape[1]
+        if (self.cfg.summary_interval > 0 and self.num_samples >= self.next_summary):
+            self.next_summary = self.num_samples + self.cfg.summary_interval
+            if (self.uvm_report_enabled(UVM_MEDIUM, UVM_INFO, self.tag)):
+                uvm_info(self.tag, sv.sformatf("%0d samples predicted", self.num_samples), UVM_MEDIUM)
+        self.block_ap.write(predicted[0])
+        if (self.ap.size() > 0):
+            for data in predicted[0].tolist():
+                self.create_response(data)
+        if (self.model.num_sets > 1):
+            self.hypothesis_ap.write(predicted[1:])
+
+
+    def extract_phase(self, phase):
+        """         
+           Function: extract_phase
+          
+           Definition: Solves the clocks left in the buffer.
 
-        #self.create_response(t)
+           Args:
+             phase: extract_phase
+        """
+        self.flush()
 
    
-    def create_response(self, t):
+    def create_response(self, data):
         """         
            Function: create_response
           
-           Definition: Creates a response transaction and updates the pc counter. 
+           Definition: Creates a response transaction with a predicted output. 
 
            Args:
-             t: wb_standard_master_seq (Sequence Item)
+             data: Predicted o_slave_read_data value.
         """
-
-        tr = []
-        tr = t
+        tr = wb_standard_master_seq("predicted")
+        tr.data_in = data
+        self.num_items = self.num_items + 1
         self.ap.write(tr)
  
 
@@ -0,0 +1,124 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : iir_filter_seq_lib.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 15:04:39
+# Last modified : 2026/10/18 20:31:12
+# Project Name  : IIR Filter
+# Module Name   : coefficient_write_sequence, coefficient_load_sequence
+# Description   : IIR Filter specific sequences.
+#
+# Additional Comments:
+#
+#################################################################################
+from uvm import *
+from externals.Wishbone_Standard_Master.wb_standard_master_seq import *
+from coefficient_designer import *
+
+
+class coefficient_write_sequence(wb_standard_master_base_sequence):
+    """         
+       Class: Coefficient Write Sequence
+        
+       Definition: One item per coefficient write, address and data_in set
+         from a coefficient_writes() list or from a filter spec.
+    """
+    def __init__(self, name="coefficient_write_sequence"):
+        wb_standard_master_base_sequence.__init__(self, name)
+        self.writes         = []  # (address, data) pairs
+        self.stall          = 0
+        self.transmit_delay = 0
+
+
+    def load_design(self, spec=DEFAULT_SPEC, data_msb=15, frac_bits=None, num_coefficients=13):
+        """         
+           Function: load_design
+          
+           Definition: Sets the writes from design_coefficients (cached).
+
+           Args:
+             See design_coefficients.
+        """
+        self.writes = coefficient_writes(design_coefficients(spec, data_msb, frac_bits, num_coefficients))
+
+
+    async def body(self):
+        for address, data in self.writes:
+            req = wb_standard_master_seq("coefficient")
+            req.address        = address
+            req.data_in        = data
+            req.stall          = self.stall
+            req.transmit_delay = self.transmit_delay
+
+            await uvm_do_with(self, req) # start_item 
+
+
+uvm_object_utils(coefficient_write_sequence)
+
+
+class coefficient_load_sequence(wb_standard_master_base_sequence):
+    """         
+       Class: Coefficient Load Sequence
+        
+       Definition: Loads a whole coefficient vector as one burst item. A
+         write agent in initiator mode writes it back to back, one write
+         every write_cycles clocks.
+    """
+    def __init__(self, name="coefficient_load_sequence"):
+        wb_standard_master_base_sequence.__init__(self, name)
+        self.coefficients = []    # words by address
+        self.addresses    = None  # addresses of the words, None for 0, 1, 2...
+
+
+    def load_design(self, spec=DEFAULT_SPEC, data_msb=15, frac_bits=None, num_coefficients=13):
+        """         
+           Function: load_design
+          
+           Definition: Sets the coefficients from design_coefficients (cached).
+
+           Args:
+             See design_coefficients.
+        """
+        self.coefficients = design_coefficients(spec, data_msb, frac_bits, num_coefficients)
+        self.addresses    = None
+
+
+    async def body(self):
+        req = wb_standard_master_burst_seq("coefficients")
+        req.data      = [int(c) for c in self.coefficients]
+        req.addresses = list(range(len(req.data))) if self.addresses is None else list(self.addresses)
+
+        await uvm_do_with(self, req) # start_item 
+
+
+uvm_object_utils(coefficient_load_sequence)
@@ -33,13 +33,15 @@
 # File name     : iir_filter_tb_env.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/05 20:08:35
-# Last modified : 2021/02/14 21:14:13
+# Last modified : 2026/10/18 20:14:05
 # Project Name  : UVM Python Verification Library
 # Module Name   : iir_filter_tb_env
 # Description   : Memory Slave Interface  monitor.
 #
 # Additional Comments:
-#
+#   With CHANNELS > 1 (IIR_Filter_BANK) channel 0 is this environment and
+#   every other channel is a child environment channel_<k> built from
+#   cfg.channels, so all the channels are checked the same way.
 #################################################################################
 import cocotb
 from uvm.base import *
@@ -48,6 +50,11 @@ from uvm.macros import uvm_component_utils
 from externals.Wishbone_Standard_Master.wb_standard_master_agent import *
 from iir_filter_predictor import *
 from scoreboard_simple import *
+from scoreboard_stream import *
+from pcm_recorder import *
+from trace_window import *
+from profiler import *
+from transaction_recorder import *
 
 class iir_filter_tb_env(UVMEnv):
     """         
@@ -74,6 +81,11 @@ class iir_filter_tb_env(UVMEnv):
         self.scoreboard = None # scoreboard
         self.predictor = None  # passive
         self.f_cov = None      # functional coverage
+        self.recorder = None   # pcm_recorder, when cfg.output_path is set
+        self.tracer = None     # trace_window, when trace windows are recorded or replayed
+        self.profiler = None   # tb_profiler, when cfg.profile is set
+        self.transaction_recorders = []  # one per agent, when cfg.record_dir is set
+        self.channel_envs = []  # iir_filter_tb_env of channels 1 and up
         self.tag = "iir_filter_tb_env"
 
 
@@ -87,11 +99,12 @@ class iir_filter_tb_env(UVMEnv):
            Args:
              phase: build_phase
         """
-        arr = []
-        if (not UVMConfigDb.get(self, "", "tb_env_config", arr)):
-            uvm_fatal("iir_filter_TB_ENV/NoTbEnvConfig", "Test Bench config not found")
-        
-        self.cfg = arr[0]
+        # Channel environments get their config from the parent environment
+        if (self.cfg is None):
+            arr = []
+            if (not UVMConfigDb.get(self, "", "tb_env_config", arr)):
+                uvm_fatal("iir_filter_TB_ENV/NoTbEnvConfig", "Test Bench config not found")
+            self.cfg = arr[0]
 
         self.inst_agent = wb_standard_master_agent.type_id.create("inst_agent", self)
         self.inst_agent.cfg = self.cfg.inst_agent_cfg
@@ -103,11 +116,37 @@ class iir_filter_tb_env(UVMEnv):
         self.mem_write_agent.cfg = self.cfg.mem_write_agent_cfg
         
         self.predictor = iir_filter_predictor.type_id.create("predictor", self)
+        self.predictor.cfg = self.cfg
         #self.predictor = UVMRegPredictor.type_id.create("predictor", self)
         
         if (self.cfg.has_scoreboard):
             #self.scoreboard = scoreboard_simple.type_id.create("scoreboard", self)
-            self.scoreboard = UVMInOrderBuiltInComparator.type_id.create("scoreboard", self)
+            self.scoreboard = scoreboard_stream.type_id.create("scoreboard", self)
+            self.scoreboard.cfg = self.cfg
+
+        if (self.cfg.output_path is not None):
+            self.recorder = pcm_recorder.type_id.create("recorder", self)
+            self.recorder.cfg = self.cfg
+
+        if (self.cfg.trace_windows_out is not None or self.cfg.trace_windows_in is not None):
+            self.tracer = trace_window.type_id.create("tracer", self)
+            self.tracer.cfg = self.cfg
+
+        if (self.cfg.profile):
+            self.profiler = tb_profiler.type_id.create("profiler", self)
+            self.profiler.cfg = self.cfg
+
+        if (self.cfg.record_dir is not None):
+            for agent in ("inst_agent", "mem_read_agent", "mem_write_agent"):
+                recorder = transaction_recorder.type_id.create(agent + "_recorder", self)
+                recorder.cfg = self.cfg
+                recorder.file_name = agent + ".trn"
+                self.transaction_recorders.append(recorder)
+
+        for k, channel_cfg in enumerate(self.cfg.channels, 1):
+            channel_env = iir_filter_tb_env.type_id.create("channel_%0d" % k, self)
+            channel_env.cfg = channel_cfg
+            self.channel_envs.append(channel_env)
 
     
     def connect_phase(self, phase):
@@ -124,12 +163,75 @@ class iir_filter_tb_env(UVMEnv):
         if (self.cfg.has_scoreboard):
             # self.inst_agent.ap.connect(self.scoreboard.received_export)
             # self.predictor.ap.connect(self.scoreboard.analysis_export)
-            self.inst_agent.ap.connect(self.scoreboard.before_export)
-            self.predictor.ap.connect(self.scoreboard.after_export)
+            self.mem_read_agent.ap.connect(self.scoreboard.observed_export)
+            self.predictor.block_ap.connect(self.scoreboard.expected_export)
+            self.predictor.hypothesis_ap.connect(self.scoreboard.hypothesis_export)
+            self.mem_write_agent.ap.connect(self.scoreboard.coeff_export)
         
 
+        if (self.recorder is not None):
+            self.mem_read_agent.ap.connect(self.recorder.analysis_export)
+
+        if (self.tracer is not None):
+            self.mem_read_agent.ap.connect(self.tracer.analysis_export)
+            self.tracer.scoreboard = self.scoreboard
+
+        for agent, recorder in zip((self.inst_agent, self.mem_read_agent, self.mem_write_agent),
+                                   self.transaction_recorders):
+            agent.ap.connect(recorder.analysis_export)
+
         if (self.cfg.has_predictor):
             self.inst_agent.ap.connect(self.predictor.analysis_export)
+            self.mem_write_agent.ap.connect(self.predictor.coeff_export)
+            self.mem_read_agent.ap.connect(self.predictor.read_export)
         #self.inst_agent.ap.connect(self.predictor.bus_in)
 
+
+    def channel(self, k):
+        """         
+           Function: channel
+          
+           Definition: Environment of channel k, 0 is this one.
+
+           Args:
+             k: Channel of IIR_Filter_BANK.
+        """
+        return self if (k == 0) else self.channel_envs[k - 1]
+
+
+    def notify_reset(self):
+        """         
+           Function: notify_reset
+          
+           Definition: Call after resetting the UUT. Clears the model state and
+             makes the scoreboard find the output latency again, on every
+             channel.
+        """
+        # Predictor first, the reads before the reset are predicted before the
+        # scoreboard realigns.
+        if (self.cfg.has_predictor):
+            self.predictor.reset()
+        if (self.cfg.has_scoreboard):
+            self.scoreboard.notify_reset()
+        for channel_env in self.channel_envs:
+            channel_env.notify_reset()
+
+
+    def preload_coefficients(self, words):
+        """         
+           Function: preload_coefficients
+          
+           Definition: Call when the UUT coefficients were restored from a
+             checkpoint instead of written by the write agent.
+
+           Args:
+             words: P_NUM_COEFFICIENTS words, None leaves the model as is.
+        """
+        if (words is None):
+            return
+        if (self.cfg.has_predictor):
+            self.predictor.load_coefficients(words)
+        if (self.cfg.has_scoreboard):
+            self.scoreboard.notify_reset()
+
 uvm_component_utils(iir_filter_tb_env)
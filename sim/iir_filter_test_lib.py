@@ -33,7 +33,7 @@
 # File name     : iir_filter_test_lib.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/05 19:26:21
-# Last modified : 2021/02/14 21:14:33
+# Last modified : 2026/10/18 21:31:50
 # Project Name  : ORCs
 # Module Name   : iir_filter_test_lib
 # Description   : ORC_R32I Test Library
@@ -41,8 +41,10 @@
 # Additional Comments:
 #   Contains the test base and tests.
 #################################################################################
+import os
+import json
 import cocotb
-from cocotb.triggers import Timer
+from cocotb.triggers import Timer, ClockCycles, RisingEdge
 
 from uvm import *
 from externals.Wishbone_Standard_Master.wb_standard_master_seq import *
@@ -51,6 +53,13 @@ from externals.Wishbone_Standard_Master.wb_standard_master_config import *
 from tb_env_config import *
 from iir_filter_tb_env import *
 from iir_filter_predictor import *
+from stimulus_source import *
+from iir_filter_seq_lib import *
+from iir_filter_model import *
+from coefficient_designer import design_coefficients
+from frequency_response import *
+from sample_capture import *
+from checkpoint import *
 
 class iir_filter_test_base(UVMTest):
     """         
@@ -62,6 +71,7 @@ class iir_filter_test_base(UVMTest):
     def __init__(self, name="iir_filter_test_base", parent=None):
         super().__init__(name, parent)
         self.test_pass = True
+        self.err_msg = ""
         self.tb_env = None
         self.tb_env_config = None
         self.inst_agent_cfg = None
@@ -70,8 +80,6 @@ class iir_filter_test_base(UVMTest):
 
     def build_phase(self, phase):
         super().build_phase(phase)
-        # Enable transaction recording for everything
-        UVMConfigDb.set(self, "*", "recording_detail", UVM_FULL)
         # Create the reg block
         # self.reg_block = reg_block.type_id.create("reg_block", self)
         # self.reg_block.build()
@@ -81,49 +89,37 @@ class iir_filter_test_base(UVMTest):
         self.tb_env_config.has_scoreboard = True
         self.tb_env_config.has_predictor = True
         self.tb_env_config.has_functional_coverage = False
-        # Create the instruction agent
-        self.inst_agent_cfg = wb_standard_master_config.type_id.create("inst_agent_cfg", self)
-        arr = []
-        # Get the instruction interface created at top
-        if UVMConfigDb.get(None, "*", "vif", arr) is True:
-            UVMConfigDb.set(self, "*", "vif", arr[0])
-            # Make this agent's interface the interface connected at top
-            self.inst_agent_cfg.vif         = arr[0]
-            self.inst_agent_cfg.has_driver  = 1
-            self.inst_agent_cfg.has_monitor = 1
-        else:
-            uvm_fatal("NOVIF", "Could not get vif from config DB")
-
-        # Create the Mem Read agent
-        self.mem_read_agent_cfg = wb_standard_master_config.type_id.create("mem_read_agent_cfg", self)
-        arr = []
-        # Get the instruction interface created at top
-        if UVMConfigDb.get(None, "*", "vif_read", arr) is True:
-            UVMConfigDb.set(self, "*", "vif_read", arr[0])
-            # Make this agent's interface the interface connected at top
-            self.mem_read_agent_cfg.vif         = arr[0]
-            self.mem_read_agent_cfg.has_driver  = 1
-            self.mem_read_agent_cfg.has_monitor = 1
-        else:
-            uvm_fatal("NOVIF", "Could not get vif_read from config DB")
-
-        # Create the Mem Write agent
-        self.mem_write_agent_cfg = wb_standard_master_config.type_id.create("mem_write_agent_cfg", self)
-        arr = []
-        # Get the instruction interface created at top
-        if UVMConfigDb.get(None, "*", "vif_write", arr) is True:
-            UVMConfigDb.set(self, "*", "vif_write", arr[0])
-            # Make this agent's interface the interface connected at top
-            self.mem_write_agent_cfg.vif         = arr[0]
-            self.mem_write_agent_cfg.has_driver  = 1
-            self.mem_write_agent_cfg.has_monitor = 1
-        else:
-            uvm_fatal("NOVIF", "Could not get vif_write from config DB")
+        # Windowed waveform dumps, see trace_window.py
+        self.tb_env_config.trace_windows_out = cocotb.plusargs.get("TRACE_WINDOWS_OUT")
+        self.tb_env_config.trace_windows_in  = cocotb.plusargs.get("TRACE_WINDOWS_IN")
+        if ("TRACE_PRE_CYCLES" in cocotb.plusargs):
+            self.tb_env_config.trace_pre_cycles = int(cocotb.plusargs["TRACE_PRE_CYCLES"])
+        if ("TRACE_POST_CYCLES" in cocotb.plusargs):
+            self.tb_env_config.trace_post_cycles = int(cocotb.plusargs["TRACE_POST_CYCLES"])
+        # Transactions go to binary files (+RECORD_DIR) instead of UVM recording
+        self.tb_env_config.record_dir = cocotb.plusargs.get("RECORD_DIR")
+        # Component time accounting, see profiler.py
+        self.tb_env_config.profile      = "PROFILE" in cocotb.plusargs or "PROFILE_JSON" in cocotb.plusargs
+        self.tb_env_config.profile_path = cocotb.plusargs.get("PROFILE_JSON")
+        # Reset and coefficient load restored from +CHECKPOINT_DIR, see checkpoint.py
+        self.tb_env_config.checkpoint_dir = cocotb.plusargs.get("CHECKPOINT_DIR")
+        self.tb_env_config.build_key      = cocotb.plusargs.get("BUILD_KEY")
+        if (self.tb_env_config.checkpoint_dir is not None and self.tb_env_config.build_key is None):
+            uvm_warning(self.get_type_name(), "+CHECKPOINT_DIR without +BUILD_KEY, checkpoints are off, "
+                        "run with make CHECKPOINT=on")
+            self.tb_env_config.checkpoint_dir = None
+        # Create the instruction, Mem Read and Mem Write agents
+        self.inst_agent_cfg      = self.agent_config("inst_agent_cfg", "vif", pipelined=True)
+        self.mem_read_agent_cfg  = self.agent_config("mem_read_agent_cfg", "vif_read", reader=True)
+        self.mem_write_agent_cfg = self.agent_config("mem_write_agent_cfg", "vif_write", initiator=True)
 
         # Make this instruction agent the test bench config agent
         self.tb_env_config.inst_agent_cfg = self.inst_agent_cfg
         self.tb_env_config.mem_read_agent_cfg = self.mem_read_agent_cfg
         self.tb_env_config.mem_write_agent_cfg = self.mem_write_agent_cfg
+        # IIR_Filter_BANK channels 1 and up
+        for k in range(1, self.tb_env_config.num_channels):
+            self.tb_env_config.channels.append(self.channel_config(k))
         UVMConfigDb.set(self, "*", "tb_env_config", self.tb_env_config)
         # Create the test bench environment 
         self.tb_env = iir_filter_tb_env.type_id.create("tb_env", self)
@@ -132,12 +128,105 @@ class iir_filter_test_base(UVMTest):
         self.printer.knobs.depth = 4
 
 
+    def agent_config(self, name, vif_name, pipelined=False, initiator=False, reader=False):
+        """
+           Function: agent_config
+
+           Definition: Creates the config of an agent driving the interface
+             top put in the config DB under vif_name.
+
+           Args:
+             name: Name of the config.
+             vif_name: "vif", "vif_read" or "vif_write", with _<k> for channel k.
+             pipelined: Driver answers bursts.
+             initiator: Driver drives the bus.
+             reader: Driver strobes the bus and the slave answers.
+        """
+        agent_cfg = wb_standard_master_config.type_id.create(name, self)
+        arr = []
+        # Get the interface created at top
+        if UVMConfigDb.get(None, "*", vif_name, arr) is True:
+            UVMConfigDb.set(self, "*", vif_name, arr[0])
+            # Make this agent's interface the interface connected at top
+            agent_cfg.vif         = arr[0]
+            agent_cfg.has_driver  = 1
+            agent_cfg.has_monitor = 1
+            agent_cfg.pool_size   = 64
+            agent_cfg.pipelined   = pipelined
+            agent_cfg.initiator   = initiator
+            agent_cfg.reader      = reader
+        else:
+            uvm_fatal("NOVIF", "Could not get " + vif_name + " from config DB")
+        return agent_cfg
+
+
+    def channel_config(self, k):
+        """
+           Function: channel_config
+
+           Definition: tb_env_config of channel k of IIR_Filter_BANK. The
+             checking knobs are the ones of channel 0; recording, tracing,
+             profiling and checkpoints stay with channel 0. The coefficients
+             are None, channel 0's are loaded unless a test sets them.
+
+           Args:
+             k: Channel, 1 and up.
+        """
+        cfg = self.tb_env_config
+        channel_cfg = tb_env_config.type_id.create("tb_env_config_%0d" % k, self)
+        channel_cfg.inst_agent_cfg      = self.agent_config("inst_agent_cfg_%0d" % k, "vif_%0d" % k, pipelined=True)
+        channel_cfg.mem_read_agent_cfg  = self.agent_config("mem_read_agent_cfg_%0d" % k, "vif_read_%0d" % k,
+                                                            reader=True)
+        channel_cfg.mem_write_agent_cfg = self.agent_config("mem_write_agent_cfg_%0d" % k, "vif_write_%0d" % k,
+                                                            initiator=True)
+        for knob in ("has_scoreboard", "has_predictor", "has_functional_coverage", "num_coefficients",
+                     "data_msb", "model_block_size", "scoreboard_depth", "scoreboard_context",
+                     "scoreboard_max_failures", "scoreboard_align_window", "scoreboard_max_latency",
+                     "summary_interval", "clock_period_ns"):
+            setattr(channel_cfg, knob, getattr(cfg, knob))
+        channel_cfg.coefficient_hypotheses = list(cfg.coefficient_hypotheses)
+        if (cfg.record_dir is not None):
+            channel_cfg.record_dir = os.path.join(cfg.record_dir, "channel_%0d" % k)
+        channel_cfg.num_channels = 1
+        return channel_cfg
+
+
+    def channel_coefficients(self, k):
+        """
+           Function: channel_coefficients
+
+           Definition: Words loaded into channel k, channel 0's when the
+             channel has none of its own.
+
+           Args:
+             k: Channel of IIR_Filter_BANK.
+        """
+        channel_cfg = self.tb_env.channel(k).cfg
+        if (channel_cfg.coefficients is None):
+            return self.tb_env_config.coefficients
+        return channel_cfg.coefficients
+
+
     def end_of_elaboration_phase(self, phase):
         # Print topology
         uvm_info(self.get_type_name(),
             sv.sformatf("Printing the test topology :\n%s", self.sprint(self.printer)), UVM_LOW)
 
 
+    def check_phase(self, phase):
+        # The scoreboards finished their check, a channel that failed or
+        # compared nothing fails the test.
+        cfg = self.tb_env_config
+        if (not cfg.has_scoreboard):
+            return
+        for k in range(cfg.num_channels):
+            checker = self.tb_env.channel(k).scoreboard.checker
+            if (not checker.passed()):
+                self.test_pass = False
+                self.err_msg += "Channel %0d: %0d of %0d outputs compared, %0d mismatches\n" % (
+                    k, checker.num_compared, checker.num_observed, checker.num_mismatches)
+
+
     def report_phase(self, phase):
         if self.test_pass:
             uvm_info(self.get_type_name(), "** UVM TEST PASSED **", UVM_NONE)
@@ -154,64 +243,238 @@ class iir_filter_reg_test(iir_filter_test_base):
 
     def __init__(self, name="iir_filter_reg_test", parent=None):
         super().__init__(name, parent)
-        self.hex_instructions = []
-        self.fetched_instruction = None
-        self.count = 0
 
 
     async def run_phase(self, phase):
-        cocotb.fork(self.stimulate_inst_intfc())
-        cocotb.fork(self.stimulate_read_intfc())
-        cocotb.fork(self.stimulate_write_intfc())
+        phase.raise_objection(self, "stimulus")
+        await self.load_coefficients()
+        streams = []
+        for k in range(self.tb_env_config.num_channels):
+            cocotb.fork(self.stimulate_read_intfc(k))
+            streams.append(cocotb.fork(self.stimulate_inst_intfc(k)))
+        for stream in streams:
+            await stream
+        # Reads go on, the outputs of the last samples are read.
+        await ClockCycles(self.tb_env_config.mem_read_agent_cfg.vif.clk_i, 256)
+        phase.drop_objection(self, "stimulus")
+
+
+    async def load_coefficients(self):
+        """
+           Function: load_coefficients
+
+           Definition: Writes tb_env_config.coefficients, on every channel
+             at once, and waits for the writes to finish. With a checkpoint
+             directory the registers are restored from the checkpoint of the
+             same build, parameters and coefficients instead, or saved for
+             the next run.
+        """
+        cfg = self.tb_env_config
+        if (cfg.coefficients is None):
+            return
+        write_cfg = cfg.mem_write_agent_cfg
+        channel_words = [self.channel_coefficients(k) for k in range(1, cfg.num_channels)]
+        key = None
+        if (cfg.checkpoint_dir is not None):
+            key = checkpoint_key(cfg.build_key, cfg.num_coefficients, cfg.data_msb, cfg.coefficients,
+                                 channel_words)
+            state = load_checkpoint(cfg.checkpoint_dir, key)
+            if (state is not None):
+                await RisingEdge(write_cfg.vif.clk_i)
+                count = restore_registers(cocotb.top, state)
+                self.tb_env.preload_coefficients(cfg.coefficients)
+                for channel_env, words in zip(self.tb_env.channel_envs, channel_words):
+                    channel_env.preload_coefficients(words)
+                uvm_info(self.get_type_name(), sv.sformatf("Restored %0d registers from checkpoint %s",
+                    count, key[:12]), UVM_LOW)
+                return
+        # The sequence ends when the driver takes the item, wait for the writes.
+        writes = [cocotb.fork(self.stimulate_write_intfc(k)) for k in range(1, cfg.num_channels)]
+        await self.stimulate_write_intfc()
+        for write in writes:
+            await write
+        await ClockCycles(write_cfg.vif.clk_i, write_cfg.write_cycles * (len(cfg.coefficients) + 2))
+        if (key is not None):
+            save_checkpoint(cfg.checkpoint_dir, key, snapshot_registers(cocotb.top))
+            uvm_info(self.get_type_name(), sv.sformatf("Saved checkpoint %s", key[:12]), UVM_LOW)
 
     
-    async def stimulate_read_intfc(self):
-        mem_read_sqr = self.tb_env.mem_read_agent.sqr
+    async def stimulate_read_intfc(self, channel=0):
+        mem_read_sqr = self.tb_env.channel(channel).mem_read_agent.sqr
         
-        #  Create seq0
-        mem_read_seq0 = read_single_sequence("mem_read_seq0")
-        mem_read_seq0.data = 0 #
-        #
-        while True:
-            await mem_read_seq0.start(mem_read_sqr)
+        #  Strobe the read port until the test ends, the driver is in reader mode
+        mem_read_seq0 = read_stream_sequence("mem_read_seq0")
+        await mem_read_seq0.start(mem_read_sqr)
 
 
-    async def stimulate_write_intfc(self):
-        mem_write_sqr = self.tb_env.mem_write_agent.sqr
+    async def stimulate_write_intfc(self, channel=0):
+        mem_write_sqr = self.tb_env.channel(channel).mem_write_agent.sqr
+        coefficients  = self.channel_coefficients(channel)
         
-        #  Create seq0
-        mem_write_seq0 = write_single_sequence("mem_write_seq0")
-        #
-        while True:
-            await mem_write_seq0.start(mem_write_sqr)
+        if (coefficients is None):
+            return
+        #  Load all the coefficients back to back
+        mem_write_seq0 = coefficient_load_sequence("mem_write_seq0")
+        mem_write_seq0.coefficients = coefficients
+        await mem_write_seq0.start(mem_write_sqr)
 
 
-    async def stimulate_inst_intfc(self):
-        # Initial setup
-        self.read_hex()
-        slave_sqr = self.tb_env.inst_agent.sqr
+    async def stimulate_inst_intfc(self, channel=0):
+        # Initial setup, dhry.hex is converted to dhry.npy on first use
+        source = stimulus_source.from_hex('dhry.hex', stop=7600)
+        slave_sqr = self.tb_env.channel(channel).inst_agent.sqr
         
-        while (self.count < 7600):
-            # Fetch instruction
-            self.fetch_instruction(self.count)
-            #  Create seq0
-            slave_seq0 = read_single_sequence("slave_seq0")
-            slave_seq0.data = self.fetched_instruction
-            # Call the sequencer
-            await slave_seq0.start(slave_sqr)
-            self.count = self.count + 1
-
-
-    def read_hex(self):
-        f = open('dhry.hex', 'r+')
-        hex_inst_list = [line.split(' ') for line in f.readlines()]
-        #f'{6:08b}'
-        self.hex_instructions = []
-        for i,s in enumerate(hex_inst_list):
-            self.hex_instructions.append([i.strip() for i in s])
-
-    def fetch_instruction(self, count):
-        hex_string = self.hex_instructions[count][3] + self.hex_instructions[count][2] + self.hex_instructions[count][1] + self.hex_instructions[count][0]
-        self.fetched_instruction = int(hex_string, 16)
-
-uvm_component_utils(iir_filter_reg_test)
\ No newline at end of file
+        #  Stream the samples in bursts, the driver is in pipelined mode
+        slave_seq0 = stream_sequence("slave_seq0")
+        slave_seq0.samples = source
+        await slave_seq0.start(slave_sqr)
+
+uvm_component_utils(iir_filter_reg_test)
+
+class iir_filter_audio_test(iir_filter_reg_test):
+    """         
+       Class: Audio Test
+        
+       Definition: Streams an audio file through the filter and records the
+         output. Run with +UVM_TESTNAME=iir_filter_audio_test +AUDIO_IN=<file>
+         and optionally +AUDIO_OUT=<file> (default filtered.wav). Raw PCM
+         input is read as 16 bit mono.
+    """
+
+
+    def __init__(self, name="iir_filter_audio_test", parent=None):
+        super().__init__(name, parent)
+        self.source = None  # pcm_source
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        if ("AUDIO_IN" not in cocotb.plusargs):
+            uvm_fatal("NOAUDIO", "+AUDIO_IN=<file> is required by " + self.get_type_name())
+        self.source = pcm_source(cocotb.plusargs["AUDIO_IN"], self.tb_env_config.data_msb)
+        self.tb_env_config.output_path = cocotb.plusargs.get("AUDIO_OUT", "filtered.wav")
+        if (self.source.rate is not None):
+            self.tb_env_config.output_rate = self.source.rate
+
+
+    async def stimulate_inst_intfc(self, channel=0):
+        slave_sqr = self.tb_env.channel(channel).inst_agent.sqr
+        
+        #  Stream the recording in bursts, the driver is in pipelined mode
+        slave_seq0 = stream_sequence("slave_seq0")
+        slave_seq0.samples = self.source if (channel == 0) else pcm_source(cocotb.plusargs["AUDIO_IN"],
+                                                                           self.tb_env_config.data_msb)
+        await slave_seq0.start(slave_sqr)
+
+
+uvm_component_utils(iir_filter_audio_test)
+
+
+class iir_filter_sweep_test(iir_filter_reg_test):
+    """         
+       Class: Frequency Sweep Test
+        
+       Definition: Measures the magnitude and phase response of the UUT at
+         every tone of a periodic multi-tone stimulus in one run and checks it
+         against the response of the model. Plusargs: SWEEP_N (period,
+         default 4096), SWEEP_TONES (32), SWEEP_PERIODS (3), SWEEP_LEVEL (peak
+         over full scale, 0.25), SWEEP_MAG_TOL_DB (0.5), SWEEP_PHASE_TOL_DEG
+         (5), SWEEP_FLOOR_DB (-60) and SWEEP_JSON=<file> for the measured
+         response. Without tb_env_config.coefficients the default design of
+         coefficient_designer is loaded.
+    """
+
+
+    def __init__(self, name="iir_filter_sweep_test", parent=None):
+        super().__init__(name, parent)
+        self.n         = 4096
+        self.bins      = None  # tone bins
+        self.stimulus  = None  # signed samples
+        self.capture   = None  # sample_capture of the UUT output
+        self.report    = None  # frequency_response.analyze result
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        cfg = self.tb_env_config
+        args = cocotb.plusargs
+        self.n = int(args.get("SWEEP_N", 4096))
+        self.bins = tone_bins(self.n, int(args.get("SWEEP_TONES", 32)))
+        self.stimulus = multitone(self.n, self.bins, float(args.get("SWEEP_LEVEL", 0.25)),
+                                  cfg.data_msb, int(args.get("SWEEP_PERIODS", 3)))
+        if (cfg.coefficients is None):
+            cfg.coefficients = design_coefficients(data_msb=cfg.data_msb,
+                                                   num_coefficients=cfg.num_coefficients)
+        self.capture = sample_capture.type_id.create("capture", self)
+        self.capture.size = self.stimulus.size
+
+
+    def connect_phase(self, phase):
+        super().connect_phase(phase)
+        self.tb_env.mem_read_agent.ap.connect(self.capture.analysis_export)
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "sweep")
+        # Coefficients first, the golden output starts from them.
+        await self.load_coefficients()
+        # Channels 1 and up are checked by their scoreboards, only channel 0 is captured
+        for k in range(1, self.tb_env_config.num_channels):
+            cocotb.fork(self.stimulate_read_intfc(k))
+            cocotb.fork(self.stimulate_inst_intfc(k))
+        cocotb.fork(self.stimulate_read_intfc())
+        await self.stimulate_inst_intfc()
+        await ClockCycles(self.tb_env_config.mem_read_agent_cfg.vif.clk_i, 256)
+        phase.drop_objection(self, "sweep")
+
+
+    async def stimulate_inst_intfc(self, channel=0):
+        slave_sqr = self.tb_env.channel(channel).inst_agent.sqr
+
+        slave_seq0 = stream_sequence("slave_seq0")
+        slave_seq0.samples = to_unsigned(self.stimulus, self.tb_env_config.data_msb).tolist()
+        await slave_seq0.start(slave_sqr)
+
+
+    def check_phase(self, phase):
+        super().check_phase(phase)
+        cfg = self.tb_env_config
+        args = cocotb.plusargs
+        model = iir_filter_model(cfg.num_coefficients, cfg.data_msb)
+        model.load_coefficients(cfg.coefficients)
+        # Each sample is held by the RTL and read once, as the predictor steps it
+        golden = to_signed(model.process_stream(self.stimulus), cfg.data_msb)
+        captured = to_signed(self.capture.captured(), cfg.data_msb)
+        try:
+            self.report = analyze(self.stimulus, captured, golden, self.n, self.bins,
+                                  float(args.get("SWEEP_MAG_TOL_DB", 0.5)),
+                                  float(args.get("SWEEP_PHASE_TOL_DEG", 5.0)),
+                                  float(args.get("SWEEP_FLOOR_DB", -60.0)))
+        except ValueError as e:
+            self.test_pass = False
+            self.err_msg += str(e)
+            uvm_error(self.get_type_name(), str(e))
+            return
+        for v in self.report["violations"]:
+            uvm_error(self.get_type_name(), sv.sformatf("%s tone at %0.5f fs: UUT %0.2f dB, model %0.2f dB, phase error %0.2f deg",
+                "Pass band" if v["passband"] else "Stop band", v["frequency"], v["uut_db"], v["golden_db"], v["phase_error"]))
+        if (self.report["violations"]):
+            self.test_pass = False
+            self.err_msg += "%d of %d tones outside the response masks" % (len(self.report["violations"]), self.bins.size)
+
+
+    def report_phase(self, phase):
+        if (self.report is not None):
+            if ("SWEEP_JSON" in cocotb.plusargs):
+                with open(cocotb.plusargs["SWEEP_JSON"], "w") as f:
+                    json.dump(self.report, f, indent=1)
+            lines = ["    %10s %10s %10s %10s" % ("f/fs", "UUT dB", "model dB", "phase err")]
+            for f, u, g, p, q in zip(self.report["frequency"], self.report["uut_db"], self.report["golden_db"],
+                                     self.report["uut_phase"], self.report["golden_phase"]):
+                lines.append("    %10.5f %10.2f %10.2f %10.2f" % (f, u, g, (p - q + 180.0) % 360.0 - 180.0))
+            uvm_info(self.get_type_name(), "Frequency response, capture offset %d samples\n%s\n" % (
+                self.report["offset"], "\n".join(lines)), UVM_LOW)
+        super().report_phase(phase)
+
+
+uvm_component_utils(iir_filter_sweep_test)
@@ -0,0 +1,340 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : iir_filter_top_model.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 18:33:52
+# Last modified : 2026/10/18 18:33:52
+# Project Name  : IIR Filter
+# Module Name   : model_signal, iir_filter_top_model
+# Description   : Cycle accurate Python stand-in of IIR_Filter_TOP.
+#
+# Additional Comments:
+#   Every port of IIR_Filter_TOP is a model_signal with the handle surface
+#   the agents use: sig.value, sig.value.integer, sig <= value and sig == 1.
+#   The owner of the clock calls negedge() and posedge(), which run the
+#   always blocks of IIR_Filter, BiQuad and Multiplier on the values the
+#   inputs hold at that edge, like the simulator does with signals written
+#   by the test bench right after an edge.
+#
+#   The bus maps connect wb_standard_master_if to the ports, top.py uses
+#   them for the RTL and fast_mode.py for this model.
+#################################################################################
+
+# Agent interfaces on IIR_Filter_TOP
+BUS_MAP_INST = {"clk_i": "i_clk",
+                "rst_i": "i_reset_sync",
+                "adr_o": "adr_o",
+                "dat_i": "i_master_read_data",
+                "dat_o": "dat_o",
+                "we_o": "we_o",
+                "sel_o": "sel_o",
+                "stb_o": "o_master_read_stb",
+                "ack_i": "i_master_read_ack",
+                "cyc_o": "cyc_o",
+                "stall_i": "stall_i",
+                "tga_o": "tga_o",
+                "tgd_i": "tgd_i",
+                "tgd_o": "tgd_o",
+                "tgc_o": "tgc_o"}
+
+BUS_MAP_READ = {"clk_i": "i_clk",
+                "rst_i": "i_reset_sync",
+                "adr_o": "adr_o",
+                "dat_i": "o_slave_read_data",
+                "dat_o": "dat_o",
+                "we_o": "we_o",
+                "sel_o": "sel_o",
+                "stb_o": "i_slave_read_stb",
+                "ack_i": "o_slave_read_ack",
+                "cyc_o": "cyc_o",
+                "stall_i": "stall_i",
+                "tga_o": "tga_o",
+                "tgd_i": "tgd_i",
+                "tgd_o": "tgd_o",
+                "tgc_o": "tgc_o"}
+
+BUS_MAP_WRITE = {"clk_i": "i_clk",
+                 "rst_i": "i_reset_sync",
+                 "adr_o": "i_slave_write_addr",
+                 "dat_i": "i_slave_write_data",
+                 "dat_o": "dat_o",
+                 "we_o": "we_o",
+                 "sel_o": "o_master_write_sel",
+                 "stb_o": "i_slave_write_stb",
+                 "ack_i": "o_slave_write_ack",
+                 "cyc_o": "cyc_o",
+                 "stall_i": "stall_i",
+                 "tga_o": "tga_o",
+                 "tgd_i": "tgd_i",
+                 "tgd_o": "tgd_o",
+                 "tgc_o": "tgc_o"}
+
+
+class model_value(int):
+    """
+       Class: Model Value
+
+       Definition: Integer read from a model_signal, .integer like a cocotb
+         BinaryValue.
+    """
+
+    @property
+    def integer(self):
+        return int(self)
+
+
+class model_signal():
+    """
+       Class: Model Signal
+
+       Definition: One port of the stand-in. Writes are masked to the port
+         width and take effect at once, or when the scheduler that set
+         writes applies them.
+    """
+
+    def __init__(self, name, width=1):
+        """
+           Function: new
+
+           Definition: Signal constructor, starts at 0.
+
+           Args:
+             name: Port name.
+             width: Port width in bits.
+        """
+        self.name  = name
+        self.width = width
+        self.mask  = (1 << width) - 1
+        self.word  = 0
+        self.writes = None  # list of (signal, value) when a scheduler defers writes
+
+
+    @property
+    def value(self):
+        return model_value(self.word)
+
+
+    @value.setter
+    def value(self, value):
+        if (self.writes is not None):
+            self.writes.append((self, value))
+        else:
+            self.word = int(value) & self.mask
+
+
+    def __le__(self, value):
+        # sig <= value, the cocotb 1.x deposit
+        self.value = value
+
+
+    def __eq__(self, other):
+        return self.word == int(other)
+
+
+    def __ne__(self, other):
+        return self.word != int(other)
+
+
+    def __int__(self):
+        return self.word
+
+
+    __hash__ = object.__hash__
+
+
+    def __repr__(self):
+        return "%s=0x%x" % (self.name, self.word)
+
+
+class iir_filter_top_model():
+    """
+       Class: IIR Filter TOP Model
+
+       Definition: IIR_Filter_TOP at the port level, register for register.
+    """
+
+    def __init__(self, num_coefficients=13, addr_msb=3, data_msb=15):
+        """
+           Function: new
+
+           Definition: Stand-in constructor. Registers start at 0, hold
+             i_reset_sync high for a few clocks like on the RTL.
+
+           Args:
+             num_coefficients: P_NUM_COEFFICIENTS
+             addr_msb: P_ADDR_MSB
+             data_msb: P_DATA_MSB
+        """
+        self.num_coefficients = num_coefficients
+        self.num_biquads      = (num_coefficients - 1) // 4  # L_NUM_BIQUADS
+        self.data_msb         = data_msb
+        self.mask             = (1 << (data_msb + 1)) - 1
+        width = data_msb + 1
+
+        ports = (("i_clk", 1), ("i_reset_sync", 1),
+                 ("o_master_read_stb", 1), ("i_master_read_ack", 1), ("i_master_read_data", width),
+                 ("i_slave_read_stb", 1), ("o_slave_read_ack", 1), ("o_slave_read_data", width),
+                 ("i_slave_write_stb", 1), ("i_slave_write_addr", addr_msb + 1),
+                 ("i_slave_write_data", width), ("o_slave_write_ack", 1),
+                 ("adr_o", 16), ("dat_o", 16), ("we_o", 1), ("sel_o", 1), ("cyc_o", 1),
+                 ("stall_i", 1), ("tga_o", 1), ("tgd_i", 1), ("tgd_o", 1), ("tgc_o", 1),
+                 ("o_master_write_sel", 1))  # not a port, named by BUS_MAP_WRITE
+        for name, bits in ports:
+            setattr(self, name, model_signal(name, bits))
+        self.clear()
+
+
+    def clear(self):
+        """
+           Function: clear
+
+           Definition: Sets every register to 0, what i_reset_sync does over
+             a negedge and a posedge.
+        """
+        self.clear_negedge_registers()
+        self.clear_posedge_registers()
+        self.drive_outputs()
+
+
+    def clear_negedge_registers(self):
+        nb = self.num_biquads
+        # IIR_Filter
+        self.r_master_read_stb = 0
+        self.r_master_read_ack = 0
+        self.r_slave_read_ack  = 0
+        self.r_y               = [0] * nb
+        self.r_multiplier0     = 0
+        self.r_multiplier1     = 0
+        self.r_accumulator     = 0
+        # BiQuad
+        self.r_z0 = [0] * nb
+        self.r_z1 = [0] * nb
+        self.r_z2 = [0] * nb
+        self.r_z3 = [0] * nb
+        self.r_z4 = [0] * nb
+
+
+    def clear_posedge_registers(self):
+        nb = self.num_biquads
+        self.r_slave_write_ack = 0
+        self.r_coefficients    = [0] * self.num_coefficients
+        self.r_product   = 0         # multiplier
+        self.w_a_product = [0] * nb  # multiplier_a..d, low P_DATA_MSB+1 bits
+        self.w_b_product = [0] * nb
+        self.w_c_product = [0] * nb
+        self.w_d_product = [0] * nb
+
+
+    def negedge(self):
+        """
+           Function: negedge
+
+           Definition: The always @(negedge i_clk) blocks of IIR_Filter and
+             BiQuad.
+        """
+        if (self.i_reset_sync.word == 1):
+            self.clear_negedge_registers()
+            self.drive_outputs()
+            return
+
+        mask = self.mask
+        x    = self.i_master_read_data.word
+        # WB Master Read Process
+        self.r_master_read_ack = self.i_master_read_ack.word
+        self.r_master_read_stb = 1 if (self.i_slave_read_stb.word == 1 and self.r_master_read_stb == 0) else 0
+        # Delay Process, on the values before this edge
+        w_accumulator = 0
+        for y in self.r_y:
+            w_accumulator = w_accumulator + y
+        self.r_accumulator = (w_accumulator + self.r_multiplier1) & mask
+        self.r_multiplier1 = self.r_multiplier0
+        self.r_multiplier0 = self.r_product & mask
+        # BiQuads, w_cd_acc goes to r_y
+        for i in range(self.num_biquads):
+            self.r_y[i] = (self.w_c_product[i] + self.w_d_product[i]) & mask
+            w_xa_acc    = x + self.r_z0[i]
+            self.r_z0[i] = (self.r_z1[i] + self.w_a_product[i]) & mask
+            self.r_z1[i] = self.w_b_product[i]
+            self.r_z4[i] = self.r_z3[i]
+            self.r_z3[i] = self.r_z2[i]
+            self.r_z2[i] = w_xa_acc & mask
+        # WB Slave Read Process
+        self.r_slave_read_ack = 1 if (self.i_slave_read_stb.word == 1 and self.r_slave_read_ack == 0) else 0
+        self.drive_outputs()
+
+
+    def posedge(self):
+        """
+           Function: posedge
+
+           Definition: The always @(posedge i_clk) blocks, the Multiplier
+             registers and the coefficient write controls. The products use
+             the coefficients from before a write on the same edge.
+        """
+        if (self.i_reset_sync.word == 1):
+            self.clear_posedge_registers()
+            self.drive_outputs()
+            return
+
+        # Only the low P_DATA_MSB+1 bits of a product are used, those are the
+        # same for a signed and an unsigned multiply.
+        mask = self.mask
+        c    = self.r_coefficients
+        for i in range(self.num_biquads):
+            self.w_a_product[i] = (self.r_z2[i] * c[i]) & mask
+            self.w_b_product[i] = (self.r_z2[i] * c[i+1]) & mask
+            self.w_c_product[i] = (self.r_z3[i] * c[i+2]) & mask
+            self.w_d_product[i] = (self.r_z4[i] * c[i+3]) & mask
+        self.r_product = (self.i_master_read_data.word * c[self.num_coefficients-1]) & mask
+
+        # Register Space Write Controls
+        if (self.i_slave_write_stb.word == 1 and self.r_slave_write_ack == 0):
+            address = self.i_slave_write_addr.word
+            if (address < self.num_coefficients):
+                c[address] = self.i_slave_write_data.word
+            self.r_slave_write_ack = 1
+        else:
+            self.r_slave_write_ack = 0
+        self.drive_outputs()
+
+
+    def drive_outputs(self):
+        """
+           Function: drive_outputs
+
+           Definition: Continuous assignments of the output ports.
+        """
+        self.o_master_read_stb.word = self.r_master_read_stb
+        self.o_slave_read_ack.word  = self.r_slave_read_ack
+        self.o_slave_read_data.word = self.r_accumulator
+        self.o_slave_write_ack.word = self.r_slave_write_ack
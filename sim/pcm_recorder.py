@@ -0,0 +1,167 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : pcm_recorder.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 14:18:51
+# Last modified : 2026/10/18 14:18:51
+# Project Name  : IIR Filter
+# Module Name   : pcm_recorder
+# Description   : Writes the UUT output samples to an audio file.
+#
+# Additional Comments:
+#   Samples are buffered and appended to the file a block at a time, memory
+#   use does not depend on the length of the run. The data_msb + 1 bit
+#   samples are left aligned into the smallest PCM width that holds them,
+#   the inverse of pcm_source.
+#################################################################################
+import wave
+import numpy as np
+from uvm.base import *
+from uvm.comps import *
+from uvm.macros import *
+from iir_filter_model import to_signed
+
+
+def samples_to_pcm(values, data_msb, sample_width):
+    """
+       Function: samples_to_pcm
+
+       Definition: Encodes two's complement samples as little endian PCM.
+
+       Args:
+         values: data_msb + 1 bit samples.
+         data_msb: Most significant bit of the samples.
+         sample_width: Bytes per PCM sample, 2, 3 or 4.
+    """
+    value = to_signed(values, data_msb) << (8 * sample_width - data_msb - 1)
+    raw = value.astype("<i8").view(np.uint8).reshape(-1, 8)[:, :sample_width]
+    return raw.tobytes()
+
+
+class pcm_recorder(UVMSubscriber):
+    """         
+       Class: PCM Recorder
+        
+       Definition: Records o_slave_read_data into a WAV or raw PCM file.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """         
+           Function: new
+          
+           Definition: Recorder constructor.
+
+           Args:
+             name: This component's name.
+             parent: Parent component.
+        """
+        self.cfg          = None  # tb_env_config, set by the environment
+        self.file         = None  # wave writer or binary file
+        self.samples      = None  # block buffer
+        self.count        = 0     # samples in the block buffer
+        self.num_samples  = 0     # samples written
+        self.sample_width = 2     # bytes per PCM sample
+        self.tag          = "pcm_recorder" + name
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        """         
+           Function: build_phase
+          
+           Definition: Opens the output file.
+
+           Args:
+             phase: build_phase
+        """
+        self.sample_width = max(2, (self.cfg.data_msb + 8) // 8)
+        self.samples = np.zeros(self.cfg.model_block_size, dtype=np.uint64)
+        path = self.cfg.output_path
+        if (path.lower().endswith(".wav")):
+            self.file = wave.open(path, "wb")
+            self.file.setnchannels(1)
+            self.file.setsampwidth(self.sample_width)
+            self.file.setframerate(self.cfg.output_rate)
+        else:
+            self.file = open(path, "wb")
+
+
+    def write(self, t):
+        """         
+           Function: write
+          
+           Definition: Buffers one output sample.
+
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        self.samples[self.count] = t.data_in
+        self.count = self.count + 1
+        if (self.count == self.samples.size):
+            self.flush()
+
+
+    def flush(self):
+        """         
+           Function: flush
+          
+           Definition: Appends the buffered samples to the file.
+        """
+        if (self.count == 0):
+            return
+        frames = samples_to_pcm(self.samples[:self.count], self.cfg.data_msb, self.sample_width)
+        if (isinstance(self.file, wave.Wave_write)):
+            self.file.writeframes(frames)
+        else:
+            self.file.write(frames)
+        self.num_samples = self.num_samples + self.count
+        self.count = 0
+
+
+    def extract_phase(self, phase):
+        """         
+           Function: extract_phase
+          
+           Definition: Writes the last samples and closes the file.
+
+           Args:
+             phase: extract_phase
+        """
+        self.flush()
+        self.file.close()
+        uvm_info(self.tag, sv.sformatf("%0d samples written to %s", self.num_samples,
+            self.cfg.output_path), UVM_LOW)
+
+
+uvm_component_utils(pcm_recorder)
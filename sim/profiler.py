@@ -0,0 +1,279 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : profiler.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 17:14:52
+# Last modified : 2026/10/18 17:14:52
+# Project Name  : IIR Filter
+# Module Name   : profiler
+# Description   : Wall time spent in each test bench component.
+#
+# Additional Comments:
+#   Enabled with tb_env_config.profile (+PROFILE). At end of elaboration the
+#   run_phase and the write/write_* methods of every component are replaced,
+#   on the instance only, by timed versions. A run_phase is timed on each
+#   resume, between two awaits, and every resume counts as an awakening.
+#   Time spent in a nested write (a monitor's ap.write reaching the
+#   predictor) is charged to the write and not to its caller. Nothing is
+#   wrapped when profiling is off.
+#################################################################################
+import json
+import time
+from uvm.base import *
+from uvm.comps import *
+from uvm.macros import *
+
+
+class profile_entry():
+    """
+       Class: Profile Entry
+
+       Definition: Counters of one component method.
+    """
+
+    __slots__ = ("name", "calls", "awakenings", "total", "children")
+
+    def __init__(self, name):
+        self.name       = name
+        self.calls      = 0    # calls, or coroutines started for run_phase
+        self.awakenings = 0    # coroutine resumes
+        self.total      = 0.0  # seconds inside the method
+        self.children   = 0.0  # seconds of that inside profiled nested calls
+
+
+class timed_awaitable():
+    """
+       Class: Timed Awaitable
+
+       Definition: Steps a coroutine for the coroutine awaiting it and times
+         every step. The triggers it yields go to the scheduler unchanged.
+    """
+
+    def __init__(self, profiler, entry, coro):
+        self.profiler = profiler
+        self.entry    = entry
+        self.coro     = coro
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, value):
+        start = self.profiler.enter(self.entry)
+        try:
+            return self.coro.send(value)
+        finally:
+            self.entry.awakenings += 1
+            self.profiler.leave(self.entry, start)
+
+    def throw(self, *args):
+        start = self.profiler.enter(self.entry)
+        try:
+            return self.coro.throw(*args)
+        finally:
+            self.entry.awakenings += 1
+            self.profiler.leave(self.entry, start)
+
+    def close(self):
+        self.coro.close()
+
+
+class tb_profiler(UVMComponent):
+    """
+       Class: Test Bench Profiler
+
+       Definition: Instruments the components of the test and prints a flat
+         profile at report_phase.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Profiler constructor.
+
+           Args:
+             name: This component's name.
+             parent: Parent component.
+        """
+        self.cfg     = None  # tb_env_config, set by the environment
+        self.entries = {}    # "component.method" -> profile_entry
+        self.stack   = []    # entries being executed, innermost last
+        self.start   = None  # wall clock at start of simulation
+        self.stop    = None  # wall clock at extract
+        self.tag     = "tb_profiler" + name
+
+
+    def end_of_elaboration_phase(self, phase):
+        """
+           Function: end_of_elaboration_phase
+
+           Definition: Instruments every component of the test.
+
+           Args:
+             phase: end_of_elaboration_phase
+        """
+        self.instrument(UVMRoot.get())
+
+
+    def start_of_simulation_phase(self, phase):
+        self.start = time.perf_counter()
+
+
+    def extract_phase(self, phase):
+        self.stop = time.perf_counter()
+
+
+    def instrument(self, component):
+        """
+           Function: instrument
+
+           Definition: Wraps the run_phase and the write methods of component
+             and of its children.
+
+           Args:
+             component: Root of the tree to instrument.
+        """
+        if (component is not self and not isinstance(component, UVMRoot)):
+            name = component.get_full_name()
+            if (type(component).run_phase is not UVMComponent.run_phase):
+                component.run_phase = self.wrap_task(self.entry(name + ".run_phase"), component.run_phase)
+            for attr in dir(type(component)):
+                if (attr == "write" or attr.startswith("write_")):
+                    method = getattr(component, attr)
+                    if (callable(method)):
+                        setattr(component, attr, self.wrap_call(self.entry(name + "." + attr), method))
+        children = []
+        component.get_children(children)
+        for child in children:
+            self.instrument(child)
+
+
+    def entry(self, name):
+        if (name not in self.entries):
+            self.entries[name] = profile_entry(name)
+        return self.entries[name]
+
+
+    def enter(self, entry):
+        self.stack.append(entry)
+        return time.perf_counter()
+
+
+    def leave(self, entry, start):
+        elapsed = time.perf_counter() - start
+        self.stack.pop()
+        entry.total += elapsed
+        if (self.stack):
+            self.stack[-1].children += elapsed
+
+
+    def wrap_call(self, entry, method):
+        """
+           Function: wrap_call
+
+           Definition: Timed version of a plain method.
+        """
+        def profiled(*args, **kwargs):
+            entry.calls += 1
+            start = self.enter(entry)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.leave(entry, start)
+        return profiled
+
+
+    def wrap_task(self, entry, method):
+        """
+           Function: wrap_task
+
+           Definition: Timed version of a coroutine method. It is still a
+             coroutine function, the phase forks it as before.
+        """
+        async def profiled(*args, **kwargs):
+            entry.calls += 1
+            return await timed_awaitable(self, entry, method(*args, **kwargs))
+        return profiled
+
+
+    def profile(self):
+        """
+           Function: profile
+
+           Definition: Entries that ran, by self time, as dicts.
+        """
+        rows = [{"name"      : e.name,
+                 "calls"     : e.calls,
+                 "awakenings": e.awakenings,
+                 "total_s"   : e.total,
+                 "self_s"    : e.total - e.children}
+                for e in self.entries.values() if (e.calls > 0 or e.awakenings > 0)]
+        return sorted(rows, key=lambda r: r["self_s"], reverse=True)
+
+
+    def report_phase(self, phase):
+        """
+           Function: report_phase
+
+           Definition: Prints the flat profile, and writes it to
+             cfg.profile_path when set.
+
+           Args:
+             phase: report_phase
+        """
+        rows = self.profile()
+        wall = 0.0
+        if (self.start is not None):
+            wall = (self.stop or time.perf_counter()) - self.start
+        accounted = sum(r["self_s"] for r in rows)
+        lines = ["    %-56s %9s %11s %10s %10s %6s" % ("component.method", "calls", "awakenings",
+                                                      "total s", "self s", "%")]
+        for r in rows:
+            lines.append("    %-56s %9d %11d %10.3f %10.3f %5.1f%%" % (r["name"], r["calls"],
+                r["awakenings"], r["total_s"], r["self_s"], 100.0 * r["self_s"] / wall if wall > 0 else 0.0))
+        lines.append("    %.3f s of %.3f s run time in the components, the rest is the simulator and scheduler"
+                     % (accounted, wall))
+        uvm_info(self.tag, "Flat profile\n" + "\n".join(lines) + "\n", UVM_NONE)
+        if (self.cfg.profile_path is not None):
+            with open(self.cfg.profile_path, "w") as f:
+                json.dump({"wall_time_s": wall, "entries": rows}, f, indent=1)
+
+
+uvm_component_utils(tb_profiler)
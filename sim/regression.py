@@ -0,0 +1,290 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : regression.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 15:44:10
+# Last modified : 2026/10/18 16:09:37
+# Project Name  : IIR Filter
+# Module Name   : regression
+# Description   : Parallel regression runner.
+#
+# Additional Comments:
+#   Every (test, seed, P_NUM_COEFFICIENTS, P_DATA_MSB) combination is one
+#   make run of this directory's Makefile in its own build directory, up to
+#   --jobs at a time. The parameters reach the RTL as top level overrides and
+#   the test bench through the environment (see tb_env_config). Pass/fail is
+#   read from each job's results.xml and everything is written to one JSON
+#   report. Compiled models come from build_cache, jobs that only differ in
+#   test or seed share one build.
+#
+#     python regression.py --tests iir_filter_reg_test --seeds 1 2 3 4 \
+#                          --num-coefficients 9 13 --data-msb 15 23
+#################################################################################
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import subprocess
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from build_cache import build_cache
+
+SIM_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def addr_msb(num_coefficients):
+    """
+       Function: addr_msb
+
+       Definition: P_ADDR_MSB that addresses num_coefficients registers.
+    """
+    return max((num_coefficients - 1).bit_length(), 1) - 1
+
+
+def parameter_args(sim, parameters):
+    """
+       Function: parameter_args
+
+       Definition: Simulator arguments overriding the top level parameters.
+
+       Args:
+         sim: SIM of the cocotb makefiles.
+         parameters: dict of parameter name to value.
+    """
+    if (sim == "icarus"):
+        return " ".join("-PIIR_Filter_TOP.%s=%d" % p for p in sorted(parameters.items()))
+    return " ".join("-G%s=%d" % p for p in sorted(parameters.items()))
+
+
+def parse_results(path):
+    """
+       Function: parse_results
+
+       Definition: Reads a cocotb results.xml. Returns (passed, testcases,
+         sim_time_ns), passed is False when no testcase ran.
+    """
+    if (not os.path.exists(path)):
+        return False, [], 0.0
+    testcases = []
+    for case in ET.parse(path).getroot().iter("testcase"):
+        failed = case.find("failure") is not None or case.find("error") is not None
+        testcases.append({"name"       : case.get("name"),
+                          "passed"     : not failed,
+                          "sim_time_ns": float(case.get("sim_time_ns", 0.0))})
+    passed = len(testcases) > 0 and all(t["passed"] for t in testcases)
+    return passed, testcases, sum(t["sim_time_ns"] for t in testcases)
+
+
+class regression_job():
+    """
+       Class: Regression Job
+
+       Definition: One simulation of the regression matrix.
+    """
+
+    def __init__(self, test, seed, num_coefficients, data_msb, out_dir, sim="verilator", cache=None):
+        """
+           Function: new
+
+           Definition: Job constructor.
+
+           Args:
+             test: UVM test name, passed as +UVM_TESTNAME.
+             seed: RANDOM_SEED of cocotb.
+             num_coefficients: P_NUM_COEFFICIENTS.
+             data_msb: P_DATA_MSB.
+             out_dir: Regression directory, the job gets a subdirectory.
+             sim: SIM of the cocotb makefiles.
+             cache: build_cache the model is taken from, None to always build.
+        """
+        self.test             = test
+        self.seed             = seed
+        self.num_coefficients = num_coefficients
+        self.data_msb         = data_msb
+        self.sim              = sim
+        self.name             = "%s_s%d_n%d_w%d" % (test, seed, num_coefficients, data_msb + 1)
+        self.job_dir          = os.path.join(os.path.abspath(out_dir), self.name)
+        self.build_dir        = os.path.join(self.job_dir, "sim_build")
+        self.cache            = cache
+
+
+    def parameters(self):
+        """
+           Function: parameters
+
+           Definition: Top level parameter overrides of this job.
+        """
+        return {"P_NUM_COEFFICIENTS": self.num_coefficients,
+                "P_ADDR_MSB"        : addr_msb(self.num_coefficients),
+                "P_DATA_MSB"        : self.data_msb}
+
+
+    def command(self):
+        """
+           Function: command
+
+           Definition: make command line of this job.
+        """
+        return ["make", "-C", SIM_DIR, "SIM=" + self.sim,
+                "SIM_BUILD=" + self.build_dir,
+                "COCOTB_RESULTS_FILE=" + os.path.join(self.job_dir, "results.xml"),
+                "PLUSARGS=+UVM_TESTNAME=" + self.test]
+
+
+    def environment(self):
+        """
+           Function: environment
+
+           Definition: Environment of this job. EXTRA_ARGS is given through the
+             environment so the Makefile's own += still applies.
+        """
+        env = dict(os.environ)
+        env.update({k: str(v) for k, v in self.parameters().items()})
+        env["RANDOM_SEED"] = str(self.seed)
+        env["EXTRA_ARGS"]  = (env.get("EXTRA_ARGS", "") + " " +
+                              parameter_args(self.sim, self.parameters())).strip()
+        return env
+
+
+    def run(self, timeout=None):
+        """
+           Function: run
+
+           Definition: Runs the simulation, logs to sim.log in the job
+             directory and returns the job's report entry.
+        """
+        os.makedirs(self.job_dir, exist_ok=True)
+        start = time.time()
+        returncode = None
+        cache_hit  = None
+        with open(os.path.join(self.job_dir, "sim.log"), "w") as log:
+            try:
+                if (self.cache is not None):
+                    env = self.environment()
+                    key, cache_hit = self.cache.prepare(self.build_dir, self.sim, env["EXTRA_ARGS"],
+                                                        env.get("COMPILE_ARGS", ""), log)
+                    log.flush()
+                returncode = subprocess.call(self.command(), stdout=log, stderr=subprocess.STDOUT,
+                                             env=self.environment(), timeout=timeout)
+            except subprocess.CalledProcessError as e:
+                returncode = e.returncode
+                log.write("\nregression.py: build failed\n")
+            except subprocess.TimeoutExpired:
+                log.write("\nregression.py: timed out after %s s\n" % timeout)
+        wall_time = time.time() - start
+        passed, testcases, sim_time_ns = parse_results(os.path.join(self.job_dir, "results.xml"))
+        return {"name"       : self.name,
+                "test"       : self.test,
+                "seed"       : self.seed,
+                "parameters" : self.parameters(),
+                "passed"     : passed and returncode == 0,
+                "returncode" : returncode,
+                "wall_time_s": wall_time,
+                "sim_time_ns": sim_time_ns,
+                "cache_hit"  : cache_hit,
+                "testcases"  : testcases,
+                "log"        : os.path.join(self.job_dir, "sim.log")}
+
+
+def build_jobs(tests, seeds, num_coefficients, data_msbs, out_dir, sim="verilator", cache=None):
+    """
+       Function: build_jobs
+
+       Definition: The full matrix of regression_job.
+    """
+    return [regression_job(t, s, n, w, out_dir, sim, cache)
+            for t, s, n, w in itertools.product(tests, seeds, num_coefficients, data_msbs)]
+
+
+def run_regression(jobs, num_workers=None, timeout=None, report_path=None):
+    """
+       Function: run_regression
+
+       Definition: Runs the jobs num_workers at a time (default one per
+         core) and returns the report, also written to report_path.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    start = time.time()
+    results = []
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        futures = [pool.submit(job.run, timeout) for job in jobs]
+        for job, future in zip(jobs, futures):
+            result = future.result()
+            results.append(result)
+            print("%-48s %s %8.1f s" % (job.name, "PASS" if result["passed"] else "FAIL",
+                                        result["wall_time_s"]), flush=True)
+    report = {"num_jobs"    : len(results),
+              "num_passed"  : sum(r["passed"] for r in results),
+              "num_failed"  : sum(not r["passed"] for r in results),
+              "wall_time_s" : time.time() - start,
+              "cpu_time_s"  : sum(r["wall_time_s"] for r in results),
+              "workers"     : num_workers,
+              "jobs"        : results}
+    if (report_path is not None):
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=1)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the IIR Filter regression matrix in parallel.")
+    parser.add_argument("--tests", nargs="+", default=["iir_filter_reg_test"])
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1],
+                        help="seed values")
+    parser.add_argument("--seed-count", action="store_true", help="run seeds 1..N, N given by --seeds")
+    parser.add_argument("--num-coefficients", nargs="+", type=int, default=[13])
+    parser.add_argument("--data-msb", nargs="+", type=int, default=[15])
+    parser.add_argument("--sim", default=os.environ.get("SIM", "verilator"))
+    parser.add_argument("--jobs", type=int, default=None, help="parallel simulations, default one per core")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per simulation")
+    parser.add_argument("--out", default=os.path.join(SIM_DIR, "regression"))
+    parser.add_argument("--build-cache", default=None, help="build cache directory")
+    parser.add_argument("--no-build-cache", action="store_true", help="compile every job")
+    args = parser.parse_args(argv)
+
+    seeds = list(range(1, args.seeds[0] + 1)) if args.seed_count else args.seeds
+    cache = None if args.no_build_cache else build_cache(args.build_cache)
+    jobs = build_jobs(args.tests, seeds, args.num_coefficients, args.data_msb, args.out, args.sim, cache)
+    os.makedirs(args.out, exist_ok=True)
+    report = run_regression(jobs, args.jobs, args.timeout, os.path.join(args.out, "report.json"))
+    print("%d/%d passed in %.1f s (%.1f s of simulation on %d workers)" % (
+        report["num_passed"], report["num_jobs"], report["wall_time_s"],
+        report["cpu_time_s"], report["workers"]))
+    return 0 if report["num_failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
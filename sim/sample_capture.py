@@ -0,0 +1,114 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : sample_capture.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 18:06:12
+# Last modified : 2026/10/18 18:06:12
+# Project Name  : IIR Filter
+# Module Name   : sample_capture
+# Description   : Captures output samples into a preallocated array.
+#
+# Additional Comments:
+#
+#################################################################################
+import numpy as np
+from uvm.base import *
+from uvm.comps import *
+from uvm.macros import *
+
+
+class sample_capture(UVMSubscriber):
+    """
+       Class: Sample Capture
+
+       Definition: Stores DATA_i of the first size transactions written to
+         its export, later ones are only counted.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Capture constructor.
+
+           Args:
+             name: This component's name.
+             parent: Parent component.
+        """
+        self.size        = 0     # samples kept, set before build_phase
+        self.samples     = None  # np.uint64 array of size samples
+        self.count       = 0     # samples kept
+        self.num_dropped = 0     # samples received once full
+        self.tag         = "sample_capture" + name
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        """
+           Function: build_phase
+
+           Definition: Allocates the capture array.
+
+           Args:
+             phase: build_phase
+        """
+        self.samples = np.zeros(self.size, dtype=np.uint64)
+
+
+    def write(self, t):
+        """
+           Function: write
+
+           Definition: Stores one sample.
+
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        if (self.count < self.size):
+            self.samples[self.count] = t.data_in
+            self.count = self.count + 1
+        else:
+            self.num_dropped = self.num_dropped + 1
+
+
+    def captured(self):
+        """
+           Function: captured
+
+           Definition: View of the samples stored so far.
+        """
+        return self.samples[:self.count]
+
+
+uvm_component_utils(sample_capture)
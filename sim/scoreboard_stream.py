@@ -0,0 +1,243 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : scoreboard_stream.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 11:02:09
+# Last modified : 2026/10/18 21:31:50
+# Project Name  : IIR Filter
+# Module Name   : scoreboard_stream
+# Description   : Bounded memory sample stream scoreboard.
+#
+# Additional Comments:
+#   Expected and observed samples are matched by arrival order. Only the
+#   stream that runs ahead is buffered, in a fixed size ring. Samples that
+#   fall off the ring are reported as dropped and their counterparts are
+#   discarded, so the comparisons stay aligned. Besides the counters only a
+#   mismatch histogram and a bounded number of failure windows are kept, so
+#   memory does not grow with the length of the run.
+#
+#   The latency between the streams is found once by cross correlating the
+#   first align_window samples of each stream. After that the checker is
+#   locked and compares at O(1) per sample. A reset or a coefficient write
+#   starts a new alignment. The comparison is stream_checker.
+#################################################################################
+import numpy as np
+from uvm.base import *
+from uvm.comps import *
+from uvm.tlm1 import *
+from uvm.macros import *
+from uvm.macros.uvm_tlm_defines import uvm_analysis_imp_decl
+from iir_filter_model import to_signed, to_unsigned
+from stream_checker import *
+
+uvm_analysis_imp_expected   = uvm_analysis_imp_decl("_expected")
+uvm_analysis_imp_observed   = uvm_analysis_imp_decl("_observed")
+uvm_analysis_imp_hypothesis = uvm_analysis_imp_decl("_hypothesis")
+uvm_analysis_imp_coeff      = uvm_analysis_imp_decl("_coeff")
+
+
+class scoreboard_stream(UVMScoreboard):
+    """
+       Class: Scoreboard, Stream
+
+       Definition: Checks the UUT output stream against the predictor with
+         bounded memory. Alternative coefficient hypotheses from the predictor
+         are checked against the same output and only reported.
+    """
+
+    def __init__(self, name, parent):
+        """
+           Function: __init__, new
+
+           Definition: Class constructor.
+
+           Args:
+             name: This component's name.
+             parent: Parent component.
+        """
+        UVMScoreboard.__init__(self, name, parent)
+        self.expected_export   = None
+        self.observed_export   = None
+        self.hypothesis_export = None
+        self.coeff_export      = None
+        self.cfg         = None  # tb_env_config, set by the environment
+        self.checker     = None  # stream_checker
+        self.hypotheses  = []    # stream_checker per coefficient hypothesis
+        self.next_summary = 0    # samples compared at the next summary message
+        self.tag         = "scoreboard_stream" + name
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        """
+           Function: build_phase
+
+           Definition: Creates the exports and the checkers.
+
+           Args:
+             phase: build_phase
+        """
+        self.expected_export   = uvm_analysis_imp_expected("expected_export", self)
+        self.observed_export   = uvm_analysis_imp_observed("observed_export", self)
+        self.hypothesis_export = uvm_analysis_imp_hypothesis("hypothesis_export", self)
+        self.coeff_export      = uvm_analysis_imp_coeff("coeff_export", self)
+
+        self.checker    = self.create_checker()
+        self.next_summary = self.cfg.summary_interval
+        self.hypotheses = [self.create_checker() for _ in self.cfg.coefficient_hypotheses]
+
+
+    def create_checker(self):
+        """
+           Function: create_checker
+
+           Definition: Creates a stream_checker sized by tb_env_config.
+        """
+        return stream_checker(self.cfg.data_msb, self.cfg.scoreboard_depth,
+                              self.cfg.scoreboard_context, self.cfg.scoreboard_max_failures,
+                              self.cfg.scoreboard_align_window, self.cfg.scoreboard_max_latency)
+
+
+    def write_expected(self, t):
+        """
+           Function: write_expected
+
+           Definition: Receives predicted samples, a block array or one
+             sequence item.
+
+           Args:
+             t: numpy array or wb_standard_master_seq
+        """
+        if (isinstance(t, np.ndarray)):
+            self.checker.push_expected(t)
+        else:
+            self.checker.push_expected(t.data_in)
+
+
+    def write_observed(self, t):
+        """
+           Function: write_observed
+
+           Definition: Receives the samples read from the UUT.
+
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        data = t.data_in
+        self.checker.push_observed(data)
+        for checker in self.hypotheses:
+            checker.push_observed(data)
+        if (self.cfg.summary_interval > 0 and self.checker.num_compared >= self.next_summary):
+            self.next_summary = self.checker.num_compared + self.cfg.summary_interval
+            if (self.uvm_report_enabled(UVM_MEDIUM, UVM_INFO, self.tag)):
+                uvm_info(self.tag, sv.sformatf("%0d samples compared, %0d mismatches, latency %0d",
+                    self.checker.num_compared, self.checker.num_mismatches, self.checker.latency), UVM_MEDIUM)
+
+
+    def write_hypothesis(self, t):
+        """
+           Function: write_hypothesis
+
+           Definition: Receives one block of predictions per hypothesis.
+
+           Args:
+             t: (hypotheses, samples) numpy array
+        """
+        for checker, predicted in zip(self.hypotheses, t):
+            checker.push_expected(predicted)
+
+
+    def write_coeff(self, t):
+        """
+           Function: write_coeff
+
+           Definition: A coefficient write changes the output, align again.
+
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        self.notify_reset()
+
+
+    def notify_reset(self):
+        """
+           Function: notify_reset
+
+           Definition: Starts a new alignment on every checker. Counters and
+             failure records are kept.
+        """
+        for checker in [self.checker] + self.hypotheses:
+            checker.realign()
+
+
+    def check_phase(self, phase):
+        """
+           Function: check_phase
+
+           Definition: Flags mismatches, dropped samples and samples left
+             without a counterpart, other than the ones still in flight in
+             the UUT at the end of the test. Checkers that never filled their
+             alignment window are aligned with what they have.
+
+           Args:
+             phase: check_phase
+        """
+        for checker in [self.checker] + self.hypotheses:
+            checker.finish()
+        if (self.checker.unchecked() > 0):
+            uvm_warning(self.tag, sv.sformatf("%0d samples were not checked, %0d more were in flight at the end",
+                self.checker.unchecked(), self.checker.in_flight()))
+        if (self.checker.num_compared == 0):
+            uvm_error(self.tag, "No output sample was compared, is the read port strobed?")
+        elif (not self.checker.passed()):
+            uvm_error(self.tag, "Output stream check failed" + self.checker.convert2string())
+
+
+    def report_phase(self, phase):
+        """
+           Function: report_phase
+
+           Definition: Prints the counters and the hypotheses results.
+
+           Args:
+             phase: report_phase
+        """
+        if (not self.uvm_report_enabled(UVM_LOW, UVM_INFO, self.tag)):
+            return
+        uvm_info(self.tag, self.checker.convert2string(), UVM_LOW)
+        for i, checker in enumerate(self.hypotheses):
+            uvm_info(self.tag, sv.sformatf("Hypothesis %0d matched %0d of %0d samples",
+                i, checker.num_compared - checker.num_mismatches, checker.num_compared), UVM_LOW)
+
+
+uvm_component_utils(scoreboard_stream)
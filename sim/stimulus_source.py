@@ -0,0 +1,261 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : stimulus_source.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 13:52:30
+# Last modified : 2026/10/18 14:10:05
+# Project Name  : IIR Filter
+# Module Name   : stimulus_source, pcm_source
+# Description   : Memory mapped sample file and audio file readers.
+#
+# Additional Comments:
+#   Samples are kept in .npy (or raw little endian binary) files and read
+#   through a memory map, so opening a file costs nothing and memory use does
+#   not depend on its size. Hex files, one word per line written as its bytes
+#   LSB first ("b0 b1 b2 b3"), are converted once with hex_to_npy.
+#
+#   pcm_source streams WAV or raw PCM audio, rescaled to the filter's data
+#   width, a chunk of frames at a time.
+#################################################################################
+import os
+import wave
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+def hex_to_npy(hex_path, npy_path, dtype=np.uint32, chunk_lines=1 << 16):
+    """
+       Function: hex_to_npy
+
+       Definition: Converts a hex stimulus file into a .npy file, chunk_lines
+         lines at a time.
+
+       Args:
+         hex_path: Text file, one word per line, bytes LSB first.
+         npy_path: File to write.
+         dtype: Word type, its size must match the bytes per line.
+         chunk_lines: Lines parsed per step.
+    """
+    dtype = np.dtype(dtype).newbyteorder("<")
+    with open(hex_path, "r") as f:
+        num_words = sum(1 for line in f if line.strip())
+
+    out = open_memmap(npy_path + ".tmp", mode="w+", dtype=dtype, shape=(num_words,))
+    index = 0
+    with open(hex_path, "r") as f:
+        while True:
+            lines = [line for line in (f.readline() for _ in range(chunk_lines)) if line.strip()]
+            if (len(lines) == 0):
+                break
+            words = np.frombuffer(bytes.fromhex("".join(lines)), dtype=dtype)
+            out[index:index + words.size] = words
+            index = index + words.size
+    out.flush()
+    del out
+    os.replace(npy_path + ".tmp", npy_path)
+
+
+class stimulus_source():
+    """
+       Class: Stimulus Source
+
+       Definition: Iterates the samples of a memory mapped file. Values are
+         read chunk_size at a time and given out as Python ints.
+    """
+
+    def __init__(self, path, dtype=np.uint32, chunk_size=65536, start=0, stop=None):
+        """
+           Function: new
+
+           Definition: Opens the sample file.
+
+           Args:
+             path: .npy file, or raw binary of dtype words.
+             dtype: Word type of raw binary files, .npy files carry their own.
+             chunk_size: Samples read from the file per step.
+             start: First sample.
+             stop: Sample after the last one, None for the end of the file.
+        """
+        if (path.endswith(".npy")):
+            self.data = np.load(path, mmap_mode="r")
+        else:
+            self.data = np.memmap(path, dtype=np.dtype(dtype).newbyteorder("<"), mode="r")
+        self.path       = path
+        self.chunk_size = chunk_size
+        self.start      = start
+        self.stop       = len(self.data) if stop is None else min(stop, len(self.data))
+
+
+    @classmethod
+    def from_hex(cls, hex_path, npy_path=None, **kwargs):
+        """
+           Function: from_hex
+
+           Definition: Opens the .npy twin of a hex file, converting it first
+             when it is missing or older than the hex file.
+
+           Args:
+             hex_path: Hex stimulus file.
+             npy_path: Converted file, defaults to hex_path with .npy extension.
+             kwargs: Passed to stimulus_source.
+        """
+        if (npy_path is None):
+            npy_path = os.path.splitext(hex_path)[0] + ".npy"
+        if (not os.path.exists(npy_path) or os.path.getmtime(npy_path) < os.path.getmtime(hex_path)):
+            hex_to_npy(hex_path, npy_path, kwargs.get("dtype", np.uint32))
+        return cls(npy_path, **kwargs)
+
+
+    def __len__(self):
+        return max(self.stop - self.start, 0)
+
+
+    def chunks(self):
+        """
+           Function: chunks
+
+           Definition: Yields the samples as numpy arrays of up to chunk_size.
+        """
+        for i in range(self.start, self.stop, self.chunk_size):
+            yield np.asarray(self.data[i:min(i + self.chunk_size, self.stop)])
+
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk.tolist()
+
+
+def pcm_to_samples(frames, sample_width, channels, channel, data_msb):
+    """
+       Function: pcm_to_samples
+
+       Definition: Decodes little endian PCM frames of one channel and
+         rescales them to data_msb + 1 bits, two's complement, as uint64.
+
+       Args:
+         frames: PCM bytes.
+         sample_width: Bytes per sample, 1 (unsigned), 2, 3 or 4.
+         channels: Interleaved channels.
+         channel: Channel kept.
+         data_msb: Most significant bit of the rescaled samples.
+    """
+    raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, channels, sample_width)[:, channel, :]
+    value = np.zeros(raw.shape[0], dtype=np.int64)
+    for i in range(sample_width):
+        value |= raw[:, i].astype(np.int64) << (8 * i)
+    bits = 8 * sample_width
+    if (sample_width == 1):
+        value = value - 128  # 8 bit PCM is unsigned
+    else:
+        value = np.where(value >= (1 << (bits - 1)), value - (1 << bits), value)
+    width = data_msb + 1
+    if (bits > width):
+        value = value >> (bits - width)
+    else:
+        value = value << (width - bits)
+    return (value & ((1 << width) - 1)).astype(np.uint64)
+
+
+class pcm_source():
+    """
+       Class: PCM Source
+
+       Definition: Iterates one channel of a WAV or raw PCM file as filter
+         input samples. The file is read chunk_size frames at a time.
+    """
+
+    def __init__(self, path, data_msb=15, chunk_size=65536, channel=0,
+                 sample_width=2, channels=1):
+        """
+           Function: new
+
+           Definition: Opens the audio file.
+
+           Args:
+             path: .wav file, anything else is read as raw PCM.
+             data_msb: P_DATA_MSB of the filter.
+             chunk_size: Frames read per step.
+             channel: Channel streamed.
+             sample_width: Bytes per sample of raw files, WAV files carry their own.
+             channels: Channels of raw files.
+        """
+        self.path         = path
+        self.data_msb     = data_msb
+        self.chunk_size   = chunk_size
+        self.channel      = channel
+        self.is_wav       = path.lower().endswith(".wav")
+        if (self.is_wav):
+            with wave.open(path, "rb") as w:
+                self.sample_width = w.getsampwidth()
+                self.channels     = w.getnchannels()
+                self.rate         = w.getframerate()
+                self.num_frames   = w.getnframes()
+        else:
+            self.sample_width = sample_width
+            self.channels     = channels
+            self.rate         = None
+            self.num_frames   = os.path.getsize(path) // (sample_width * channels)
+
+
+    def __len__(self):
+        return self.num_frames
+
+
+    def chunks(self):
+        """
+           Function: chunks
+
+           Definition: Yields the rescaled samples as numpy arrays of up to
+             chunk_size.
+        """
+        frame_size = self.sample_width * self.channels
+        if (self.is_wav):
+            f = wave.open(self.path, "rb")
+            read = f.readframes
+        else:
+            f = open(self.path, "rb")
+            read = lambda n: f.read(n * frame_size)
+        try:
+            while True:
+                frames = read(self.chunk_size)
+                frames = frames[:len(frames) - len(frames) % frame_size]
+                if (len(frames) == 0):
+                    break
+                yield pcm_to_samples(frames, self.sample_width, self.channels, self.channel, self.data_msb)
+        finally:
+            f.close()
+
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk.tolist()
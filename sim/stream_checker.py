@@ -0,0 +1,518 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : stream_checker.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 11:02:09
+# Last modified : 2026/10/18 21:31:50
+# Project Name  : IIR Filter
+# Module Name   : stream_checker
+# Description   : Bounded memory sample stream comparison.
+#
+# Additional Comments:
+#   Expected and observed samples are matched by arrival order. Only the
+#   stream that runs ahead is buffered, in a fixed size ring. When it
+#   overflows the oldest samples fall off and are counted as dropped, and as
+#   many samples of the other stream are discarded when they arrive, so the
+#   comparisons after an overflow stay aligned. Dropped samples were not
+#   checked and fail the run. Besides the counters only a
+#   mismatch histogram and a bounded number of failure windows are kept, so
+#   memory does not grow with the length of the run.
+#
+#   The latency between the streams is found once by cross correlating the
+#   first align_window samples of each stream. After that the checker is
+#   locked and compares at O(1) per sample. A reset or a coefficient write
+#   starts a new alignment.
+#
+#   Kept apart from scoreboard_stream so it runs without uvm, see fast_mode.py.
+#################################################################################
+import numpy as np
+from iir_filter_model import to_signed, to_unsigned
+
+EXPECTED = 0
+OBSERVED = 1
+
+
+class stream_checker():
+    """
+       Class: Stream Checker
+
+       Definition: Compares an expected and an observed sample stream with
+         bounded memory. Blocks of samples are compared with one array
+         operation.
+    """
+
+    def __init__(self, data_msb=15, depth=8192, context=8, max_failures=16,
+                 align_window=0, max_latency=64):
+        """
+           Function: new
+
+           Definition: Checker constructor.
+
+           Args:
+             data_msb: Most significant bit of the samples.
+             depth: Samples the leading stream may run ahead before its
+               oldest ones are dropped.
+             context: Samples kept before and after each failure.
+             max_failures: Failure windows kept, later ones are only counted.
+             align_window: Samples correlated to find the latency, 0 compares
+               the streams as they arrive.
+             max_latency: Largest lag searched, in samples, either direction.
+        """
+        self.data_msb     = data_msb
+        self.depth        = depth
+        self.context      = context
+        self.max_failures = max_failures
+        self.align_window = align_window
+        self.max_latency  = max_latency
+        self.width        = data_msb + 1
+        self.reset()
+
+
+    def reset(self):
+        """
+           Function: reset
+
+           Definition: Clears the buffers, counters and failure records.
+        """
+        # Ring buffer of the stream running ahead
+        self.pending      = np.zeros(self.depth, dtype=np.uint64)
+        self.pending_side = EXPECTED
+        self.head         = 0  # oldest pending sample
+        self.count        = 0  # pending samples
+        # Counters
+        self.num_expected   = 0
+        self.num_observed   = 0
+        self.num_compared   = 0
+        self.num_mismatches = 0
+        self.num_dropped    = 0
+        self.num_overflows  = 0
+        self.first_overflow = None  # samples compared before the first overflow
+        self.first_mismatch = None
+        # Histograms, per differing bit and per most significant differing bit
+        self.bit_histogram = np.zeros(self.width, dtype=np.int64)
+        self.msb_histogram = np.zeros(self.width, dtype=np.int64)
+        # Last compared samples, pre-trigger context of the next failure
+        self.history_expected = np.zeros(0, dtype=np.uint64)
+        self.history_observed = np.zeros(0, dtype=np.uint64)
+        self.failures = []  # dicts, see record_failure
+        self.open     = []  # failures still collecting their after context
+        # Alignment
+        self.acquired = [np.zeros(self.align_window + self.depth, dtype=np.uint64),
+                         np.zeros(self.align_window + self.depth, dtype=np.uint64)]
+        self.num_acquired = [0, 0]
+        self.num_skipped  = [0, 0]  # samples without counterpart, per side
+        self.dropped      = [0, 0]  # samples dropped on overflow, per side
+        self.discard      = [0, 0]  # counterparts of dropped samples still to come, per side
+        self.num_aligned  = 0
+        self.latency      = 0       # observed samples behind the expected ones, all alignments
+        self.lag          = 0       # the same, last alignment only
+        self.locked       = (self.align_window == 0)
+
+
+    def realign(self):
+        """
+           Function: realign
+
+           Definition: Unlocks the checker. Samples waiting for a counterpart
+             become the start of the next alignment window.
+        """
+        if (self.align_window == 0):
+            return
+        if (self.locked):
+            buffered = self.pending[(self.head + np.arange(self.count)) % self.depth]
+            self.head  = 0
+            self.count = 0
+            self.locked = False
+            self.acquire(self.pending_side, buffered)
+
+
+    def push_expected(self, values):
+        """
+           Function: push_expected
+
+           Definition: Adds predicted samples.
+
+           Args:
+             values: One sample or an array of samples.
+        """
+        values = to_unsigned(values, self.data_msb).reshape(-1)
+        self.num_expected += values.size
+        self.arrive(EXPECTED, values)
+
+
+    def push_observed(self, values):
+        """
+           Function: push_observed
+
+           Definition: Adds samples captured from the UUT.
+
+           Args:
+             values: One sample or an array of samples.
+        """
+        values = to_unsigned(values, self.data_msb).reshape(-1)
+        self.num_observed += values.size
+        self.arrive(OBSERVED, values)
+
+
+    def arrive(self, side, values):
+        """
+           Function: arrive
+
+           Definition: Discards the counterparts of samples dropped from the
+             other stream, then compares or acquires the rest.
+
+           Args:
+             side: EXPECTED or OBSERVED
+             values: uint64 samples.
+        """
+        if (self.discard[side] > 0):
+            k = min(self.discard[side], values.size)
+            self.discard[side]     -= k
+            self.num_skipped[side] += k
+            values = values[k:]
+        if (self.locked):
+            self.push(side, values)
+        else:
+            self.acquire(side, values)
+
+
+    def overflowed(self, side, n):
+        """
+           Function: overflowed
+
+           Definition: Counts n samples dropped from side and schedules the
+             discard of their counterparts.
+
+           Args:
+             side: EXPECTED or OBSERVED
+             n: Oldest samples dropped.
+        """
+        self.num_dropped += n
+        self.dropped[side] += n
+        self.discard[1 - side] += n
+        self.num_overflows += 1
+        if (self.first_overflow is None):
+            self.first_overflow = self.num_compared
+
+
+    def acquire(self, side, values):
+        """
+           Function: acquire
+
+           Definition: Collects samples until both streams have a full
+             alignment window.
+
+           Args:
+             side: EXPECTED or OBSERVED
+             values: uint64 samples.
+        """
+        buffer = self.acquired[side]
+        start  = self.num_acquired[side]
+        overflow = start + values.size - buffer.size
+        if (overflow > 0):
+            # Keep the newest samples, the counterparts of the dropped ones
+            # go from the other window or are discarded on arrival.
+            kept = np.concatenate((buffer[:start], values))[overflow:]
+            buffer[:kept.size] = kept
+            self.num_acquired[side] = kept.size
+            other = 1 - side
+            k = min(overflow, self.num_acquired[other])
+            self.acquired[other][:self.num_acquired[other] - k] = self.acquired[other][k:self.num_acquired[other]]
+            self.num_acquired[other] -= k
+            self.num_skipped[other]  += k
+            self.overflowed(side, overflow)
+            self.discard[other] -= k
+        else:
+            buffer[start:start + values.size] = values
+            self.num_acquired[side] = start + values.size
+        if (min(self.num_acquired) >= self.align_window):
+            self.align()
+
+
+    def align(self):
+        """
+           Function: align
+
+           Definition: Finds the lag with the highest cross correlation between
+             the acquired windows, drops the samples that have no counterpart
+             and locks the checker.
+        """
+        n = min(min(self.num_acquired), self.align_window)
+        lag  = self.find_latency(self.acquired[EXPECTED][:n], self.acquired[OBSERVED][:n])
+        skip = [max(-lag, 0), max(lag, 0)]
+        self.latency += lag
+        self.lag      = lag
+        skip = [min(skip[side], self.num_acquired[side]) for side in (EXPECTED, OBSERVED)]
+        expected = self.acquired[EXPECTED][skip[EXPECTED]:self.num_acquired[EXPECTED]].copy()
+        observed = self.acquired[OBSERVED][skip[OBSERVED]:self.num_acquired[OBSERVED]].copy()
+        self.num_skipped  = [self.num_skipped[side] + skip[side] for side in (EXPECTED, OBSERVED)]
+        self.num_acquired = [0, 0]
+        self.num_aligned += 1
+        self.locked = True
+        k = min(expected.size, observed.size)
+        self.compare(expected[:k], observed[:k])
+        self.push(EXPECTED, expected[k:])
+        self.push(OBSERVED, observed[k:])
+
+
+    def find_latency(self, expected, observed):
+        """
+           Function: find_latency
+
+           Definition: FFT cross correlation of the two windows. Each lag is
+             normalized by its overlap, ties go to the smallest lag.
+
+           Args:
+             expected: Predicted samples.
+             observed: Samples captured from the UUT.
+        """
+        n = expected.size
+        max_lag = min(self.max_latency, n - 1)
+        if (max_lag <= 0):
+            return 0
+        e = to_signed(expected, self.data_msb).astype(np.float64)
+        o = to_signed(observed, self.data_msb).astype(np.float64)
+        e = e - e.mean()
+        o = o - o.mean()
+        if (not e.any() or not o.any()):
+            return 0
+        nfft = 1 << int(2 * n - 1).bit_length()
+        correlation = np.fft.irfft(np.conj(np.fft.rfft(e, nfft)) * np.fft.rfft(o, nfft), nfft)
+        # 0, 1, -1, 2, -2, ... so that argmax prefers the smallest lag
+        lags = np.arange(1, 2 * max_lag + 1) // 2 * np.where(np.arange(2 * max_lag) % 2 == 0, 1, -1)
+        lags = np.concatenate(([0], lags))
+        score = correlation[lags % nfft] / (n - np.abs(lags))
+        return int(lags[np.argmax(np.round(score, 6))])
+
+
+    def finish(self):
+        """
+           Function: finish
+
+           Definition: Aligns with the samples acquired so far if the streams
+             ended before filling an alignment window.
+        """
+        if (not self.locked and min(self.num_acquired) > 0):
+            self.align()
+
+
+    def push(self, side, values):
+        """
+           Function: push
+
+           Definition: Compares the new samples against the pending samples of
+             the other stream and buffers whatever is left.
+
+           Args:
+             side: EXPECTED or OBSERVED
+             values: uint64 samples.
+        """
+        if (self.count > 0 and self.pending_side != side):
+            k = min(self.count, values.size)
+            buffered = self.pending[(self.head + np.arange(k)) % self.depth]
+            self.head  = (self.head + k) % self.depth
+            self.count = self.count - k
+            if (side == OBSERVED):
+                self.compare(buffered, values[:k])
+            else:
+                self.compare(values[:k], buffered)
+            values = values[k:]
+
+        if (values.size == 0):
+            return
+
+        self.pending_side = side
+        # Keep the newest samples when the ring would overflow. The other
+        # stream's counterparts of the dropped ones are discarded on arrival.
+        overflow = self.count + values.size - self.depth
+        if (overflow > 0):
+            drop_pending = min(overflow, self.count)
+            self.head  = (self.head + drop_pending) % self.depth
+            self.count = self.count - drop_pending
+            values = values[overflow - drop_pending:]
+            self.overflowed(side, overflow)
+        tail = (self.head + self.count + np.arange(values.size)) % self.depth
+        self.pending[tail] = values
+        self.count = self.count + values.size
+
+
+    def compare(self, expected, observed):
+        """
+           Function: compare
+
+           Definition: Compares two aligned blocks and updates the counters,
+             histograms and failure windows.
+
+           Args:
+             expected: Predicted samples.
+             observed: Samples captured from the UUT.
+        """
+        start = self.num_compared
+        n     = expected.size
+        self.num_compared += n
+
+        # Finish the failures waiting for their after context.
+        for failure in self.open:
+            missing = self.context - len(failure["after"])
+            failure["after"].extend(zip(expected[:missing].tolist(), observed[:missing].tolist()))
+        self.open = [f for f in self.open if len(f["after"]) < self.context]
+
+        diff = expected ^ observed
+        mismatches = np.flatnonzero(diff)
+        if (mismatches.size > 0):
+            if (self.first_mismatch is None):
+                self.first_mismatch = start + int(mismatches[0])
+            self.num_mismatches += mismatches.size
+            self.update_histograms(diff[mismatches])
+            room = self.max_failures - len(self.failures)
+            for i in mismatches[:max(room, 0)].tolist():
+                self.record_failure(start, i, expected, observed)
+
+        # Keep the last compared samples as pre-trigger context.
+        if (self.context > 0):
+            self.history_expected = np.concatenate((self.history_expected, expected[-self.context:]))[-self.context:]
+            self.history_observed = np.concatenate((self.history_observed, observed[-self.context:]))[-self.context:]
+
+
+    def update_histograms(self, diff):
+        """
+           Function: update_histograms
+
+           Definition: Counts the differing bits of the mismatched samples.
+
+           Args:
+             diff: expected XOR observed of each mismatch.
+        """
+        bits = np.arange(self.width, dtype=np.uint64)
+        self.bit_histogram += ((diff[:, np.newaxis] >> bits) & np.uint64(1)).sum(axis=0).astype(np.int64)
+        # Most significant differing bit, by binary search on the shift.
+        msb   = np.zeros(diff.size, dtype=np.int64)
+        value = diff.copy()
+        for shift in (32, 16, 8, 4, 2, 1):
+            high = value >= np.uint64(1 << shift)
+            msb[high] += shift
+            value[high] >>= np.uint64(shift)
+        self.msb_histogram += np.bincount(msb, minlength=self.width)[:self.width]
+
+
+    def record_failure(self, start, i, expected, observed):
+        """
+           Function: record_failure
+
+           Definition: Stores a failure with the samples around it.
+
+           Args:
+             start: Stream index of the first sample of the block.
+             i: Index of the mismatch within the block.
+             expected: Predicted samples of the block.
+             observed: Samples of the block captured from the UUT.
+        """
+        first = max(i - self.context, 0)
+        before_expected = np.concatenate((self.history_expected, expected[first:i]))
+        before_observed = np.concatenate((self.history_observed, observed[first:i]))
+        before_expected = before_expected[max(before_expected.size - self.context, 0):]
+        before_observed = before_observed[max(before_observed.size - self.context, 0):]
+        failure = {"index"    : start + i,
+                   "observed_index": start + i + self.num_skipped[OBSERVED] + self.dropped[OBSERVED],
+                   "expected" : int(expected[i]),
+                   "observed" : int(observed[i]),
+                   "before"   : list(zip(before_expected.tolist(), before_observed.tolist())),
+                   "after"    : list(zip(expected[i+1:i+1+self.context].tolist(),
+                                         observed[i+1:i+1+self.context].tolist()))}
+        self.failures.append(failure)
+        if (len(failure["after"]) < self.context):
+            self.open.append(failure)
+
+
+    def in_flight(self):
+        """
+           Function: in_flight
+
+           Definition: Samples left without counterpart only because the run
+             ended, the last |lag| samples of the stream the lag puts ahead.
+        """
+        if (not self.locked):
+            return 0
+        ahead = EXPECTED if (self.lag > 0) else OBSERVED
+        return min(self.count, abs(self.lag)) if (self.pending_side == ahead) else 0
+
+
+    def unchecked(self):
+        """
+           Function: unchecked
+
+           Definition: Samples neither compared, skipped by an alignment nor
+             in flight.
+        """
+        return self.count + sum(self.num_acquired) - self.in_flight()
+
+
+    def passed(self):
+        """
+           Function: passed
+
+           Definition: True when samples were compared, every one matched
+             and none was left unchecked but the ones in flight at the end.
+        """
+        return (self.num_compared > 0 and self.num_mismatches == 0 and self.num_dropped == 0 and
+                self.unchecked() == 0)
+
+
+    def convert2string(self):
+        """
+           Function: convert2string
+
+           Definition: Summary of the counters, histograms and failures.
+        """
+        lines = ["    Expected   : %d" % self.num_expected,
+                 "    Observed   : %d" % self.num_observed,
+                 "    Compared   : %d" % self.num_compared,
+                 "    Mismatches : %d" % self.num_mismatches,
+                 "    Dropped    : %d" % self.num_dropped,
+                 "    Skipped    : %d expected, %d observed" % tuple(self.num_skipped),
+                 "    Latency    : %d samples, aligned %d times" % (self.latency, self.num_aligned),
+                 "    Unchecked  : %d, %d more in flight" % (self.unchecked(), self.in_flight())]
+        if (self.num_overflows > 0):
+            lines.append("    Overflow   : ring of %d samples overflowed %d times, first after %d compared, "
+                         "%d samples not checked" % (self.depth, self.num_overflows, self.first_overflow,
+                                                     self.num_dropped))
+        if (self.num_mismatches > 0):
+            lines.append("    First mismatch at sample %d" % self.first_mismatch)
+            lines.append("    Differing bit histogram (LSB first) : %s" % self.bit_histogram.tolist())
+            lines.append("    Highest differing bit histogram     : %s" % self.msb_histogram.tolist())
+        for failure in self.failures:
+            lines.append("    Sample %d expected 0x%x observed 0x%x" %
+                         (failure["index"], failure["expected"], failure["observed"]))
+            lines.append("      before : %s" % " ".join("%x/%x" % p for p in failure["before"]))
+            lines.append("      after  : %s" % " ".join("%x/%x" % p for p in failure["after"]))
+        return "\n" + "\n".join(lines) + "\n"
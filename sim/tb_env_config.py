@@ -33,7 +33,7 @@
 # File name     : tb_env_config.py
 # Author        : Jose R Garcia
 # Created       : 2020/11/05 20:08:35
-# Last modified : 2021/02/14 21:07:13
+# Last modified : 2026/10/18 21:11:26
 # Project Name  : UVM Python Verification Library
 # Module Name   : tb_env_config
 # Description   : Test Bench Configurations
@@ -41,6 +41,7 @@
 # Additional Comments:
 #
 #################################################################################
+import os
 import cocotb
 from cocotb.triggers import *
 from uvm.tlm1 import *
@@ -75,6 +76,34 @@ class tb_env_config(UVMEnv):
         self.has_scoreboard = False           # scoreboard on/off
         self.has_predictor  = False          # predictor on/off
         self.has_functional_coverage = False  # predictor on/off
+        # Parameters of the simulated RTL, exported by regression.py
+        self.num_coefficients = int(os.environ.get("P_NUM_COEFFICIENTS", 13))
+        self.data_msb         = int(os.environ.get("P_DATA_MSB", 15))
+        self.model_block_size = 4096          # samples solved per model call
+        self.coefficient_hypotheses = []      # alternative coefficient sets to predict
+        self.scoreboard_depth        = 8192   # samples a stream may run ahead, at least 2 model blocks
+        self.scoreboard_context      = 8      # samples kept around each failure
+        self.scoreboard_max_failures = 16     # failures kept with context
+        self.scoreboard_align_window = 1024   # samples correlated to find the latency, 0 off
+        self.scoreboard_max_latency  = 64     # largest latency searched
+        self.summary_interval        = 65536  # samples between predictor/scoreboard summaries, 0 off
+        self.output_path = None               # .wav or raw PCM file recording the UUT output
+        self.output_rate = 48000              # sample rate written to WAV output files
+        self.coefficients = None              # words loaded through the write agent at start, None skips
+        self.clock_period_ns   = 1            # i_clk period set at top
+        self.trace_windows_out = None         # json of windows around failures, see trace_window.py
+        self.trace_windows_in  = None         # json of windows to dump, needs make TRACE=window
+        self.trace_triggers    = []           # callables(output item) -> bool, a window per hit
+        self.trace_pre_cycles  = 256          # cycles dumped before a failure or trigger
+        self.trace_post_cycles = 256          # cycles dumped after
+        self.profile      = False             # time the components, see profiler.py
+        self.profile_path = None              # json copy of the profile
+        self.record_dir   = None              # directory of the agents' transaction files, None off
+        self.checkpoint_dir = None            # register snapshots after the coefficient load, see checkpoint.py
+        self.build_key      = None            # compiled model of the snapshots, +BUILD_KEY from make
+        # IIR_Filter_BANK channels, exported by the Makefile (make CHANNELS=N)
+        self.num_channels = int(os.environ.get("CHANNELS", 1))
+        self.channels     = []                # tb_env_config of channels 1 and up, this one is channel 0
         self.tag = "tb_env_config"
 
 
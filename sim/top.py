@@ -1,3 +1,4 @@
+import os
 import random
 import cocotb
 import sys
@@ -12,22 +13,40 @@ from externals.Wishbone_Standard_Master.wb_standard_master_if import *
 from tb_env_config import *
 from iir_filter_tb_env import *
 from iir_filter_test_lib import *
+from iir_filter_top_model import BUS_MAP_INST, BUS_MAP_READ, BUS_MAP_WRITE
+from bank_top import channel_bus_map
 
-async def initial_run_test(dut, vif, vif_read, vif_write):
+CHANNELS = int(os.environ.get("CHANNELS", 1))  # IIR_Filter_BANK channels, 1 is IIR_Filter_TOP
+
+async def initial_run_test(dut, vif, vif_read, vif_write, channel_vifs=None):
     from uvm.base import UVMCoreService
+    channel_vifs = channel_vifs or []
     cs_ = UVMCoreService.get()
     UVMConfigDb.set(None, "*", "vif", vif)
     UVMConfigDb.set(None, "*", "vif_read", vif_read)
     UVMConfigDb.set(None, "*", "vif_write", vif_write)
+    # Channels 1 and up of IIR_Filter_BANK
+    for k, (vif_k, vif_read_k, vif_write_k) in enumerate(channel_vifs, 1):
+        UVMConfigDb.set(None, "*", "vif_%d" % k, vif_k)
+        UVMConfigDb.set(None, "*", "vif_read_%d" % k, vif_read_k)
+        UVMConfigDb.set(None, "*", "vif_write_%d" % k, vif_write_k)
     await run_test("iir_filter_reg_test")
 
 
-async def initial_reset(vif, vif_read, vif_write, dut):
+async def initial_reset(vif, vif_read, vif_write, dut, channel_vifs=None):
+    channel_vifs = channel_vifs or []
     await Timer(0, "NS")
     vif.rst_i <= 1
-    await Timer(330, "NS") # clock*32 + 1 to clear all general register which are BRAM
+    if ("CHECKPOINT_DIR" in cocotb.plusargs):
+        # Also on the run that saves the checkpoint: every register of
+        # IIR_Filter, BiQuad and Multiplier resets synchronously on one edge,
+        # r_coefficients included, and there is no BRAM to clear. 4 ns are 4
+        # clocks, so the state is the one the full reset leaves.
+        await Timer(4, "NS")
+    else:
+        await Timer(330, "NS") # clock*32 + 1 to clear all general register which are BRAM
     vif.rst_i <= 0
-    cocotb.fork(initial_run_test(dut, vif, vif_read, vif_write))
+    await initial_run_test(dut, vif, vif_read, vif_write, channel_vifs)
 
 
 @cocotb.test()
@@ -35,62 +54,26 @@ async def top(dut):
     """ IIR Filter Test Bench Top """
 
     # Map the signals in the DUT to the verification agents interfaces
-    bus_map = {"clk_i": "i_clk", 
-               "rst_i": "i_reset_sync",
-               "adr_o": "adr_o", 
-               "dat_i": "i_master_read_data",
-               "dat_o": "dat_o", 
-               "we_o": "we_o",
-               "sel_o": "sel_o",
-               "stb_o": "o_master_read_stb",
-               "ack_i": "i_master_read_ack",
-               "cyc_o": "cyc_o",
-               "stall_i": "stall_i",
-               "tga_o": "tga_o",
-               "tgd_i": "tgd_i",
-               "tgd_o": "tgd_o",
-               "tgc_o": "tgc_o"}
-
-    bus_map_read = {"clk_i": "i_clk", 
-                    "rst_i": "i_reset_sync",
-                    "adr_o": "adr_o", 
-                    "dat_i": "o_slave_read_data",
-                    "dat_o": "dat_o", 
-                    "we_o": "we_o",
-                    "sel_o": "sel_o",
-                    "stb_o": "i_slave_read_stb",
-                    "ack_i": "o_slave_read_ack",
-                    "cyc_o": "cyc_o",
-                    "stall_i": "stall_i",
-                    "tga_o": "tga_o",
-                    "tgd_i": "tgd_i",
-                    "tgd_o": "tgd_o",
-                    "tgc_o": "tgc_o"}
-
-    bus_map_write = {"clk_i": "i_clk", 
-                     "rst_i": "i_reset_sync",
-                     "adr_o": "i_slave_write_addr", 
-                     "dat_i": "i_slave_write_data",
-                     "dat_o": "dat_o", 
-                     "we_o": "we_o",
-                     "sel_o": "o_master_write_sel",
-                     "stb_o": "i_slave_write_stb",
-                     "ack_i": "o_slave_write_ack",
-                     "cyc_o": "cyc_o",
-                     "stall_i": "stall_i",
-                     "tga_o": "tga_o",
-                     "tgd_i": "tgd_i",
-                     "tgd_o": "tgd_o",
-                     "tgc_o": "tgc_o"}
+    bus_map       = BUS_MAP_INST
+    bus_map_read  = BUS_MAP_READ
+    bus_map_write = BUS_MAP_WRITE
  
+    if (CHANNELS > 1):
+        bus_map       = channel_bus_map(BUS_MAP_INST, 0)
+        bus_map_read  = channel_bus_map(BUS_MAP_READ, 0)
+        bus_map_write = channel_bus_map(BUS_MAP_WRITE, 0)
+
     vif = wb_standard_master_if(dut, bus_map)
     vif_read = wb_standard_master_if(dut, bus_map_read)
     vif_write = wb_standard_master_if(dut, bus_map_write)
+    channel_vifs = [(wb_standard_master_if(dut, channel_bus_map(BUS_MAP_INST, k)),
+                     wb_standard_master_if(dut, channel_bus_map(BUS_MAP_READ, k)),
+                     wb_standard_master_if(dut, channel_bus_map(BUS_MAP_WRITE, k)))
+                    for k in range(1, CHANNELS)]
 
     # Create a 1000Mhz clock
     clock = Clock(dut.i_clk, 1, units="ns") 
     cocotb.fork(clock.start())  # Start the clock
-    cocotb.fork(initial_reset(vif, vif_read, vif_write, dut))
-    #cocotb.fork(initial_run_test(dut, vif))
-
-    await Timer(5, "US")
\ No newline at end of file
+    # run_test returns once every phase ran, the test lasts as long as its
+    # stimulus (sweeps and long audio files included)
+    await initial_reset(vif, vif_read, vif_write, dut, channel_vifs)
\ No newline at end of file
@@ -0,0 +1,134 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : trace_rerun.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 16:35:48
+# Last modified : 2026/10/18 16:35:48
+# Project Name  : IIR Filter
+# Module Name   : trace_rerun
+# Description   : Runs a test untraced, then again dumping only around failures.
+#
+# Additional Comments:
+#   The first pass runs on --sim with TRACE=off and writes windows.json, the
+#   second pass only runs if there are windows. It runs on the same simulator
+#   with the same test and seed, so the stimulus and the failures repeat.
+#   Windows need $dumpon/$dumpoff and TRACE=window; the cocotb Verilator main
+#   dumps every step, so on verilator the second pass runs with TRACE=full
+#   and windows.json tells where to look. Output goes to --out: windows.json,
+#   window.vcd and the log of each pass.
+#
+#     python trace_rerun.py --test iir_filter_reg_test --seed 7
+#################################################################################
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+SIM_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FULL_TRACE_SIMS = ("verilator",)  # no $dumpon/$dumpoff, see TRACE=window in the Makefile
+
+
+def run_pass(name, sim, trace, plusargs, out_dir, seed):
+    """
+       Function: run_pass
+
+       Definition: One make run of the sim directory, logged to
+         <out_dir>/<name>.log. Returns the make exit code.
+
+       Args:
+         name: Pass name, also names its build directory.
+         sim: SIM of the cocotb makefiles.
+         trace: TRACE mode of the Makefile.
+         plusargs: Simulator plusargs.
+         out_dir: Output directory.
+         seed: RANDOM_SEED of cocotb.
+    """
+    command = ["make", "-C", SIM_DIR, "SIM=" + sim, "TRACE=" + trace,
+               "SIM_BUILD=" + os.path.join(out_dir, "sim_build_" + name),
+               "COCOTB_RESULTS_FILE=" + os.path.join(out_dir, name + ".xml"),
+               "PLUSARGS=" + " ".join(plusargs)]
+    env = dict(os.environ)
+    env["RANDOM_SEED"] = str(seed)
+    with open(os.path.join(out_dir, name + ".log"), "w") as log:
+        return subprocess.call(command, stdout=log, stderr=subprocess.STDOUT, env=env)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dump waveforms only around the failures of a test.")
+    parser.add_argument("--test", default="iir_filter_reg_test")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--sim", default=os.environ.get("SIM", "verilator"), help="simulator of both passes")
+    parser.add_argument("--pre-cycles", type=int, default=256)
+    parser.add_argument("--post-cycles", type=int, default=256)
+    parser.add_argument("--out", default=os.path.join(SIM_DIR, "trace_rerun"))
+    args = parser.parse_args(argv)
+
+    out = os.path.abspath(args.out)
+    os.makedirs(out, exist_ok=True)
+    windows_path = os.path.join(out, "windows.json")
+    if (os.path.exists(windows_path)):
+        os.remove(windows_path)
+    plusargs = ["+UVM_TESTNAME=" + args.test,
+                "+TRACE_PRE_CYCLES=%d" % args.pre_cycles,
+                "+TRACE_POST_CYCLES=%d" % args.post_cycles]
+
+    returncode = run_pass("untraced", args.sim, "off", plusargs + ["+TRACE_WINDOWS_OUT=" + windows_path],
+                          out, args.seed)
+    if (not os.path.exists(windows_path)):
+        print("trace_rerun: first pass wrote no windows (make returned %d), see %s" %
+              (returncode, os.path.join(out, "untraced.log")))
+        return 1
+    with open(windows_path, "r") as f:
+        windows = json.load(f)["windows"]
+    if (not windows):
+        print("trace_rerun: no failures or triggers, nothing to dump")
+        return returncode
+
+    traced = sum(stop - start for start, stop in windows)
+    print("trace_rerun: %d windows, %d ns traced" % (len(windows), traced))
+    if (args.sim in FULL_TRACE_SIMS):
+        run_pass("traced", args.sim, "full", plusargs, out, args.seed)
+        print("trace_rerun: %s dumps every step, waveforms of the whole run, windows in %s, see %s" %
+              (args.sim, windows_path, os.path.join(out, "traced.log")))
+        return returncode
+    vcd_path = os.path.join(out, "window.vcd")
+    run_pass("windowed", args.sim, "window",
+             plusargs + ["+TRACE_WINDOWS_IN=" + windows_path, "+TRACE_VCD=" + vcd_path], out, args.seed)
+    print("trace_rerun: waveforms in %s" % vcd_path)
+    return returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : trace_window.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 16:24:05
+# Last modified : 2026/10/18 16:24:05
+# Project Name  : IIR Filter
+# Module Name   : trace_window
+# Description   : Waveform dumping limited to windows around failures.
+#
+# Additional Comments:
+#   Two passes of the same test and seed. The first one runs without tracing
+#   (make TRACE=off) with +TRACE_WINDOWS_OUT=<json>: every scoreboard failure
+#   and every tb_env_config.trace_triggers hit is turned into a window of
+#   trace_pre_cycles before to trace_post_cycles after it. The second one is
+#   built with make TRACE=window and run with +TRACE_WINDOWS_IN=<json>, the
+#   windows toggle IIR_Filter_TOP.r_trace_on, which drives $dumpon/$dumpoff.
+#   trace_rerun.py runs both passes. Output times are kept in a ring of
+#   scoreboard_depth+1 samples, the most an observed sample can wait in the
+#   scoreboard, and scoreboard failures are marked as they are found.
+#################################################################################
+import json
+import numpy as np
+import cocotb
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
+from uvm.base import *
+from uvm.comps import *
+from uvm.macros import *
+
+
+def merge_windows(marks, pre_ns, post_ns):
+    """
+       Function: merge_windows
+
+       Definition: Sorted, non overlapping [start, stop] windows in ns
+         covering pre_ns before to post_ns after every mark.
+
+       Args:
+         marks: Times in ns.
+         pre_ns: Time traced before each mark.
+         post_ns: Time traced after each mark.
+    """
+    windows = []
+    for t in sorted(marks):
+        start, stop = max(int(t - pre_ns), 0), int(t + post_ns)
+        if (windows and start <= windows[-1][1]):
+            windows[-1][1] = max(windows[-1][1], stop)
+        else:
+            windows.append([start, stop])
+    return windows
+
+
+class trace_window(UVMSubscriber):
+    """
+       Class: Trace Window
+
+       Definition: Records the time of every UUT output sample to place
+         windows around failures, or replays saved windows on r_trace_on.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Component constructor.
+
+           Args:
+             name: This component's name.
+             parent: Parent component.
+        """
+        self.cfg        = None  # tb_env_config, set by the environment
+        self.scoreboard = None  # scoreboard_stream, set by the environment
+        self.times      = None  # ring of the ns of the last output samples, see build_phase
+        self.num_times  = 0     # output samples time stamped
+        self.num_marked = 0     # scoreboard failures already marked
+        self.marks      = []    # (ns, reason)
+        self.windows    = None  # windows replayed, from cfg.trace_windows_in
+        self.tag        = "trace_window" + name
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        """
+           Function: build_phase
+
+           Definition: Sizes the ring of output times and loads the windows
+             to replay.
+
+           Args:
+             phase: build_phase
+        """
+        self.times = np.zeros(self.cfg.scoreboard_depth + 1)
+        if (self.cfg.trace_windows_in is not None):
+            with open(self.cfg.trace_windows_in, "r") as f:
+                self.windows = json.load(f)["windows"]
+
+
+    def write(self, t):
+        """
+           Function: write
+
+           Definition: Time stamps one output sample and evaluates the user
+             triggers on it.
+
+           Args:
+             t: wb_standard_master_seq (Sequence Item)
+        """
+        if (self.cfg.trace_windows_out is None):
+            return
+        now = get_sim_time("ns")
+        self.times[self.num_times % self.times.size] = now
+        self.num_times += 1
+        self.mark_failures()
+        for trigger in self.cfg.trace_triggers:
+            if (trigger(t)):
+                self.marks.append((now, getattr(trigger, "__name__", "trigger")))
+
+
+    def mark_failures(self):
+        """
+           Function: mark_failures
+
+           Definition: Marks the new scoreboard failures at the time of their
+             observed sample, while it is still in the ring. A failure whose
+             sample is not time stamped yet waits for the next call.
+        """
+        if (self.scoreboard is None):
+            return
+        failures = self.scoreboard.checker.failures
+        while (self.num_marked < len(failures)):
+            failure = failures[self.num_marked]
+            index   = failure["observed_index"]
+            if (index >= self.num_times):
+                return
+            if (index >= self.num_times - self.times.size):
+                self.marks.append((float(self.times[index % self.times.size]),
+                                   "mismatch at sample %d" % failure["index"]))
+            else:
+                uvm_warning(self.tag, sv.sformatf("Time of mismatch at sample %0d is no longer kept",
+                                                  failure["index"]))
+            self.num_marked += 1
+
+
+    async def run_phase(self, phase):
+        """
+           Function: run_phase
+
+           Definition: Turns the dump on for each window.
+
+           Args:
+             phase: run_phase
+        """
+        if (not self.windows):
+            return
+        if (not hasattr(cocotb.top, "r_trace_on")):
+            uvm_warning(self.tag, "IIR_Filter_TOP has no r_trace_on, build with make TRACE=window")
+            return
+        enable = cocotb.top.r_trace_on
+        for start, stop in self.windows:
+            now = get_sim_time("ns")
+            if (start > now):
+                await Timer(start - now, "ns")
+            enable.value = 1
+            await Timer(max(stop - max(start, now), 1), "ns")
+            enable.value = 0
+        uvm_info(self.tag, sv.sformatf("%0d trace windows done", len(self.windows)), UVM_LOW)
+
+
+    def report_phase(self, phase):
+        """
+           Function: report_phase
+
+           Definition: Writes the windows around the scoreboard failures and
+             trigger hits. Runs after the scoreboard check_phase.
+
+           Args:
+             phase: report_phase
+        """
+        if (self.cfg.trace_windows_out is None):
+            return
+        self.mark_failures()
+        marks  = self.marks
+        period = self.cfg.clock_period_ns
+        windows = merge_windows([m[0] for m in marks], self.cfg.trace_pre_cycles * period,
+                                self.cfg.trace_post_cycles * period)
+        with open(self.cfg.trace_windows_out, "w") as f:
+            json.dump({"clock_period_ns": period,
+                       "pre_cycles"     : self.cfg.trace_pre_cycles,
+                       "post_cycles"    : self.cfg.trace_post_cycles,
+                       "marks"          : [{"time_ns": t, "reason": r} for t, r in sorted(marks)],
+                       "windows"        : windows}, f, indent=1)
+        uvm_info(self.tag, sv.sformatf("%0d marks, %0d trace windows written to %s",
+            len(marks), len(windows), self.cfg.trace_windows_out), UVM_LOW)
+
+
+uvm_component_utils(trace_window)
@@ -0,0 +1,203 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : transaction_file.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 17:31:07
+# Last modified : 2026/10/18 17:31:07
+# Project Name  : IIR Filter
+# Module Name   : transaction_file
+# Description   : Fixed width binary transaction files.
+#
+# Additional Comments:
+#   A 64 byte header (magic, version, record size, record count) followed by
+#   RECORD_DTYPE records. The writer collects records as tuples, copies them
+#   into a memory map of the file a block at a time and grows the file a
+#   chunk at a time; the count in the header is updated on every grow and on
+#   close, so a file cut short by a crash still reads up to its last chunk. load_transactions() maps the records back as a NumPy
+#   structured array without copying them:
+#
+#     t = load_transactions("tb_env.mem_read_agent.trn")
+#     t["data_in"][t["time_ps"] > 10000]
+#################################################################################
+import os
+import struct
+import numpy as np
+
+MAGIC       = b"WBTRANS\0"
+VERSION     = 1
+HEADER      = struct.Struct("<8sIIQ")
+HEADER_SIZE = 64
+
+RECORD_DTYPE = np.dtype([("time_ps",           "<u8"),
+                         ("address",           "<u4"),
+                         ("data_out",          "<u4"),
+                         ("data_in",           "<u4"),
+                         ("transmit_delay",    "<u2"),
+                         ("select",            "u1"),
+                         ("address_tag",       "u1"),
+                         ("data_tag",          "u1"),
+                         ("cycle_tag",         "u1"),
+                         ("response_data_tag", "u1"),
+                         ("acknowledge",       "u1"),
+                         ("stall",             "u1"),
+                         ("strobe",            "u1"),
+                         ("cycle",             "u1"),
+                         ("pad",               "u1")])
+
+
+class transaction_file():
+    """
+       Class: Transaction File
+
+       Definition: Appends RECORD_DTYPE records to a memory mapped file.
+    """
+
+    def __init__(self, path, chunk_records=65536, block_records=4096):
+        """
+           Function: new
+
+           Definition: Creates (truncates) the file.
+
+           Args:
+             path: File name.
+             chunk_records: Records the file grows by when full.
+             block_records: Records collected before copying them to the map.
+        """
+        self.path          = path
+        self.chunk_records = chunk_records
+        self.block_records = block_records
+        self.block         = []    # records not copied to the map yet
+        self.count         = 0     # records in the map
+        self.capacity      = 0     # records the file currently holds
+        self.records       = None  # np.memmap of the record area
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, 0).ljust(HEADER_SIZE, b"\0"))
+        self.grow()
+
+
+    def grow(self):
+        """
+           Function: grow
+
+           Definition: Extends the file by one chunk and maps it again.
+        """
+        if (self.records is not None):
+            self.records.flush()
+            del self.records
+        self.capacity += self.chunk_records
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER_SIZE + self.capacity * RECORD_DTYPE.itemsize)
+        self.write_count()
+        self.records = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r+",
+                                 offset=HEADER_SIZE, shape=(self.capacity,))
+
+
+    def write_count(self):
+        with open(self.path, "r+b") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, self.count))
+
+
+    def append(self, time_ps, tr):
+        """
+           Function: append
+
+           Definition: Collects one transaction. Fields tr does not have are
+             recorded as 0.
+
+           Args:
+             time_ps: Simulation time of the transaction.
+             tr: wb_standard_master_transfer or sequence item.
+        """
+        get = getattr
+        self.block.append((time_ps, get(tr, "address", 0), get(tr, "data_out", 0), get(tr, "data_in", 0),
+                           get(tr, "transmit_delay", 0), get(tr, "select", 0), get(tr, "address_tag", 0),
+                           get(tr, "data_tag", 0), get(tr, "cycle_tag", 0), get(tr, "response_data_tag", 0),
+                           get(tr, "acknowledge", 0), get(tr, "stall", 0), get(tr, "strobe", 0),
+                           int(get(tr, "cycle", 0)), 0))  # the monitors store the cyc_o handle
+        if (len(self.block) == self.block_records):
+            self.flush()
+
+
+    def flush(self):
+        """
+           Function: flush
+
+           Definition: Copies the collected records to the map.
+        """
+        block = np.array(self.block, dtype=RECORD_DTYPE)
+        self.block = []
+        written = 0
+        while (written < block.size):
+            if (self.count == self.capacity):
+                self.grow()
+            n = min(block.size - written, self.capacity - self.count)
+            self.records[self.count:self.count + n] = block[written:written + n]
+            self.count += n
+            written += n
+
+
+    def close(self):
+        """
+           Function: close
+
+           Definition: Drops the unused part of the last chunk and writes the
+             final count.
+        """
+        if (self.records is None):
+            return
+        self.flush()
+        self.records.flush()
+        del self.records
+        self.records = None
+        with open(self.path, "r+b") as f:
+            f.truncate(HEADER_SIZE + self.count * RECORD_DTYPE.itemsize)
+        self.write_count()
+
+
+def load_transactions(path):
+    """
+       Function: load_transactions
+
+       Definition: Read only structured array view of the records of a
+         transaction file.
+
+       Args:
+         path: File written by transaction_file.
+    """
+    with open(path, "rb") as f:
+        magic, version, size, count = HEADER.unpack(f.read(HEADER.size))
+    if (magic != MAGIC or version != VERSION or size != RECORD_DTYPE.itemsize):
+        raise ValueError("%s is not a version %d transaction file" % (path, VERSION))
+    if (count == 0):
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
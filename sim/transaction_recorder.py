@@ -0,0 +1,119 @@
+#################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2020, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################
+# File name     : transaction_recorder.py
+# Author        : Jose R Garcia
+# Created       : 2026/10/18 17:40:16
+# Last modified : 2026/10/18 17:40:16
+# Project Name  : IIR Filter
+# Module Name   : transaction_recorder
+# Description   : Records an agent's transactions to a binary file.
+#
+# Additional Comments:
+#   Replaces UVM transaction recording (recording_detail UVM_FULL). One
+#   fixed width record per transaction, see transaction_file.py for the
+#   format and load_transactions() to read it back.
+#################################################################################
+import os
+from cocotb.utils import get_sim_time
+from uvm.base import *
+from uvm.comps import *
+from uvm.macros import *
+from transaction_file import *
+
+
+class transaction_recorder(UVMSubscriber):
+    """
+       Class: Transaction Recorder
+
+       Definition: Appends every transaction written to its analysis export
+         to <cfg.record_dir>/<file_name>.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Recorder constructor.
+
+           Args:
+             name: This component's name.
+             parent: Parent component.
+        """
+        self.cfg       = None  # tb_env_config, set by the environment
+        self.file_name = name + ".trn"
+        self.file      = None  # transaction_file
+        self.tag       = "transaction_recorder" + name
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        """
+           Function: build_phase
+
+           Definition: Creates the file.
+
+           Args:
+             phase: build_phase
+        """
+        os.makedirs(self.cfg.record_dir, exist_ok=True)
+        self.file = transaction_file(os.path.join(self.cfg.record_dir, self.file_name))
+
+
+    def write(self, t):
+        """
+           Function: write
+
+           Definition: Records one transaction.
+
+           Args:
+             t: wb_standard_master_seq or wb_standard_master_transfer
+        """
+        self.file.append(int(get_sim_time("ps")), t)
+
+
+    def extract_phase(self, phase):
+        """
+           Function: extract_phase
+
+           Definition: Completes the file.
+
+           Args:
+             phase: extract_phase
+        """
+        self.file.close()
+        uvm_info(self.tag, sv.sformatf("%0d transactions recorded to %s",
+            self.file.count, self.file.path), UVM_LOW)
+
+
+uvm_component_utils(transaction_recorder)